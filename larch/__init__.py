@@ -31,6 +31,7 @@ from .omx import OMX
 from .data_services.dbf.dbf_reader import DBF
 
 from .model import Model
+from .model.batch import estimate_many
 from .dataframes import DataFrames
 
 from .examples import example
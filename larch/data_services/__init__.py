@@ -6,4 +6,5 @@ from .pod import Pod
 from .podlist import Pods
 from .service import DataService
 from .h5 import *
+from .npy import NpyPod, NpyPodCO, NpyPodCA
 from .general import SystematicAlternatives
\ No newline at end of file
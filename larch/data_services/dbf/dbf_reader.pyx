@@ -188,6 +188,22 @@ cdef void push_record_data(FILE* fileobj, dbfhrecord* dbf_header, int rownum, ch
 
 from libc.stdlib cimport malloc, free, atoi, atoll, atof
 from libc.stdio cimport sprintf
+from libc.string cimport memcpy
+
+
+cdef inline int64_t parse_dbf_int64(const char* record, int fieldlen, int fieldoffset) nogil:
+	# Fields are at most 255 bytes, so a stack buffer avoids a malloc per value.
+	cdef char s[256]
+	memcpy(s, record+fieldoffset, fieldlen)
+	s[fieldlen] = 0
+	return atoll(s)
+
+
+cdef inline double parse_dbf_double(const char* record, int fieldlen, int fieldoffset) nogil:
+	cdef char s[256]
+	memcpy(s, record+fieldoffset, fieldlen)
+	s[fieldlen] = 0
+	return atof(s)
 
 cdef int get_dbf_int(dbfhrecord* dbf_header, int fnum, char* buffer):
 	cdef char* s
@@ -275,7 +291,9 @@ cdef class DBF:
 	cdef bytes _filename
 	cdef object _tempdir
 	cdef char* _filename_c
-	cdef void* _read_buffer
+	cdef object _mmap
+	cdef const unsigned char[:] _mapped
+	cdef const char* _records
 
 	def __init__(self, filename, make_copy=False):
 		"""
@@ -312,11 +330,55 @@ cdef class DBF:
 		#self._file_ptr = fopen( filename, 'r' )
 		self._filename = filename
 		self._filename_c = self._filename
-		self._read_buffer = <void*>malloc(self._header.recln)
+
+		# Records are parsed directly from a read-only memory map of the file,
+		# so loading data needs no per-row seek and read calls.  The map holds
+		# the file open until `close` is called (or the DBF is used as a
+		# context manager), so use `make_copy` if the original must remain
+		# free for other processes.
+		import mmap
+		with open(filename, 'rb') as f:
+			self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		self._mapped = self._mmap
+		self._records = (<const char*>&self._mapped[0]) + 32*(self._header.nflds+1)+1
+
+	def close(self):
+		"""
+		Release the memory map of the file.
+
+		After closing, no more data can be loaded from this DBF.  Closing
+		an already closed DBF has no effect.
+		"""
+		self._records = NULL
+		self._mapped = None
+		if self._mmap is not None:
+			self._mmap.close()
+			self._mmap = None
+
+	@property
+	def closed(self):
+		return self._mmap is None
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
 
 	def __del__(self):
-		#fclose(self._file_ptr)
-		free(self._read_buffer)
+		self.close()
+
+	cdef inline const char* _record(self, int64_t rownum) nogil:
+		return self._records + rownum*self._header.recln
+
+	def _check_row_range(self, int startrow, int stoprow):
+		cdef int64_t end = 32*(self._header.nflds+1)+1 + (<int64_t>stoprow)*self._header.recln
+		if self._records == NULL:
+			raise ValueError('I/O operation on closed DBF')
+		if startrow < 0 or startrow > stoprow:
+			raise IndexError(f'invalid row range {startrow} to {stoprow}')
+		if end > self._mapped.shape[0]:
+			raise IndexError(f'row {stoprow} is beyond the end of the file')
 
 	def __repr__(self):
 		s = []
@@ -381,7 +443,7 @@ cdef class DBF:
 				result.append(self._header.fname[i].decode())
 		return result
 
-	cdef void _get_int_array(self, int fieldnum, int startrow, int stoprow, int[:] arr):
+	cdef void _get_int_array(self, int fieldnum, int startrow, int stoprow, int64_t[:] arr):
 		"""
 		Extract an int64 array of values from the DBF file.
 
@@ -398,14 +460,13 @@ cdef class DBF:
 		ndarray
 			dtype is int64
 		"""
-		cdef FILE* local_file_handle
 		cdef int i
-		local_file_handle = fopen( self._filename_c, 'r' )
-		for i,row in enumerate(range(startrow, stoprow)):
-			pull_record_data(local_file_handle, &self._header, row, <char*>self._read_buffer)
-			q = get_dbf_int64(&self._header, fieldnum, <char*>self._read_buffer)
-			arr[i] = q
-		fclose(local_file_handle)
+		for i in range(stoprow-startrow):
+			arr[i] = parse_dbf_int64(
+				self._record(startrow+i),
+				<unsigned char>self._header.flen[fieldnum],
+				self._header.fdisp[fieldnum],
+			)
 
 	def get_int_array(self, fieldnum, startrow, stoprow):
 		"""
@@ -425,6 +486,7 @@ cdef class DBF:
 			dtype is int64
 		"""
 		import numpy
+		self._check_row_range(startrow, stoprow)
 		arr = numpy.zeros([stoprow-startrow], dtype=numpy.int64)
 		self._get_int_array(fieldnum, startrow, stoprow, arr)
 		return arr
@@ -432,72 +494,69 @@ cdef class DBF:
 	@cython.boundscheck(False)
 	cdef void _load_dataframe_arr_int(self, int startrow, int stoprow, int64_t[:,:] arr):
 		cdef int i=0
-		cdef int row=startrow
 		cdef int nrows = stoprow - startrow
 		cdef int j, k
-		cdef FILE* local_file_handle
-		cdef void* local_read_buffer
-		with nogil, parallel():
-			local_file_handle = fopen( self._filename_c, 'r' )
-			local_read_buffer = <void*>malloc(self._header.recln)
+		cdef const char* record
+		with nogil:
 			for i in prange(nrows):
-				row = startrow+i
-				pull_record_data(local_file_handle, &self._header, row, <char*>local_read_buffer)
+				record = self._record(startrow+i)
 				k = 0
 				for j in range(self._header.nflds):
 					if self._header.fctype[j] == CType.INTEGER:
-						arr[i,k] = get_dbf_int64(&self._header, j, <char*>local_read_buffer)
+						arr[i,k] = parse_dbf_int64(record, <unsigned char>self._header.flen[j], self._header.fdisp[j])
 						k = k + 1
-			free(local_read_buffer)
-			fclose(local_file_handle)
 
 	@cython.boundscheck(False)
 	cdef void _load_dataframe_arr_float(self, int startrow, int stoprow, double[:,:] arr):
 		cdef int i=0
-		cdef int row=startrow
 		cdef int nrows = stoprow - startrow
-		cdef int j, k, xx1, xx2
-		cdef FILE* local_file_handle
-		cdef void* local_read_buffer
-		cdef double xx3
-		with nogil, parallel():
-			local_file_handle = fopen( self._filename_c, 'r' )
-			local_read_buffer = <void*>malloc(self._header.recln)
+		cdef int j, k
+		cdef const char* record
+		with nogil:
 			for i in prange(nrows):
-				row = startrow+i
-				pull_record_data(local_file_handle, &self._header, row, <char*>local_read_buffer)
+				record = self._record(startrow+i)
 				k = 0
 				for j in range(self._header.nflds):
 					if self._header.fctype[j] == CType.DOUBLE:
-						arr[i,k] = get_dbf_double_v2(self._header.flen[j], self._header.fdisp[j], <char*>local_read_buffer)
+						arr[i,k] = parse_dbf_double(record, <unsigned char>self._header.flen[j], self._header.fdisp[j])
 						k = k + 1
-			free(local_read_buffer)
-			fclose(local_file_handle)
+
+	@cython.boundscheck(False)
+	cdef void _load_numeric_columns(self, int startrow, int stoprow, int64_t[:,:] ints, double[:,:] floats) nogil:
+		# Same as the two loaders above, but fills one contiguous row per field
+		# in a single pass over the records, ready to write column by column.
+		cdef int i=0
+		cdef int nrows = stoprow - startrow
+		cdef int j, ki, kf
+		cdef const char* record
+		for i in prange(nrows):
+			record = self._record(startrow+i)
+			ki = 0
+			kf = 0
+			for j in range(self._header.nflds):
+				if self._header.fctype[j] == CType.INTEGER:
+					ints[ki,i] = parse_dbf_int64(record, <unsigned char>self._header.flen[j], self._header.fdisp[j])
+					ki = ki + 1
+				elif self._header.fctype[j] == CType.DOUBLE:
+					floats[kf,i] = parse_dbf_double(record, <unsigned char>self._header.flen[j], self._header.fdisp[j])
+					kf = kf + 1
 
 	@cython.boundscheck(False)
 	cdef void _load_dataframe_arr_string(self, int startrow, int stoprow, unicode[:,:] arr, bint strip_whitespace=False):
 		cdef int i=0
-		cdef int row=startrow
 		cdef int nrows = stoprow - startrow
-		cdef int j, k, xx1, xx2
-		cdef FILE* local_file_handle
-		cdef void* local_read_buffer
-		cdef double xx3
+		cdef int j, k
+		cdef char* record
 		cdef unicode s
 
-		local_file_handle = fopen( self._filename_c, 'r' )
-		local_read_buffer = <void*>malloc(self._header.recln)
 		for i in range(nrows):
-			row = startrow+i
-			pull_record_data(local_file_handle, &self._header, row, <char*>local_read_buffer)
+			record = <char*>self._record(startrow+i)
 			k = 0
 			for j in range(self._header.nflds):
 				if self._header.fctype[j] == CType.STRING:
-					s = get_dbf_string_v2(self._header.flen[j], self._header.fdisp[j], <char*>local_read_buffer, strip_whitespace)
+					s = get_dbf_string_v2(<unsigned char>self._header.flen[j], self._header.fdisp[j], record, strip_whitespace)
 					arr[i,k] = s
 					k = k + 1
-		free(local_read_buffer)
-		fclose(local_file_handle)
 
 	# @cython.boundscheck(False)
 	# cdef void _write_arr_float(self, int startrow, int stoprow, int fieldnum, double[:] arr):
@@ -552,6 +611,7 @@ cdef class DBF:
 			stoprow=self._header.nrecs
 		if startrow<0 or startrow>self._header.nrecs:
 			raise IndexError(f'startrow {startrow} out of range for file with {self._header.nrecs} rows')
+		self._check_row_range(startrow, stoprow)
 		if fields_integer:
 			df = pandas.DataFrame(0, index=numpy.arange(startrow, stoprow), columns=fields_integer, dtype=numpy.int64 )
 			self._load_dataframe_arr_int(startrow, stoprow, df.values)
@@ -631,6 +691,50 @@ cdef class DBF:
 			start += chunksize
 			stop += chunksize
 
+	def load_numeric_columns(self, start=0, stop=-1):
+		"""
+		Load the integer and float fields from the DBF file as arrays.
+
+		Unlike `load_dataframe`, this does not build a DataFrame; each field
+		is parsed straight from the memory-mapped records into its own
+		contiguous array.  The parsing runs without holding the GIL, so it
+		can overlap with other work in another thread.
+
+		Parameters
+		----------
+		start : int, default 0
+			The index of the row number to begin loading data.
+		stop : int, default -1
+			One past the index of the row number to stop loading data.
+			Negative or out-of-range values are interpreted as an instruction
+			to read to the end of the file.
+
+		Returns
+		-------
+		dict
+			Maps field names to 1-d arrays, int64 for integer fields and
+			float64 for float fields, in the order of the fields in the file.
+		"""
+		import numpy
+		cdef int startrow = start
+		cdef int stoprow = stop
+		if stoprow<0 or stoprow>self._header.nrecs:
+			stoprow=self._header.nrecs
+		if startrow<0 or startrow>self._header.nrecs:
+			raise IndexError(f'startrow {startrow} out of range for file with {self._header.nrecs} rows')
+		self._check_row_range(startrow, stoprow)
+		fields_integer = self.fieldnames_integer()
+		fields_float = self.fieldnames_float()
+		ints = numpy.empty([len(fields_integer), stoprow-startrow], dtype=numpy.int64)
+		floats = numpy.empty([len(fields_float), stoprow-startrow], dtype=numpy.float64)
+		cdef int64_t[:,:] ints_ = ints
+		cdef double[:,:] floats_ = floats
+		with nogil:
+			self._load_numeric_columns(startrow, stoprow, ints_, floats_)
+		result = dict(zip(fields_integer, ints))
+		result.update(zip(fields_float, floats))
+		return {k: result[k] for k in self.fieldnames() if k in result}
+
 	@property
 	def filename(self):
 		return self._filename.decode()
@@ -646,8 +750,38 @@ cdef class DBF:
 			warnings.warn(f"changing the number of records from {self._header.nrecs} to {value} is dangerous and may cause program instability")
 			self._header.nrecs = int(value)
 
-	def convert_to_hdf5(self, h5filename=None, groupnode=None, show_progress=True, identify=None, **kwargs):
+	def convert_to_hdf5(self, h5filename=None, groupnode=None, show_progress=True, identify=None, chunksize=100000, **kwargs):
+		"""
+		Convert the numeric fields of this DBF file into an H5Pod.
+
+		Parsing and writing are pipelined: while one chunk of rows is being
+		compressed and written to the HDF5 file, the next chunk is parsed
+		from the memory-mapped DBF in a background thread.
+
+		Parameters
+		----------
+		h5filename : str, optional
+			The HDF5 file to write.  If not given, a file with the same name
+			as the DBF file and a '.h5d' extension is used, and if that file
+			already exists and is newer than the DBF file, it is opened instead.
+		groupnode : str, optional
+			The group node within the HDF5 file to write into.
+		show_progress : bool, default True
+			Show a progress bar.
+		identify : str, optional
+			A label for the progress bar.
+		chunksize : int, default 100000
+			Number of rows to parse and write at a time.
+
+		Other keyword arguments are passed to the H5Pod constructor.
+
+		Returns
+		-------
+		H5Pod
+			Opened in read-only mode.
+		"""
 		from ..h5.h5pod import H5Pod
+		from concurrent.futures import ThreadPoolExecutor
 		import numpy
 		import os
 
@@ -681,17 +815,23 @@ cdef class DBF:
 			pod.add_blank(fi, dtype=numpy.int64)
 		for ff in self.fieldnames_float():
 			pod.add_blank(ff, dtype=numpy.float64)
+		nodes = {fx: pod.__getattr__(fx) for fx in self.fieldnames_integer()+self.fieldnames_float()}
+		slices = [
+			slice(start, min(start+chunksize, self._header.nrecs))
+			for start in range(0, self._header.nrecs, chunksize)
+		]
 		from tqdm import tqdm
-		with tqdm(total=self._header.nrecs, unit='rows') as pbar:
+		with tqdm(total=self._header.nrecs, unit='rows', disable=not show_progress) as pbar, \
+				ThreadPoolExecutor(max_workers=1) as parser:
 			pbar.set_description(identify or self.filename)
-			for d,slc in self.load_dataframe_iter(return_slice=True):
-				if show_progress:
-					pbar.update(slc.stop-slc.start)
-					#print(f"\rDBF Reading {100.0*slc.stop/self._header.nrecs:.2f}% Complete")
-				for fi in self.fieldnames_integer():
-					pod.__getattr__(fi)[slc] = d.loc[:,fi].values
-				for ff in self.fieldnames_float():
-					pod.__getattr__(ff)[slc] = d.loc[:,ff].values
+			pending = parser.submit(self.load_numeric_columns, slices[0].start, slices[0].stop) if slices else None
+			for k, slc in enumerate(slices):
+				columns = pending.result()
+				if k+1 < len(slices):
+					pending = parser.submit(self.load_numeric_columns, slices[k+1].start, slices[k+1].stop)
+				for fx, values in columns.items():
+					nodes[fx][slc] = values
+				pbar.update(slc.stop-slc.start)
 		return pod.change_mode('r')
 
 
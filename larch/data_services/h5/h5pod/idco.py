@@ -336,9 +336,10 @@ class H5PodCO(H5Pod):
 			#rowarr = numpy.full_like(clarr, rowindexes, dtype=int)
 			raise NotImplementedError
 
+		plucked = other_omx.pluck(rowarr, colarr, list(names))
 		for matrix_page in names:
 			self.add_array(names[matrix_page],
-									 other_omx[matrix_page][rowarr, colarr],
+									 plucked[matrix_page],
 									 original_source=other_omx.filename,
 									 overwrite=overwrite)
 
@@ -49,13 +49,22 @@ class H5PodRC(H5PodCO):
 		result = numpy.zeros( [selector_len_for(slice_, self.shape[0]), *self.shape[1:], len(names)], dtype=dtype)
 
 		for i, cmd in enumerate(names):
-			temp = self._evaluate_single_item(cmd, None)
-			if slice_ is not None:
-				result[...,i] = temp[self.rowindexes[slice_],self.colindexes[slice_]]
-			else:
-				result[...,i] = temp[self.rowindexes,self.colindexes]
+			result[...,i] = self._rc_values(cmd, slice_)
 		return result
 
+	def _rc_values(self, name, selector=None):
+		"""Values of a named matrix or expression at the row-col coordinates of each case."""
+		if selector is not None:
+			rowarr, colarr = self.rowindexes[selector], self.colindexes[selector]
+		else:
+			rowarr, colarr = self.rowindexes, self.colindexes
+		if name in self._groupnode._v_children:
+			# read only the needed row blocks of a natural matrix
+			from ....omx import pluck_rc
+			return pluck_rc({name: self._groupnode._v_children[name]}, rowarr, colarr)[name]
+		temp = self._evaluate_single_item(name, None)
+		return temp[rowarr, colarr]
+
 	def _load_into(self, names, slc, result):
 		if len(self._altcodes) == 0:
 			raise ValueError("alternatives vector not set")
@@ -99,11 +108,7 @@ class H5PodRC(H5PodCO):
 		from ...general import _sqz_same
 		_sqz_same(result.shape, [selector_len_for(selector, self.shape[0]), *self.shape[1:]])
 
-		temp = self._evaluate_single_item(name, None)
-		if selector is not None:
-			result[:] = temp[self.rowindexes[selector], self.colindexes[selector]]
-		else:
-			result[:] = temp[self.rowindexes, self.colindexes]
+		result[:] = self._rc_values(name, selector)
 		return result
 
 	def as_idca(self):
@@ -123,11 +128,7 @@ class H5PodRCasCA(H5PodRC):
 		from ...general import _sqz_same
 		_sqz_same(result.shape, [selector_len_for(selector, self.shape[0]), *self.shape[1:]])
 
-		temp = self._evaluate_single_item(name, None)
-		if selector is not None:
-			result[:,:] = temp[self.rowindexes[selector], self.colindexes[selector]][:,None]
-		else:
-			result[:,:] = temp[self.rowindexes, self.colindexes][:,None]
+		result[:,:] = self._rc_values(name, selector)[:,None]
 		return result
 
 	@property
@@ -0,0 +1,2 @@
+
+from .npypod import NpyPod, NpyPodCO, NpyPodCA, IncompatibleShape
@@ -0,0 +1,632 @@
+import os
+import json
+import numpy
+import warnings
+from pathlib import Path
+from ...util import Dict
+from ...util.aster import asterize
+from ...util.text_manip import truncate_path_for_display
+from .. import _reserved_names_
+from ..pod import Pod
+from ..general import _sqz_same, _sqz_same_trailing_neg_ok, selector_len_for
+from ..exceptions import NoKnownShape
+
+_ATTRS_FILENAME_ = '_ATTRS_.json'
+
+
+class IncompatibleShape(ValueError):
+	pass
+
+
+class NpyPod(Pod):
+	"""
+	A directory of raw `.npy` files, each holding one data variable.
+
+	Every variable is opened lazily with :func:`numpy.load` in read-only
+	memory-mapped mode, so loading a slice of cases is a plain copy out of
+	the operating system page cache, and several processes reading the
+	same directory share the same physical memory.  Requesting a natural
+	variable name with a slice selector from :meth:`get_data_item` returns
+	a view on the memory map without copying at all.
+
+	Parameters
+	----------
+	directory : str or Path
+		The directory holding the `.npy` files.
+	mode : {'r', 'a', 'w'}, default 'a'
+		File mode. In 'r' mode the directory must already exist and no
+		variables can be added. In 'a' mode the directory is created if
+		it does not exist. In 'w' mode any existing `.npy` files in the
+		directory are removed.
+	ident : str, optional
+		An identifier for this pod.
+	shape : tuple, optional
+		Set the shape of the pod. Must be compatible with any
+		existing data.
+	"""
+
+	def __init__(self, directory=None, mode='a', *, ident=None, shape=None):
+
+		super().__init__(ident=ident)
+
+		if isinstance(directory, NpyPod):
+			# Copy / Re-Class contructor
+			x = directory
+			self._directory = x._directory
+			self._mode = x._mode
+			self._mmaps = x._mmaps
+			self._attrs = x._attrs
+			return
+
+		if directory is None:
+			from ...util.temporaryfile import TemporaryDirectory
+			directory = TemporaryDirectory(common=False)
+			mode = 'w'
+
+		self._directory = Path(os.path.expanduser(os.fspath(directory)))
+		self._mode = mode
+		self._mmaps = {}
+
+		if mode == 'r':
+			if not self._directory.is_dir():
+				raise FileNotFoundError(f"no such directory: {self._directory}")
+		elif mode in ('a', 'w'):
+			self._directory.mkdir(parents=True, exist_ok=True)
+			if mode == 'w':
+				for f in self._directory.glob('*.npy'):
+					f.unlink()
+				attrs_file = self._directory / _ATTRS_FILENAME_
+				if attrs_file.exists():
+					attrs_file.unlink()
+		else:
+			raise ValueError(f"mode must be one of 'r', 'a', 'w', not {mode!r}")
+
+		self._attrs = self._read_attrs()
+
+		if shape is not None:
+			self.shape = shape
+
+	def _read_attrs(self):
+		attrs_file = self._directory / _ATTRS_FILENAME_
+		if attrs_file.exists():
+			with open(attrs_file, 'r') as f:
+				return json.load(f)
+		return {'SHAPE': None, 'VARS': {}}
+
+	def _write_attrs(self):
+		if self._mode == 'r':
+			raise PermissionError("NpyPod is read-only")
+		attrs_file = self._directory / _ATTRS_FILENAME_
+		temp_file = self._directory / (_ATTRS_FILENAME_ + '.tmp')
+		with open(temp_file, 'w') as f:
+			json.dump(self._attrs, f, indent=1)
+		os.replace(temp_file, attrs_file)
+
+	def _path_for(self, name):
+		return self._directory / f"{name}.npy"
+
+	def _mmap(self, name):
+		"""The read-only memory map for a named variable."""
+		try:
+			return self._mmaps[name]
+		except KeyError:
+			pass
+		path = self._path_for(name)
+		if not path.exists():
+			raise KeyError(f"{name} not found")
+		self._mmaps[name] = numpy.load(path, mmap_mode='r')
+		return self._mmaps[name]
+
+	@property
+	def podtype(self):
+		return ''
+
+	@property
+	def filename(self):
+		"""The directory containing the data (read-only)"""
+		return os.fspath(self._directory)
+
+	@property
+	def filemode(self):
+		return self._mode
+
+	def names(self):
+		return sorted(
+			f.stem for f in self._directory.glob('*.npy')
+			if f.stem not in _reserved_names_
+		)
+
+	def __contains__(self, item):
+		if not isinstance(item, str):
+			return False
+		return self._path_for(item).exists()
+
+	def __dir__(self):
+		x = list(super().__dir__())
+		x.extend(self.names())
+		return x
+
+	def __getattr__(self, item):
+		if item.startswith('_'):
+			raise AttributeError(item)
+		try:
+			return self._mmap(item)
+		except KeyError:
+			raise AttributeError(item)
+
+	def dtype_of(self, name):
+		"""dtype of raw data for a particular named data item."""
+		return self._mmap(name).dtype
+
+	def get_data_dictionary(self, name):
+		"""dictionary of raw data for a particular named data item."""
+		if name not in self:
+			raise KeyError(f"{name} not found")
+		pairs = self._attrs['VARS'].get(name, {}).get('DICTIONARY', None)
+		if pairs is None:
+			raise KeyError(f"no dictionary for {name}")
+		return Dict((k, v) for k, v in pairs)
+
+	@property
+	def shape(self):
+		"""The shape of the pod."""
+		if self._attrs['SHAPE'] is not None:
+			return tuple(self._attrs['SHAPE'])
+		for n in self.names():
+			return tuple(self._mmap(n).shape)
+		raise NoKnownShape()
+
+	@shape.setter
+	def shape(self, x):
+		x = tuple(int(i) for i in x)
+		for n in self.names():
+			if tuple(self._mmap(n).shape) != x:
+				raise IncompatibleShape(f'this pod has data with shape {self._mmap(n).shape} but you want to set {x}')
+		self._attrs['SHAPE'] = list(x)
+		self._write_attrs()
+
+	@property
+	def metashape(self):
+		"""The actual shape of the data underlying the pod, often same as shape."""
+		return self.shape
+
+	def add_array(self, name, arr, *, overwrite=False, original_source=None, title=None, dictionary=None):
+		"""Create a new variable in the NpyPod.
+
+		The array is written to a new `.npy` file, which replaces any
+		existing file of the same name atomically, so that other processes
+		that have the old version mapped are not disturbed.
+
+		Parameters
+		----------
+		name : str
+			The name of the new variable.
+		arr : ndarray
+			An array to add as the new variable.  Must have the correct shape.
+		overwrite : bool
+			Should the variable be overwritten if it already exists, default to False.
+		original_source : str
+			Optionally, give the file name or other description of the source of the data in this array.
+		title : str, optional
+			A descriptive title for the variable.
+		dictionary : dict, optional
+			A data dictionary explaining some or all of the values in this field.
+
+		Raises
+		------
+		FileExistsError
+			If a variable of the same name already exists and overwrite is False.
+		"""
+		if self._mode == 'r':
+			raise PermissionError("NpyPod is read-only")
+		if name in _reserved_names_:
+			raise ValueError(f'{name} is a reserved name')
+		if '/' in name or os.sep in name:
+			warnings.warn(f'the ``/`` character is not allowed in variable names ({name})\n'
+						  f'changing it to ``|``')
+			name = name.replace('/', '|').replace(os.sep, '|')
+		arr = numpy.asanyarray(arr)
+		if arr.dtype.kind == 'O':
+			arr = arr.astype(str)
+		try:
+			existing_shape = tuple(self.metashape)
+		except NoKnownShape:
+			pass
+		else:
+			if existing_shape != arr.shape:
+				arr = arr.squeeze()
+				if existing_shape != arr.shape:
+					raise IncompatibleShape(
+						"new array must have shape {!s} but the array given has shape {!s}".format(existing_shape, arr.shape))
+		if name in self and not overwrite:
+			raise FileExistsError(f"{name} already exists")
+		path = self._path_for(name)
+		temp_path = self._directory / f"{name}.npy.tmp"
+		with open(temp_path, 'wb') as f:
+			numpy.save(f, numpy.ascontiguousarray(arr), allow_pickle=False)
+		os.replace(temp_path, path)
+		self._mmaps.pop(name, None)
+		var_attrs = {}
+		if original_source is not None:
+			var_attrs['ORIGINAL_SOURCE'] = str(original_source)
+		if title is not None:
+			var_attrs['TITLE'] = str(title)
+		if dictionary is not None:
+			var_attrs['DICTIONARY'] = [[_jsonable(k), _jsonable(v)] for k, v in dict(dictionary).items()]
+		self._attrs['VARS'][name] = var_attrs
+		if self._attrs['SHAPE'] is None:
+			self._attrs['SHAPE'] = list(arr.shape)
+		self._write_attrs()
+
+	def add_blank(self, name, shape=None, dtype=numpy.float64, **kwargs):
+		"""Create a new zero-filled variable in the NpyPod.
+
+		Other keyword parameters are passed through to `add_array`.
+		"""
+		if shape is None:
+			shape = self.metashape
+		return self.add_array(name, numpy.zeros(shape, dtype=dtype), **kwargs)
+
+	def delete_array(self, name):
+		"""Delete an existing variable.
+
+		Parameters
+		----------
+		name : str
+			The name of the data item to remove.
+		"""
+		if self._mode == 'r':
+			raise PermissionError("NpyPod is read-only")
+		if name in _reserved_names_:
+			raise ValueError(f'{name} is a reserved name')
+		self._mmaps.pop(name, None)
+		try:
+			self._path_for(name).unlink()
+		except FileNotFoundError:
+			pass
+		if self._attrs['VARS'].pop(name, None) is not None:
+			self._write_attrs()
+
+	def close(self):
+		"""Release all memory maps held by this pod."""
+		self._mmaps.clear()
+
+	def _remake_command(self, cmd, selector=None, receiver=None):
+		from tokenize import tokenize, untokenize, NAME, OP, STRING
+		DOT = (OP, '.')
+		COLON = (OP, ':')
+		OBRAC = (OP, '[')
+		CBRAC = (OP, ']')
+		OPAR = (OP, '(')
+		CPAR = (OP, ')')
+		from io import BytesIO
+		recommand = []
+
+		if receiver:
+			recommand += [(NAME, receiver), OBRAC, COLON, CBRAC, (OP, '='), ]
+
+		try:
+			cmd_encode = cmd.encode('utf-8')
+		except AttributeError:
+			cmd_encode = str(cmd).encode('utf-8')
+		g = tokenize(BytesIO(cmd_encode).readline)
+		if selector is None:
+			screen_tokens = [COLON,]
+		else:
+			screen_tokens = [(NAME, 'selector'), ]
+		for toknum, tokval, _, _, _ in g:
+			if toknum == NAME and tokval in self:
+				# replace NAME tokens
+				partial = [(NAME, 'self'), DOT, (NAME, '_mmap'), OPAR, (STRING, repr(tokval)), CPAR, OBRAC, ]
+				partial += screen_tokens
+				partial += [CBRAC,]
+				recommand.extend(partial)
+			else:
+				recommand.append((toknum, tokval))
+		ret = untokenize(recommand).decode('utf-8')
+		return asterize(ret, mode="exec" if receiver is not None else "eval"), ret
+
+	def _evaluate_single_item(self, cmd, selector=None, receiver=None):
+		j, j_plain = self._remake_command(cmd, selector=selector, receiver='receiver' if receiver is not None else None)
+		# important globals
+		from ...util.aster import inXd
+		from numpy import log, exp, log1p, absolute, fabs, sqrt, isnan, isfinite, logaddexp, fmin, fmax, nan_to_num, sin, cos, pi
+		from ...util.common_functions import piece, normalize, boolean
+		try:
+			if receiver is not None:
+				exec(j)
+			else:
+				return eval(j)
+		except Exception as exc:
+			args = exc.args
+			if not args:
+				arg0 = ''
+			else:
+				arg0 = args[0]
+			arg0 = arg0 + '\nwithin parsed command: "{!s}"'.format(cmd)
+			arg0 = arg0 + '\nwithin re-parsed command: "{!s}"'.format(j_plain)
+			if selector is not None:
+				arg0 = arg0 + '\nwith selector: "{!s}"'.format(selector)
+			if isinstance(exc, NameError):
+				badname = str(exc).split("'")[1]
+				goodnames = self.names()
+				from ...util.text_manip import case_insensitive_close_matches
+				did_you_mean_list = case_insensitive_close_matches(badname, goodnames, n=3, cutoff=0.1, excpt=None)
+				if len(did_you_mean_list) > 0:
+					arg0 = arg0 + '\n' + "did you mean {}?".format(
+						" or ".join("'{}'".format(s) for s in did_you_mean_list))
+			exc.args = (arg0,) + args[1:]
+			raise
+
+	def load_data_item(self, name, result, selector=None):
+		"""Load a slice of the pod arrays into an array in memory"""
+		_sqz_same(result.shape, [selector_len_for(selector, self.shape[0]), *self.shape[1:]])
+		if name in self:
+			if selector is None:
+				result[:] = self._mmap(name)
+			else:
+				result[:] = self._mmap(name)[selector]
+		else:
+			result[:] = self._evaluate_single_item(name, selector)
+		return result
+
+	def get_data_item(self, name, selector=None, dtype=None):
+		"""
+		Get data in an array.
+
+		If `name` is a natural name in this pod, the `selector` is None or a
+		slice, and the requested `dtype` matches the stored dtype, the result
+		is a read-only view on the memory map and no data is copied. Otherwise
+		a new array is created, as for other pods.
+
+		Parameters
+		----------
+		name : str
+			The identifier for the data that will be loaded.
+		selector : slice or array-like, optional
+			This will slice the first dimension (cases) of the result.
+		dtype : dtype, optional
+			The dtype for the array to return.
+
+		Returns
+		-------
+		result : ndarray
+		"""
+		if name in self and (selector is None or isinstance(selector, slice)):
+			arr = self._mmap(name)
+			if dtype is None or numpy.dtype(dtype) == arr.dtype:
+				if selector is None:
+					return arr
+				return arr[selector]
+		return super().get_data_item(name, selector=selector, dtype=dtype)
+
+	def __getitem__(self, item):
+		if isinstance(item, tuple) and len(item)>=2 and isinstance(item[-1], slice):
+			names, slice_ = item[:-1], item[-1]
+		else:
+			names = item
+			slice_ = None
+
+		# convert a single name string to a one item list
+		if isinstance(names, str):
+			names = [names,]
+
+		result = numpy.zeros( [selector_len_for(slice_, self.shape[0]), *self.shape[1:], len(names)], dtype=numpy.float64)
+
+		for i, cmd in enumerate(names):
+			self.load_data_item(cmd, result[...,i], selector=slice_)
+
+		return result
+
+	def load_into(self, names, selector, result):
+		"""Load a slice of the pod arrays into an array in memory"""
+		# convert a single name string to a one item list
+		if isinstance(names, str):
+			names = [names, ]
+		_sqz_same(result.shape, [selector_len_for(selector, self.shape[0]), *self.shape[1:], len(names)])
+		for i, cmd in enumerate(names):
+			self.load_data_item(cmd, result[..., i], selector=selector)
+		return result
+
+	def __repr__(self):
+		from ...util.text_manip import max_len
+		s = f"<larch.{self.__class__.__name__}>"
+		s += f"\n |  directory: {truncate_path_for_display(self.filename)}"
+		try:
+			s += f"\n |  shape: {self.shape}"
+		except NoKnownShape:
+			pass
+		names = self.names()
+		if len(names):
+			s += "\n |  data:"
+			just = max_len(names)
+			for i in names:
+				s += "\n |    {0:{2}s} ({1})".format(i, self.dtype_of(i), just)
+		else:
+			s += "\n |  data: <empty>"
+		return s
+
+	def astype(self, t:str):
+		cls = _npy_pod_types[t.lower()]
+		return cls(self)
+
+	@classmethod
+	def from_h5pod(cls, h5pod, directory, names=None, overwrite=False, ident=None):
+		"""
+		Convert an existing H5Pod into an NpyPod.
+
+		Each variable is decompressed once and written as a raw `.npy` file.
+		Titles, data dictionaries and original sources are preserved.
+
+		Parameters
+		----------
+		h5pod : H5Pod
+			The source pod.
+		directory : str or Path
+			The directory in which to write the `.npy` files.
+		names : iterable of str, optional
+			Convert only these variables.  If not given, all variables
+			are converted.
+		overwrite : bool, default False
+			Whether to overwrite existing variables in the target directory.
+		ident : str, optional
+			An identifier for the new pod.
+
+		Returns
+		-------
+		NpyPod
+			If called on the generic NpyPod class, the type of the result
+			is chosen to match the podtype of the source.
+		"""
+		if cls is NpyPod:
+			cls = _npy_pod_types.get(h5pod.podtype, NpyPod)
+		self = cls(directory, mode='a', ident=ident)
+		if names is None:
+			names = h5pod.names()
+		try:
+			self.shape = h5pod.metashape
+		except (NoKnownShape, IncompatibleShape):
+			pass
+		for name in names:
+			node = h5pod._groupnode._v_children[name]
+			attrs = node._v_attrs
+			self.add_array(
+				name,
+				node[:],
+				overwrite=overwrite,
+				original_source=attrs['ORIGINAL_SOURCE'] if 'ORIGINAL_SOURCE' in attrs else h5pod.filename,
+				title=attrs['TITLE'] if ('TITLE' in attrs and attrs['TITLE']) else None,
+				dictionary=attrs['DICTIONARY'] if 'DICTIONARY' in attrs else None,
+			)
+		return self
+
+	@classmethod
+	def from_omx(cls, omx, directory, names=None, overwrite=False, ident=None):
+		"""
+		Convert the matrix tables of an OMX file into an NpyPod.
+
+		Parameters
+		----------
+		omx : OMX or str
+			Either an OMX or a filename to an OMX file.
+		directory : str or Path
+			The directory in which to write the `.npy` files.
+		names : iterable of str, optional
+			Convert only these matrix tables.  If not given, all matrix
+			tables in the `data` node are converted.
+		overwrite : bool, default False
+			Whether to overwrite existing variables in the target directory.
+		ident : str, optional
+			An identifier for the new pod.
+
+		Returns
+		-------
+		NpyPod
+		"""
+		from ...omx import OMX
+		if isinstance(omx, (str, Path)):
+			omx = OMX(os.fspath(omx), mode='r')
+		self = cls(directory, mode='a', ident=ident)
+		self.shape = omx.shape
+		if names is None:
+			names = list(omx.data._v_children.keys())
+		for name in names:
+			node = omx.data._v_children[name]
+			self.add_array(
+				name,
+				node[:],
+				overwrite=overwrite,
+				original_source=omx.filename,
+				title=node._v_attrs['TITLE'] if ('TITLE' in node._v_attrs and node._v_attrs['TITLE']) else None,
+			)
+		return self
+
+
+class NpyPodCO(NpyPod):
+	"""
+	A directory of `.npy` files containing :ref:`idco` format data.
+
+	Every variable is a vector of values attributable to casewise observations,
+	and all variables must have the same length and be ordered the same way.
+	"""
+
+	@property
+	def podtype(self):
+		return 'idco'
+
+	def as_idca(self):
+		ret = NpyPodCOasCA(self, ident=self.ident+"_as_idca")
+		return ret
+
+
+class NpyPodCOasCA(NpyPodCO):
+
+	@property
+	def podtype(self):
+		return 'idca'
+
+	def load_data_item(self, name, result, selector=None):
+		"""Load a slice of the pod arrays into an array in memory"""
+		_sqz_same_trailing_neg_ok(result.shape, [selector_len_for(selector, self.shape[0]), *self.shape[1:]])
+		if name in self:
+			if selector is None:
+				result[:,:] = self._mmap(name)[:,None]
+			else:
+				result[:,:] = self._mmap(name)[selector][:,None]
+		else:
+			result[:,:] = self._evaluate_single_item(name, selector)[:,None]
+		return result
+
+	def get_data_item(self, name, selector=None, dtype=None):
+		return Pod.get_data_item(self, name, selector=selector, dtype=dtype)
+
+	@property
+	def shape(self):
+		"""The shape of the pod."""
+		return super().shape + (self.trailing_dim,)
+
+	@property
+	def metashape(self):
+		return NpyPodCO.shape.fget(self)
+
+	@property
+	def trailing_dim(self):
+		try:
+			return self._trailing_dim
+		except AttributeError:
+			return -1
+
+	@trailing_dim.setter
+	def trailing_dim(self, value):
+		self._trailing_dim = int(value)
+
+
+class NpyPodCA(NpyPod):
+	"""
+	A directory of `.npy` files containing :ref:`idca` format data.
+
+	Every variable is a two dimensional array, with rows of values attributable
+	to casewise observations, and columns attributable to individual choice
+	alternatives.
+	"""
+
+	@property
+	def podtype(self):
+		return 'idca'
+
+
+def _jsonable(x):
+	if isinstance(x, numpy.generic):
+		return x.item()
+	if isinstance(x, bytes):
+		return x.decode('utf-8')
+	return x
+
+
+_npy_pod_types = {
+	'': NpyPod,
+	'idco': NpyPodCO,
+	'idca': NpyPodCA,
+	'co': NpyPodCO,
+	'ca': NpyPodCA,
+}
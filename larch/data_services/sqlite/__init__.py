@@ -3,7 +3,7 @@ import apsw
 import numpy
 import pandas
 
-from .sqlite_arrays import _sqlite_array_2d_float64
+from .sqlite_arrays import _sqlite_array_2d_float64, SQLitePodCO
 
 class Connection(apsw.Connection):
 
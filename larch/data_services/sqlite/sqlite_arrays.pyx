@@ -6,7 +6,7 @@ import pandas
 
 
 
-cdef extern from "sqlite3.h":
+cdef extern from "sqlite3.h" nogil:
 	ctypedef struct sqlite3:
 		int busyTimeout
 	# ctypedef struct sqlite3_backup
@@ -55,7 +55,9 @@ cdef extern from "sqlite3.h":
 	cdef double sqlite3_column_double(sqlite3_stmt*, int iCol)
 	cdef long long int sqlite3_column_int64(sqlite3_stmt*, int iCol)
 	cdef const char* sqlite3_column_name(sqlite3_stmt*, int iCol)
+	cdef const char* sqlite3_column_decltype(sqlite3_stmt*, int iCol)
 	cdef const unsigned char *sqlite3_column_text(sqlite3_stmt*, int iCol)
+	cdef int sqlite3_column_type(sqlite3_stmt*, int iCol)
 
 
 
@@ -276,47 +278,449 @@ def _sqlite_array_2d_float64(
 
 
 
+from libc.stdlib cimport malloc, free
+from libc.stdint cimport int8_t, int32_t, int64_t
+
+cdef enum ColumnKind:
+	KIND_FLOAT64,
+	KIND_FLOAT32,
+	KIND_INT64,
+	KIND_INT32,
+	KIND_INT8
+
+_column_kinds = {
+	numpy.dtype(numpy.float64): KIND_FLOAT64,
+	numpy.dtype(numpy.float32): KIND_FLOAT32,
+	numpy.dtype(numpy.int64): KIND_INT64,
+	numpy.dtype(numpy.int32): KIND_INT32,
+	numpy.dtype(numpy.int8): KIND_INT8,
+	numpy.dtype(numpy.bool_): KIND_INT8,
+}
+
+
+def _sqlite_step_into(
+		uintptr_t connection_handle_as_voidptr,
+		str query,
+		list columns,
+		row_targets=None,
+):
+	"""
+	Step through a query, writing each result column into its own array.
+
+	Parameters
+	----------
+	connection_handle_as_voidptr
+	query : str
+	columns : list of ndarray
+		One writable 1-d array per column of the query result.  The arrays
+		may be strided views (e.g. one column of a 2-d result), and each is
+		filled according to its own dtype, which must be one of float64,
+		float32, int64, int32, int8 or bool.
+	row_targets : array-like of int64, optional
+		For each row of the query result, the position in the `columns`
+		arrays to write it, or -1 to skip the row.  If not given, the rows
+		are written in order.
+
+	Returns
+	-------
+	int
+		The number of rows stepped through.
+
+	Raises
+	------
+	SQLPrepError
+		If the query cannot be prepared.
+	SQLStepError
+		If stepping through the query fails.
+	"""
+	cdef sqlite3* connection_handle = <sqlite3*> connection_handle_as_voidptr
+	cdef sqlite3_stmt* _statement = NULL
+	cdef int n_cols = len(columns)
+	cdef int i, kind
+	cdef int _status = SQLITE_ROW
+	cdef int64_t rownum = 0
+	cdef int64_t target
+	cdef int64_t n_out
+	cdef int64_t n_targets = -1
+	cdef const int64_t[:] targets
+	cdef int* kinds = NULL
+	cdef char** bases = NULL
+	cdef Py_ssize_t* strides = NULL
+	cdef char* cell
+
+	if row_targets is not None:
+		targets = numpy.ascontiguousarray(row_targets, dtype=numpy.int64)
+		n_targets = targets.shape[0]
+
+	n_out = len(columns[0]) if n_cols else 0
+	for col in columns:
+		if col.ndim != 1 or col.shape[0] != n_out:
+			raise ValueError('columns must all be 1-d arrays of the same length')
+		if not col.flags.writeable:
+			raise ValueError('columns must be writeable')
+		if col.dtype not in _column_kinds:
+			raise TypeError(f'cannot read sqlite data into {col.dtype}')
+
+	_status = sqlite3_prepare_v2(
+		connection_handle,
+		query.encode(),
+		-1,               # Length of zSql in bytes. -1 use all
+		&_statement,      # OUT: SQLiteStmt handle */
+		NULL              # OUT: Pointer to unused portion of zSql */
+	)
+	if _status != SQLITE_OK:
+		_statement = NULL
+		raise SQLPrepError(query)
+
+	try:
+		if count_columns(_statement) != n_cols:
+			raise ValueError(f'query returns {count_columns(_statement)} columns, but {n_cols} arrays were given')
+
+		kinds = <int*>malloc(n_cols * sizeof(int))
+		bases = <char**>malloc(n_cols * sizeof(char*))
+		strides = <Py_ssize_t*>malloc(n_cols * sizeof(Py_ssize_t))
+		for i in range(n_cols):
+			kinds[i] = _column_kinds[columns[i].dtype]
+			bases[i] = <char*><uintptr_t>columns[i].ctypes.data
+			strides[i] = columns[i].strides[0]
+
+		with nogil:
+			while True:
+				_status = sqlite3_step(_statement)
+				if _status != SQLITE_ROW:
+					break
+				if n_targets >= 0:
+					if rownum >= n_targets:
+						break
+					target = targets[rownum]
+				else:
+					target = rownum
+				if 0 <= target < n_out:
+					for i in range(n_cols):
+						cell = bases[i] + target * strides[i]
+						kind = kinds[i]
+						if kind == KIND_FLOAT64:
+							(<double*>cell)[0] = sqlite3_column_double(_statement, i)
+						elif kind == KIND_FLOAT32:
+							(<float*>cell)[0] = <float>sqlite3_column_double(_statement, i)
+						elif kind == KIND_INT64:
+							(<int64_t*>cell)[0] = sqlite3_column_int64(_statement, i)
+						elif kind == KIND_INT32:
+							(<int32_t*>cell)[0] = <int32_t>sqlite3_column_int64(_statement, i)
+						else:
+							(<int8_t*>cell)[0] = <int8_t>sqlite3_column_int64(_statement, i)
+				rownum += 1
+
+		if _status != SQLITE_ROW and _status != SQLITE_DONE:
+			raise SQLStepError("on row {}:\n{}".format(rownum, query))
+
+	finally:
+		free(kinds)
+		free(bases)
+		free(strides)
+		sqlite3_finalize(_statement)
+
+	return rownum
+
+
+def _query_columns(uintptr_t connection_handle_as_voidptr, str query):
+	"""
+	The names and declared types of the result columns of a query.
+
+	The query is only prepared, not run.
+
+	Returns
+	-------
+	list of (str, str or None)
+		The name and declared type of each column.  The declared type is
+		None for a column that is an expression rather than a table column.
+	"""
+	cdef sqlite3* connection_handle = <sqlite3*> connection_handle_as_voidptr
+	cdef sqlite3_stmt* _statement = NULL
+	cdef const char* decltype
+	cdef int i
+
+	if sqlite3_prepare_v2(connection_handle, query.encode(), -1, &_statement, NULL) != SQLITE_OK:
+		sqlite3_finalize(_statement)
+		raise SQLPrepError(query)
+	try:
+		result = []
+		for i in range(count_columns(_statement)):
+			decltype = sqlite3_column_decltype(_statement, i)
+			result.append((
+				sqlite3_column_name(_statement, i).decode(),
+				decltype.decode() if decltype != NULL else None,
+			))
+	finally:
+		sqlite3_finalize(_statement)
+	return result
+
+
 def _rip_array_idco(connection, query, n_rows, dtype=numpy.float64, out=None):
-	with connection:
-		cur = connection.cursor().execute(query)
-		n_cols = len(cur.description)
-		if out is None:
-			result = numpy.zeros([n_rows, n_cols], dtype=dtype)
-		else:
-			assert( tuple(out.shape) == tuple(n_rows, n_cols) )
-			result = out
-		for rownum, row in enumerate(cur):
-			result[rownum,:] = row[:]
+	if out is None:
+		n_cols = len(_query_columns(connection.sqlite3pointer(), query))
+		result = numpy.zeros([n_rows, n_cols], dtype=dtype)
+	else:
+		result = out
+	_sqlite_step_into(
+		connection.sqlite3pointer(),
+		query,
+		[result[:,i] for i in range(result.shape[1])],
+	)
 	return result
 
 
+def _decltype_to_dtype(decltype):
+	"""
+	Map a declared SQLite column type to a numpy dtype, following SQLite type affinity.
 
-class SQLitePodCO():
+	Text and blob columns are read as float64, with SQLite's own conversion
+	of text to numbers, as the arrays loaded from a pod are always numeric.
+	"""
+	t = (decltype or '').upper()
+	if 'INT' in t:
+		return numpy.dtype(numpy.int64)
+	if 'BOOL' in t:
+		return numpy.dtype(numpy.int8)
+	return numpy.dtype(numpy.float64)
+
+
+def _is_rowid_table(connection, name):
+	"""
+	Whether `name` is an ordinary table, with a rowid for every row.
+
+	Views give NULL rowids, and tables created WITHOUT ROWID have none.
+	A temporary table is found first, as SQLite resolves names that way.
+	"""
+	import re
+	for schema in ('sqlite_temp_master', 'sqlite_master'):
+		for kind, sql in connection.cursor().execute(
+				f"SELECT type, sql FROM {schema} WHERE name = ? COLLATE NOCASE",
+				(name, ),
+		):
+			if kind != 'table' or not sql:
+				return False
+			options = sql[sql.rfind(')')+1:]
+			return re.search(r'\bWITHOUT\s+ROWID\b', options, re.IGNORECASE) is None
+	return False
 
-	def __init__(self, connection, tabledef, nrows=0, ordering=None):
+
+# The most rowids listed in one `rowid IN (...)` query, which keeps each
+# query well below SQLite's default SQLITE_MAX_SQL_LENGTH of 1 MB.
+ROWID_CHUNK = 10000
+
+
+from ..pod import Pod
+from ..general import selector_len_for, _sqz_same
+
+
+class SQLitePodCO(Pod):
+	"""
+	A Pod for |idco| data in a SQLite table or query.
+
+	Data is read with a Cython loop over the SQLite statement, writing each
+	result column directly into its destination array in its own dtype.
+	Case selectors are pushed down into the query where possible: a simple
+	slice becomes LIMIT/OFFSET, and other selectors become a rowid
+	predicate for an ordinary table (not a view or a WITHOUT ROWID table)
+	with no `ordering`, or otherwise a LIMIT/OFFSET on the range of
+	selected cases, so the whole table is never loaded to take a subset.
+
+	Parameters
+	----------
+	connection : apsw.Connection
+		The connection to the database.
+	tabledef : str
+		The name of a table or view, or a SELECT query, giving one row per case.
+	nrows : int, optional
+		The number of rows (cases).  If not given it is counted.
+	ordering : str, optional
+		An ORDER BY clause (without the 'ORDER BY') that sets the case order.
+	dtypes : Mapping[str, dtype], optional
+		Override the dtype of particular columns.  Otherwise the dtype is
+		inferred from the declared type of each column: int64 for integer
+		columns, int8 for boolean columns, and float64 for all others,
+		including text columns, which SQLite converts to numbers.
+	ident : str, optional
+	"""
+
+	def __init__(self, connection, tabledef, nrows=0, ordering=None, *, dtypes=None, ident=None):
+		super().__init__(ident=ident)
 		self.tabledef = tabledef
 		self.connection = connection
 		self.ordering = ordering
 		if nrows:
 			self.nrows = nrows
 		else:
-			with connection:
-				cur = connection.cursor().execute(f"SELECT count(*) FROM ({self.tabledef})")
-				self.nrows = next(cur)[0]
+			self.nrows = single_integer_result(
+				connection.sqlite3pointer(),
+				f"SELECT count(*) FROM ({self._from_clause})",
+			)
+		self._dtypes = {
+			name: _decltype_to_dtype(decltype)
+			for name, decltype in _query_columns(connection.sqlite3pointer(), self._from_clause)
+		}
+		if dtypes:
+			self._dtypes.update({k: numpy.dtype(v) for k, v in dtypes.items()})
+		self._rowids = None
+		self._rowid_table = self.tabledef.isidentifier() and _is_rowid_table(connection, self.tabledef)
+
+	@property
+	def _from_clause(self):
+		if self.tabledef.lstrip()[:6].upper() == 'SELECT':
+			return self.tabledef
+		return f"SELECT * FROM {self.tabledef}"
+
+	@property
+	def _is_plain_table(self):
+		return self.ordering is None and self._rowid_table
+
+	@property
+	def podtype(self):
+		return 'idco'
+
+	@property
+	def shape(self):
+		return (self.nrows, )
+
+	@property
+	def dims(self):
+		return 1
+
+	@property
+	def filename(self):
+		return self.connection.filename
+
+	@property
+	def internalname(self):
+		return 'tabledef', self.tabledef
+
+	def names(self):
+		return list(self._dtypes.keys())
+
+	def dtype_of(self, name):
+		return self._dtypes.get(name, numpy.dtype(numpy.float64))
+
+	def get_data_dictionary(self, name):
+		return {}
+
+	def _query(self, names, where=None, limit=None, offset=None):
+		source = self.tabledef if self.tabledef.isidentifier() else f"({self._from_clause})"
+		qry = f"SELECT {', '.join(f'({n})' for n in names)} FROM {source}"
+		if where:
+			qry += f" WHERE {where}"
+		if self.ordering:
+			qry += f" ORDER BY {self.ordering}"
+		elif where:
+			qry += " ORDER BY rowid"
+		if limit is not None:
+			qry += f" LIMIT {limit} OFFSET {offset or 0}"
+		return qry
+
+	def _get_rowids(self):
+		if self._rowids is None:
+			rowids = numpy.zeros(self.nrows, dtype=numpy.int64)
+			_sqlite_step_into(
+				self.connection.sqlite3pointer(),
+				f"SELECT rowid FROM {self.tabledef} ORDER BY rowid",
+				[rowids],
+			)
+			self._rowids = rowids
+		return self._rowids
+
+	def load_into(self, names, selector, result):
+		"""
+		Load a selection of cases for several names into an array in one query.
+
+		Parameters
+		----------
+		names : str or Sequence[str]
+			Column names or SQL expressions to load.
+		selector : None or slice or ndarray
+			The cases to load.
+		result : ndarray
+			An array with shape (n_selected_cases, len(names)).  Each column
+			is filled in its own dtype, which must be a numeric type.
+
+		Returns
+		-------
+		ndarray
+		"""
+		if isinstance(names, str):
+			names = [names, ]
+		_sqz_same(result.shape, [selector_len_for(selector, self.nrows), len(names)])
+		if result.ndim == 1:
+			result = result[:, numpy.newaxis]
+		columns = [result[:, i] for i in range(len(names))]
+		ptr = self.connection.sqlite3pointer()
+
+		try:
+			if selector is None:
+				_sqlite_step_into(ptr, self._query(names), columns)
+				return result
+
+			if isinstance(selector, slice) and selector.step in (None, 1):
+				start, stop, _ = selector.indices(self.nrows)
+				_sqlite_step_into(ptr, self._query(names, limit=max(stop-start, 0), offset=start), columns)
+				return result
+
+			positions = numpy.arange(self.nrows)[selector]
+			if len(positions) == 0:
+				return result
+			uniq, inverse = numpy.unique(positions, return_inverse=True)
+			direct = len(uniq) == len(positions) and numpy.all(uniq == positions)
+			if direct:
+				temp, temp_columns = result, columns
+			else:
+				temp = numpy.zeros([len(uniq), len(names)], dtype=result.dtype)
+				temp_columns = [temp[:, i] for i in range(len(names))]
+
+			if self._is_plain_table:
+				rowids = self._get_rowids()[uniq]
+				for lo in range(0, len(rowids), ROWID_CHUNK):
+					chunk = rowids[lo:lo+ROWID_CHUNK]
+					_sqlite_step_into(
+						ptr,
+						self._query(names, where=f"rowid IN ({','.join(str(r) for r in chunk)})"),
+						[c[lo:lo+len(chunk)] for c in temp_columns],
+					)
+			else:
+				lo, hi = uniq[0], uniq[-1]+1
+				targets = numpy.full(hi-lo, -1, dtype=numpy.int64)
+				targets[uniq-lo] = numpy.arange(len(uniq))
+				_sqlite_step_into(ptr, self._query(names, limit=hi-lo, offset=lo), temp_columns, targets)
+
+			if not direct:
+				result[:] = temp[inverse]
+			return result
+		except SQLPrepError as err:
+			raise NameError(f"cannot resolve {names} in {self.tabledef}") from err
+
+	def load_data_item(self, name, result, selector=None):
+		"""
+		Load a column or SQL expression into an existing array.
+
+		Parameters
+		----------
+		name : str
+			A column name, or any SQL expression of the columns.
+		result : ndarray
+			The array into which the data will be loaded.  It must have a
+			numeric dtype and one value per selected case.
+		selector : slice or array-like, optional
+			This will slice the first dimension (cases) of the result.
+
+		Raises
+		------
+		NameError
+			The name cannot be resolved by SQLite.
+		"""
+		self.load_into([name], selector, result)
+		return result
 
-	def get_array(self, vars, selector=None, out=None):
+	def get_array(self, vars, selector=None, out=None, dtype=numpy.float64):
 		if isinstance(vars, str):
 			vars = [vars,]
-		qry_vars = ", ".join(vars)
-		qry = f"SELECT {qry_vars} FROM ({self.tabledef})"
-		if self.ordering:
-			qry += f" ORDER BY {self.ordering}"
-		if selector is None:
-			return _rip_array_idco(self.connection, qry, self.nrows, out=out)
-		elif isinstance(selector, slice) and selector.step in (None, 1):
-			qry += f" LIMIT {selector.stop-selector.start} OFFSET {selector.start}"
-			return _rip_array_idco(self.connection, qry, self.nrows, out=out)
-		else:
-			result = _rip_array_idco(self.connection, qry, self.nrows)
-			out[:] = result[selector]
-			return out
\ No newline at end of file
+		if out is None:
+			out = numpy.zeros([selector_len_for(selector, self.nrows), len(vars)], dtype=dtype)
+		return self.load_into(vars, selector, out)
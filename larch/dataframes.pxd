@@ -27,6 +27,15 @@ cdef class DataFrames:
 		int8_t    [:,:]   _array_av
 		l4_float_t[:,:]   _array_ch
 		l4_float_t[:]     _array_wt
+		# Skim-on-demand idca variables
+		object            _skims
+		l4_float_t[:]     _skim_flat
+		int64_t[:,:]      _skim_rowbase
+		int[:,:]          _skim_cols
+		# Grouped-case compression
+		object            _case_groups
+		# Relative work per case, for scheduling
+		object            _case_work
 		# Model position mappings
 		int[:] model_utility_ca_param
 		int[:] model_utility_ca_data
@@ -36,6 +45,9 @@ cdef class DataFrames:
 		int[:] model_quantity_ca_param
 		int[:] model_quantity_ca_data
 		int    model_quantity_scale_param
+		# Alternative specific constants, grouped by alternative
+		int[:] model_utility_co_const_ptr
+		int[:] model_utility_co_const_param
 		# Model parameter values
 		l4_float_t[:] model_utility_ca_param_value
 		l4_float_t[:] model_utility_ca_param_scale
@@ -48,6 +60,9 @@ cdef class DataFrames:
 		int8_t[:]     model_quantity_ca_param_holdfast
 		l4_float_t    model_quantity_scale_param_value
 		int8_t        model_quantity_scale_param_holdfast
+		l4_float_t[:] model_utility_co_const_param_scale
+		int8_t[:]     model_utility_co_const_param_holdfast
+		l4_float_t[:] model_utility_co_const_alt_value
 
 		# Data scalers
 		object _std_scaler_ca
@@ -112,6 +127,12 @@ cdef class DataFrames:
 
 	cdef void _read_in_model_parameters(self)
 
+	cdef void _read_in_constant_parameters(
+			self,
+			l4_float_t[:] pvalues,
+			int8_t[:] hvalues,
+	)
+
 	cdef void _link_to_model_structure(
 			self,
 			Model5c model,
@@ -432,6 +432,12 @@ cdef class DataFrames:
 			self._data_ch = None
 			self._data_wt = None
 			self._data_av = None
+			self._skims = {}
+			self._skim_flat = None
+			self._skim_rowbase = None
+			self._skim_cols = None
+			self._case_groups = None
+			self._case_work = None
 
 			co = co if co is not None else data_co
 			ca = ca if ca is not None else data_ca
@@ -1292,6 +1298,7 @@ cdef class DataFrames:
 	def data_av(self, df:pandas.DataFrame):
 		self._data_av = _ensure_dataframe_of_dtype(df, numpy.int8, 'data_av', warn_on_convert=False)
 		self._array_av = _df_values(self.data_av, (self.n_cases, self.n_alts))
+		self._case_work = None
 
 	def data_av_as_ce(self):
 		"""
@@ -1457,6 +1464,129 @@ cdef class DataFrames:
 					arr[row] = self._array_wt[c]
 		return pandas.DataFrame(arr, index=self.data_ce.index, columns=['weight'])
 
+	def add_skim_ca(self, name, matrix, origin, destinations=None, lookup=None):
+		"""
+		Add a virtual |idca| variable that is read from a skim matrix on demand.
+
+		Destination choice models often need `skim[origin, alt]` for every
+		case and every alternative.  Rather than expanding the skim into a
+		cases-by-alts array in `data_ca`, a skim variable keeps only the
+		matrix and a row index for each case, and the utility kernel reads
+		`matrix[origin[c], destinations[j]]` as it goes.  The variable can be
+		used in `utility_ca` or `quantity_ca` by `name`, exactly like a
+		column of `data_ca`.
+
+		Parameters
+		----------
+		name : str
+			The name of the virtual idca variable.  This must not also be a
+			column of `data_ca` or `data_ce`.
+		matrix : array-like
+			A two dimensional skim matrix, e.g. `omx['AUTO_TIME']`.
+		origin : str or array-like
+			The origin of each case.  If given as a str, this names a column
+			of `data_co`.  Otherwise, an array with one value per case.
+		destinations : array-like, optional
+			The matrix column for each alternative, as zone identifiers if
+			`lookup` is given, or zero-based positions otherwise.  If not
+			given, the alternative codes are used with `lookup`, or the
+			alternatives are assumed to map to matrix columns in order.
+		lookup : array-like, optional
+			Zone identifiers labeling the rows and columns of `matrix`, such
+			as an OMX lookup.  If given, `origin` and `destinations` are
+			given as zone identifiers and are translated into positions.
+
+		Raises
+		------
+		ValueError
+			If the name is already used, or if the origins or destinations
+			cannot be resolved to positions in the matrix.
+		"""
+		matrix = numpy.asarray(matrix[:] if not isinstance(matrix, numpy.ndarray) else matrix)
+		if matrix.ndim != 2:
+			raise ValueError(f'skim matrix must be two dimensional, not {matrix.ndim}')
+		if self.data_ca_or_ce is not None and name in self.data_ca_or_ce.columns:
+			raise ValueError(f'{name} is already an idca variable')
+		if isinstance(origin, str):
+			if self._data_co is None or origin not in self._data_co.columns:
+				raise ValueError(f'idco origin variable missing: {origin}')
+			origin = self._data_co[origin].values
+		origin = numpy.asarray(origin).reshape(-1)
+		if origin.shape[0] != self.n_cases:
+			raise ValueError(f'origin has {origin.shape[0]} values, but there are {self.n_cases} cases')
+		if destinations is None:
+			if lookup is not None:
+				destinations = self.alternative_codes()
+			else:
+				destinations = numpy.arange(self.n_alts)
+		destinations = numpy.asarray(destinations).reshape(-1)
+		if destinations.shape[0] != self.n_alts:
+			raise ValueError(f'destinations has {destinations.shape[0]} values, but there are {self.n_alts} alternatives')
+		if lookup is not None:
+			lookup = pandas.Index(numpy.asarray(lookup).reshape(-1))
+			rows = lookup.get_indexer(origin)
+			cols = lookup.get_indexer(destinations)
+		else:
+			rows = origin.astype(numpy.int64)
+			cols = destinations.astype(numpy.int64)
+		if numpy.any(rows < 0) or numpy.any(rows >= matrix.shape[0]):
+			raise ValueError(f'origins for {name} are not all found in the skim matrix')
+		if numpy.any(cols < 0) or numpy.any(cols >= matrix.shape[1]):
+			raise ValueError(f'destinations for {name} are not all found in the skim matrix')
+		self._skims[name] = (matrix, rows.astype(numpy.int64), cols.astype(numpy.int32))
+		self._rebuild_skim_arrays()
+
+	def drop_skim_ca(self, name):
+		"""
+		Remove a virtual |idca| skim variable.
+
+		Parameters
+		----------
+		name : str
+		"""
+		del self._skims[name]
+		self._rebuild_skim_arrays()
+
+	@property
+	def skims_ca(self):
+		"""Tuple[str]: The names of the virtual |idca| skim variables."""
+		return tuple(self._skims.keys())
+
+	def _rebuild_skim_arrays(self):
+		"""
+		Pack all skim matrices into the flat arrays read by the utility kernel.
+
+		Each skim occupies a contiguous block of `_skim_flat`, and
+		`_skim_rowbase[k,c]` is the offset of the origin row for case `c`
+		within that block, so the kernel reads a single element with
+		`_skim_flat[_skim_rowbase[k,c] + _skim_cols[k,j]]`.
+		"""
+		if not self._skims:
+			self._skim_flat = None
+			self._skim_rowbase = None
+			self._skim_cols = None
+			return
+		n_skims = len(self._skims)
+		flat = numpy.empty(sum(m.size for m, _, _ in self._skims.values()), dtype=l4_float_dtype)
+		rowbase = numpy.empty([n_skims, self.n_cases], dtype=numpy.int64)
+		cols = numpy.empty([n_skims, self.n_alts], dtype=numpy.int32)
+		offset = 0
+		for k, (matrix, r, c) in enumerate(self._skims.values()):
+			flat[offset:offset+matrix.size] = matrix.reshape(-1)
+			rowbase[k] = offset + r * matrix.shape[1]
+			cols[k] = c
+			offset += matrix.size
+		self._skim_flat = flat
+		self._skim_rowbase = rowbase
+		self._skim_cols = cols
+
+	def _skim_ca_index(self, name):
+		"""Position of a skim variable in the kernel arrays, or -1."""
+		try:
+			return list(self._skims.keys()).index(name)
+		except ValueError:
+			return -1
+
 	@property
 	def _data_ca_or_ce(self):
 		if self._data_ca is not None:
@@ -1611,20 +1741,22 @@ cdef class DataFrames:
 				missing_data.add(y)
 
 		if model._utility_ca is not None and len(model._utility_ca):
-			if self.data_ca_or_ce is None:
-				missing(f'idca data missing for utility')
-			else:
-				for i in model._utility_ca:
-					if str(i.data) not in self._data_ca_or_ce:
-						missing(f'idca utility variable missing: {i.data}')
+			for i in model._utility_ca:
+				if str(i.data) in self._skims:
+					continue
+				if self.data_ca_or_ce is None:
+					missing(f'idca data missing for utility')
+				elif str(i.data) not in self._data_ca_or_ce:
+					missing(f'idca utility variable missing: {i.data}')
 
 		if model._quantity_ca is not None and len(model._quantity_ca):
-			if self.data_ca_or_ce is None:
-				missing(f'idca data missing for quantity')
-			else:
-				for i in model._quantity_ca:
-					if str(i.data) not in self._data_ca_or_ce:
-						missing(f'idca quantity variable missing: {i.data}')
+			for i in model._quantity_ca:
+				if str(i.data) in self._skims:
+					continue
+				if self.data_ca_or_ce is None:
+					missing(f'idca data missing for quantity')
+				elif str(i.data) not in self._data_ca_or_ce:
+					missing(f'idca quantity variable missing: {i.data}')
 
 		if model._utility_co is not None and len(model._utility_co):
 			if self._data_co is None:
@@ -1677,7 +1809,10 @@ cdef class DataFrames:
 				self.model_quantity_ca_data        = numpy.zeros([len_model_utility_ca], dtype=numpy.int32)
 				for n,i in enumerate(model._quantity_ca):
 					self.model_quantity_ca_param[n] = model._frame.index.get_loc(str(i.param))
-					self.model_quantity_ca_data [n] = self._data_ca_or_ce.columns.get_loc(str(i.data))
+					if str(i.data) in self._skims:
+						self.model_quantity_ca_data [n] = -1 - self._skim_ca_index(str(i.data))
+					else:
+						self.model_quantity_ca_data [n] = self._data_ca_or_ce.columns.get_loc(str(i.data))
 					self.model_quantity_ca_param_scale[n] = i.scale
 				if model._quantity_scale is not None:
 					self.model_quantity_scale_param = model._frame.index.get_loc(str(model._quantity_scale))
@@ -1701,7 +1836,10 @@ cdef class DataFrames:
 				self.model_utility_ca_data        = numpy.zeros([len_model_utility_ca], dtype=numpy.int32)
 				for n,i in enumerate(model._utility_ca):
 					self.model_utility_ca_param[n] = model._frame.index.get_loc(str(i.param))
-					self.model_utility_ca_data [n] = self._data_ca_or_ce.columns.get_loc(str(i.data))
+					if str(i.data) in self._skims:
+						self.model_utility_ca_data [n] = -1 - self._skim_ca_index(str(i.data))
+					else:
+						self.model_utility_ca_data [n] = self._data_ca_or_ce.columns.get_loc(str(i.data))
 					self.model_utility_ca_param_scale[n] = i.scale
 			else:
 				len_model_utility_ca = 0
@@ -1711,35 +1849,45 @@ cdef class DataFrames:
 				self.model_utility_ca_param       = numpy.zeros([len_model_utility_ca], dtype=numpy.int32)
 				self.model_utility_ca_data        = numpy.zeros([len_model_utility_ca], dtype=numpy.int32)
 
+			# Constant terms (data '1') are kept apart from the data terms, grouped
+			# by alternative, so that each case adds them as one value per
+			# alternative instead of looping over every constant.
+			co_data_terms = []
+			co_const_terms = []
 			if model._utility_co is not None:
-				len_co = sum(len(_) for _ in model._utility_co.values())
-				self.model_utility_co_alt         = numpy.zeros([len_co], dtype=numpy.int32)
-				self.model_utility_co_param_value = numpy.zeros([len_co], dtype=l4_float_dtype)
-				self.model_utility_co_param_scale = numpy.ones([len_co], dtype=l4_float_dtype)
-				self.model_utility_co_param_holdfast = numpy.zeros([len_co], dtype=numpy.int8)
-				self.model_utility_co_param       = numpy.zeros([len_co], dtype=numpy.int32)
-				self.model_utility_co_data        = numpy.zeros([len_co], dtype=numpy.int32)
-
-				j = 0
 				for alt, func in model._utility_co.items():
 					altindex = self._alternative_codes.get_loc(alt)
 					for i in func:
-						self.model_utility_co_alt  [j] = altindex
-						self.model_utility_co_param[j] = model._frame.index.get_loc(str(i.param))
-						self.model_utility_co_param_scale[j] = i.scale
 						if i.data == '1':
-							self.model_utility_co_data [j] = -1
+							co_const_terms.append((altindex, model._frame.index.get_loc(str(i.param)), i.scale))
 						else:
-							self.model_utility_co_data [j] = self._data_co.columns.get_loc(str(i.data))
-						j += 1
-			else:
-				len_co = 0
-				self.model_utility_co_alt         = numpy.zeros([len_co], dtype=numpy.int32)
-				self.model_utility_co_param_value = numpy.zeros([len_co], dtype=l4_float_dtype)
-				self.model_utility_co_param_scale = numpy.ones([len_co], dtype=l4_float_dtype)
-				self.model_utility_co_param_holdfast = numpy.zeros([len_co], dtype=numpy.int8)
-				self.model_utility_co_param       = numpy.zeros([len_co], dtype=numpy.int32)
-				self.model_utility_co_data        = numpy.zeros([len_co], dtype=numpy.int32)
+							co_data_terms.append((altindex, model._frame.index.get_loc(str(i.param)), i.scale, i.data))
+
+			len_co = len(co_data_terms)
+			self.model_utility_co_alt         = numpy.zeros([len_co], dtype=numpy.int32)
+			self.model_utility_co_param_value = numpy.zeros([len_co], dtype=l4_float_dtype)
+			self.model_utility_co_param_scale = numpy.ones([len_co], dtype=l4_float_dtype)
+			self.model_utility_co_param_holdfast = numpy.zeros([len_co], dtype=numpy.int8)
+			self.model_utility_co_param       = numpy.zeros([len_co], dtype=numpy.int32)
+			self.model_utility_co_data        = numpy.zeros([len_co], dtype=numpy.int32)
+			for j, (altindex, param, scale, data) in enumerate(co_data_terms):
+				self.model_utility_co_alt  [j] = altindex
+				self.model_utility_co_param[j] = param
+				self.model_utility_co_param_scale[j] = scale
+				self.model_utility_co_data [j] = self._data_co.columns.get_loc(str(data))
+
+			co_const_terms.sort(key=lambda t: t[0])
+			len_co = len(co_const_terms)
+			self.model_utility_co_const_ptr   = numpy.zeros([self._n_alts()+1], dtype=numpy.int32)
+			self.model_utility_co_const_param = numpy.zeros([len_co], dtype=numpy.int32)
+			self.model_utility_co_const_param_scale = numpy.ones([len_co], dtype=l4_float_dtype)
+			self.model_utility_co_const_param_holdfast = numpy.zeros([len_co], dtype=numpy.int8)
+			self.model_utility_co_const_alt_value = numpy.zeros([self._n_alts()], dtype=l4_float_dtype)
+			for j, (altindex, param, scale) in enumerate(co_const_terms):
+				self.model_utility_co_const_ptr[altindex+1] += 1
+				self.model_utility_co_const_param[j] = param
+				self.model_utility_co_const_param_scale[j] = scale
+			numpy.cumsum(self.model_utility_co_const_ptr.base, out=self.model_utility_co_const_ptr.base)
 
 		except:
 			import logging
@@ -1778,6 +1926,8 @@ cdef class DataFrames:
 				self.model_utility_co_param_value[n]    = pvalues[self.model_utility_co_param[n]]
 				self.model_utility_co_param_holdfast[n] = hvalues[self.model_utility_co_param[n]]
 
+			self._read_in_constant_parameters(pvalues, hvalues)
+
 		except:
 			if logger is None:
 				import logging
@@ -1820,6 +1970,8 @@ cdef class DataFrames:
 				self.model_utility_co_param_value[n]    = pvalues[self.model_utility_co_param[n]]
 				self.model_utility_co_param_holdfast[n] = hvalues[self.model_utility_co_param[n]]
 
+			self._read_in_constant_parameters(pvalues, hvalues)
+
 		except:
 			import logging
 			from .log import logger_name
@@ -1827,8 +1979,45 @@ cdef class DataFrames:
 			logger.exception('error in DataFrames._read_in_model_parameters')
 			raise
 
-	def read_in_model_parameters(self):
+	cdef void _read_in_constant_parameters(
+			self,
+			l4_float_t[:] pvalues,
+			int8_t[:] hvalues,
+	):
+		cdef:
+			int i, j
+		self.model_utility_co_const_alt_value[:] = 0
+		for j in range(self.model_utility_co_const_ptr.shape[0]-1):
+			for i in range(self.model_utility_co_const_ptr[j], self.model_utility_co_const_ptr[j+1]):
+				self.model_utility_co_const_param_holdfast[i] = hvalues[self.model_utility_co_const_param[i]]
+				self.model_utility_co_const_alt_value[j] += (
+					pvalues[self.model_utility_co_const_param[i]] * self.model_utility_co_const_param_scale[i]
+				)
+
+	def read_in_model_parameters(self, release=None):
+		"""
+		Read in the parameter values from the linked model.
+
+		Parameters
+		----------
+		release : Collection[int], optional
+			Positions in the parameter frame of parameters to treat as if
+			they were not holdfast, so that derivatives of utility with
+			respect to them are computed.
+		"""
+		cdef int n
 		self._read_in_model_parameters()
+		if release:
+			release = set(release)
+			for n in range(self.model_utility_ca_param_holdfast.shape[0]):
+				if self.model_utility_ca_param[n] in release:
+					self.model_utility_ca_param_holdfast[n] = 0
+			for n in range(self.model_utility_co_param_holdfast.shape[0]):
+				if self.model_utility_co_param[n] in release:
+					self.model_utility_co_param_holdfast[n] = 0
+			for n in range(self.model_utility_co_const_param_holdfast.shape[0]):
+				if self.model_utility_co_const_param[n] in release:
+					self.model_utility_co_const_param_holdfast[n] = 0
 
 	def _debug_arrays(self):
 		from .util import dictx
@@ -1847,6 +2036,9 @@ cdef class DataFrames:
 			model_utility_co_alt     = self.model_utility_co_alt.base   ,
 			model_utility_co_param   = self.model_utility_co_param.base ,
 			model_utility_co_data    = self.model_utility_co_data.base  ,
+			model_utility_co_const_ptr   = self.model_utility_co_const_ptr.base,
+			model_utility_co_const_param = self.model_utility_co_const_param.base,
+			model_utility_co_const_alt_value = self.model_utility_co_const_alt_value.base,
 			model_quantity_ca_param  = self.model_quantity_ca_param.base,
 			model_quantity_ca_data   = self.model_quantity_ca_data.base ,
 			model_quantity_scale_param = self.model_quantity_scale_param,
@@ -1922,6 +2114,7 @@ cdef class DataFrames:
 		cdef:
 			int i,j,k, altindex
 			int64_t row = -2
+			int n_const_alts = self.model_utility_co_const_ptr.shape[0] - 1
 			l4_float_t  _temp, _temp_data, _max_U=0
 
 		if not self._is_computational_ready(activate=True):
@@ -1945,10 +2138,13 @@ cdef class DataFrames:
 
 				if self.model_quantity_ca_param.shape[0]:
 					for i in range(self.model_quantity_ca_param.shape[0]):
-						if row >= 0:
-							_temp = self._array_ce[row, self.model_quantity_ca_data[i]]
+						k = self.model_quantity_ca_data[i]
+						if k < 0:
+							_temp = self._skim_flat[self._skim_rowbase[-1-k, c] + self._skim_cols[-1-k, j]]
+						elif row >= 0:
+							_temp = self._array_ce[row, k]
 						else:
-							_temp = self._array_ca[c, j, self.model_quantity_ca_data[i]]
+							_temp = self._array_ca[c, j, k]
 						_temp *= self.model_quantity_ca_param_value[i] * self.model_quantity_ca_param_scale[i]
 						U[j] += _temp
 						if not self.model_quantity_ca_param_holdfast[i]:
@@ -1969,29 +2165,33 @@ cdef class DataFrames:
 						dU[j,self.model_quantity_scale_param] += _temp
 
 				for i in range(self.model_utility_ca_param.shape[0]):
-					if row >= 0:
-						_temp = self._array_ce[row, self.model_utility_ca_data[i]]
+					k = self.model_utility_ca_data[i]
+					if k < 0:
+						_temp = self._skim_flat[self._skim_rowbase[-1-k, c] + self._skim_cols[-1-k, j]]
+					elif row >= 0:
+						_temp = self._array_ce[row, k]
 					else:
-						_temp = self._array_ca[c, j, self.model_utility_ca_data[i]]
+						_temp = self._array_ca[c, j, k]
 					_temp *= self.model_utility_ca_param_scale[i]
 					U[j] += _temp * self.model_utility_ca_param_value[i]
 					if not self.model_utility_ca_param_holdfast[i]:
 						dU[j,self.model_utility_ca_param[i]] += _temp
+
+				if j < n_const_alts:
+					U[j] += self.model_utility_co_const_alt_value[j]
+					for i in range(self.model_utility_co_const_ptr[j], self.model_utility_co_const_ptr[j+1]):
+						if not self.model_utility_co_const_param_holdfast[i]:
+							dU[j,self.model_utility_co_const_param[i]] += self.model_utility_co_const_param_scale[i]
 			else:
 				U[j] = -INFINITY32
 
 		for i in range(self.model_utility_co_alt.shape[0]):
 			altindex = self.model_utility_co_alt[i]
 			if self._array_av[c,altindex]:
-				if self.model_utility_co_data[i] == -1:
-					U[altindex] += self.model_utility_co_param_value[i] * self.model_utility_co_param_scale[i]
-					if not self.model_utility_co_param_holdfast[i]:
-						dU[altindex,self.model_utility_co_param[i]] += self.model_utility_co_param_scale[i]
-				else:
-					_temp = self._array_co[c, self.model_utility_co_data[i]] * self.model_utility_co_param_scale[i]
-					U[altindex] += _temp * self.model_utility_co_param_value[i]
-					if not self.model_utility_co_param_holdfast[i]:
-						dU[altindex,self.model_utility_co_param[i]] += _temp
+				_temp = self._array_co[c, self.model_utility_co_data[i]] * self.model_utility_co_param_scale[i]
+				U[altindex] += _temp * self.model_utility_co_param_value[i]
+				if not self.model_utility_co_param_holdfast[i]:
+					dU[altindex,self.model_utility_co_param[i]] += _temp
 
 		# Keep exp(U) from generating overflow
 		for j in range(n_alts):
@@ -2026,6 +2226,7 @@ cdef class DataFrames:
 		cdef:
 			int i,j,k, altindex
 			int64_t row = -2
+			int n_const_alts = self.model_utility_co_const_ptr.shape[0] - 1
 			l4_float_t  _temp, _temp_data, _max_U
 
 		if not self._is_computational_ready(activate=True):
@@ -2048,10 +2249,13 @@ cdef class DataFrames:
 
 				if self.model_quantity_ca_param.shape[0]:
 					for i in range(self.model_quantity_ca_param.shape[0]):
-						if row >= 0:
-							_temp = self._array_ce[row, self.model_quantity_ca_data[i]]
+						k = self.model_quantity_ca_data[i]
+						if k < 0:
+							_temp = self._skim_flat[self._skim_rowbase[-1-k, c] + self._skim_cols[-1-k, j]]
+						elif row >= 0:
+							_temp = self._array_ce[row, k]
 						else:
-							_temp = self._array_ca[c, j, self.model_quantity_ca_data[i]]
+							_temp = self._array_ca[c, j, k]
 						_temp *= self.model_quantity_ca_param_value[i] * self.model_quantity_ca_param_scale[i]
 						U[j] += _temp
 
@@ -2064,23 +2268,26 @@ cdef class DataFrames:
 					U[j] = _temp * self.model_quantity_scale_param_value
 
 				for i in range(self.model_utility_ca_param.shape[0]):
-					if row >= 0:
-						_temp = self._array_ce[row, self.model_utility_ca_data[i]]
+					k = self.model_utility_ca_data[i]
+					if k < 0:
+						_temp = self._skim_flat[self._skim_rowbase[-1-k, c] + self._skim_cols[-1-k, j]]
+					elif row >= 0:
+						_temp = self._array_ce[row, k]
 					else:
-						_temp = self._array_ca[c, j, self.model_utility_ca_data[i]]
+						_temp = self._array_ca[c, j, k]
 					_temp *= self.model_utility_ca_param_scale[i]
 					U[j] += _temp * self.model_utility_ca_param_value[i]
+
+				if j < n_const_alts:
+					U[j] += self.model_utility_co_const_alt_value[j]
 			else:
 				U[j] = -INFINITY32
 
 		for i in range(self.model_utility_co_alt.shape[0]):
 			altindex = self.model_utility_co_alt[i]
 			if self._array_av[c,altindex]:
-				if self.model_utility_co_data[i] == -1:
-					U[altindex] += self.model_utility_co_param_value[i] * self.model_utility_co_param_scale[i]
-				else:
-					_temp = self._array_co[c, self.model_utility_co_data[i]] * self.model_utility_co_param_scale[i]
-					U[altindex] += _temp * self.model_utility_co_param_value[i]
+				_temp = self._array_co[c, self.model_utility_co_data[i]] * self.model_utility_co_param_scale[i]
+				U[altindex] += _temp * self.model_utility_co_param_value[i]
 
 		# Keep exp(U) from generating overflow
 		for j in range(n_alts):
@@ -2157,7 +2364,7 @@ cdef class DataFrames:
 		"""
 
 		cdef:
-			int i,j
+			int i,j,k
 			int64_t row = -2
 			l4_float_t  _temp
 
@@ -2178,10 +2385,13 @@ cdef class DataFrames:
 
 					if self.model_quantity_ca_param.shape[0]:
 						for i in range(self.model_quantity_ca_param.shape[0]):
-							if row >= 0:
-								_temp = self._array_ce[row, self.model_quantity_ca_data[i]]
+							k = self.model_quantity_ca_data[i]
+							if k < 0:
+								_temp = self._skim_flat[self._skim_rowbase[-1-k, c] + self._skim_cols[-1-k, j]]
+							elif row >= 0:
+								_temp = self._array_ce[row, k]
 							else:
-								_temp = self._array_ca[c, j, self.model_quantity_ca_data[i]]
+								_temp = self._array_ca[c, j, k]
 							if _temp:
 								Q[j] = 0
 								break # stop searching for non-zero quant vars in this alt
@@ -2209,7 +2419,7 @@ cdef class DataFrames:
 		"""
 
 		cdef:
-			int i
+			int i,k
 			int64_t row = -2
 			l4_float_t  _temp
 			bint result = True
@@ -2224,10 +2434,13 @@ cdef class DataFrames:
 
 			if self.model_quantity_ca_param.shape[0]:
 				for i in range(self.model_quantity_ca_param.shape[0]):
-					if row >= 0:
-						_temp = self._array_ce[row, self.model_quantity_ca_data[i]]
+					k = self.model_quantity_ca_data[i]
+					if k < 0:
+						_temp = self._skim_flat[self._skim_rowbase[-1-k, c] + self._skim_cols[-1-k, j]]
+					elif row >= 0:
+						_temp = self._array_ce[row, k]
 					else:
-						_temp = self._array_ca[c, j, self.model_quantity_ca_data[i]]
+						_temp = self._array_ca[c, j, k]
 					if _temp:
 						result = False
 						break # stop searching for non-zero quant vars in this alt
@@ -2562,6 +2775,85 @@ cdef class DataFrames:
 			logger.warning(f'dropping weight normalization factor of {self._weight_normalization}')
 		self._weight_normalization = 1.0
 
+	def fingerprint(self):
+		"""
+		A content fingerprint of the choice, availability, and weight arrays.
+
+		Reference log likelihoods that depend only on these arrays (e.g. the
+		log likelihood with no model at all) can be cached under this
+		fingerprint and shared by every model using the same data.
+
+		Returns
+		-------
+		str
+		"""
+		import hashlib
+		if self._array_ch is None or self._array_av is None:
+			raise MissingDataError('fingerprint requires data_ch and data_av')
+		h = hashlib.blake2b(digest_size=20)
+		for arr in (self._array_ch, self._array_av, self._array_wt):
+			if arr is None:
+				h.update(b'none')
+				continue
+			arr = numpy.ascontiguousarray(arr)
+			h.update(f"{arr.dtype.str}{arr.shape}".encode())
+			h.update(arr.data)
+		h.update(repr(float(self._weight_normalization)).encode())
+		return h.hexdigest()
+
+	def _arrays_for_closed_form(self):
+		if self._array_ch is None or self._array_av is None:
+			raise MissingDataError('closed form log likelihood requires data_ch and data_av')
+		ch = numpy.asarray(self._array_ch)
+		av = numpy.asarray(self._array_av) != 0
+		if self._array_wt is None:
+			wt = numpy.ones(ch.shape[0], dtype=ch.dtype)
+		else:
+			wt = numpy.asarray(self._array_wt)
+		keep = wt != 0
+		return ch[keep], av[keep, :ch.shape[1]], wt[keep]
+
+	def _closed_form_loglike_nil(self):
+		"""
+		The log likelihood with equal probability for every available alternative.
+
+		This is the log likelihood of a model with no explanatory data and no
+		structure, computed directly from the choice, availability, and weight
+		arrays without evaluating any utility.
+		"""
+		ch, av, wt = self._arrays_for_closed_form()
+		if numpy.any((ch != 0) & ~av):
+			return -numpy.inf
+		n_av = av.sum(1)
+		with numpy.errstate(divide='ignore'):
+			ll_case = -numpy.log(n_av) * ch.sum(1)
+		ll_case[ch.sum(1) == 0] = 0
+		return float(numpy.sum(ll_case * wt) * self._weight_normalization)
+
+	def _closed_form_loglike_constants_only(self):
+		"""
+		The log likelihood of a MNL model with only alternative specific constants.
+
+		If every alternative that is available in any case is available in
+		every case, the maximum likelihood probabilities of this model are the
+		weighted choice shares, and the log likelihood has a closed form.
+
+		Returns
+		-------
+		float or None
+			None if availability varies across cases, so there is no closed form.
+		"""
+		ch, av, wt = self._arrays_for_closed_form()
+		ever_available = av.any(0)
+		if not numpy.all(av[:, ever_available]):
+			return None
+		if numpy.any(ch[:, ~ever_available] != 0):
+			return -numpy.inf
+		shares = (ch[:, ever_available] * wt[:, None]).sum(0)
+		total = shares.sum()
+		shares = shares[shares > 0]
+		return float(numpy.sum(shares * numpy.log(shares / total)) * self._weight_normalization)
+
 	@property
 	def std_scaler_co(self):
 		return self._std_scaler_co
@@ -2687,12 +2979,159 @@ cdef class DataFrames:
 					wt_name=self._data_wt_name,
 					av_name=self._data_av_name,
 				))
+				for skim_name, (matrix, rows, cols) in self._skims.items():
+					result[-1].add_skim_ca(skim_name, matrix, rows[these_positions], cols)
 			logger.debug(f'done splitting dataframe {splits}')
 			return result
 		except:
 			logger.exception('error in DataFrames.split')
 			raise
 
+	def compress_cases(self):
+		"""
+		Collapse cases with identical data into one case each.
+
+		Cases are identical when their |idco| and |idca| data, availability,
+		and skim origins all match; they may differ in the chosen alternative
+		and weight.  Each group of identical cases becomes a single case
+		whose weight is the total weight of the group, and whose choices are
+		the weighted average choices of the group, so the log likelihood and
+		its gradient are unchanged while the model evaluates each distinct
+		case only once.  The BHHH matrix, which sums outer products of
+		per-case gradients, is computed per group and so will differ.
+
+		Returns
+		-------
+		DataFrames
+			The compressed data.  Its `case_groups` maps each original case
+			to the case that represents its group.
+		"""
+		cdef DataFrames result
+		try:
+			if self._array_ch is None or self._array_av is None:
+				raise MissingDataError('compress_cases requires data_ch and data_av')
+			if self._data_ce is not None:
+				raise NotImplementedError('compress_cases does not support idce data')
+
+			n_cases = self._n_cases()
+			key_parts = []
+			if self._array_co is not None:
+				key_parts.append(numpy.asarray(self._array_co))
+			elif self._data_co is not None:
+				key_parts.append(self.array_co(dtype=numpy.float64))
+			if self._array_ca is not None:
+				key_parts.append(numpy.asarray(self._array_ca))
+			elif self._data_ca is not None:
+				key_parts.append(self.array_ca(dtype=numpy.float64))
+			key_parts.append(numpy.asarray(self._array_av))
+			for skim_name, (matrix, rows, cols) in self._skims.items():
+				key_parts.append(numpy.asarray(rows))
+			key = numpy.concatenate([
+				numpy.ascontiguousarray(k).reshape(n_cases, -1).view(numpy.uint8)
+				for k in key_parts
+			], axis=1)
+			if key.shape[1] % 8:
+				key = numpy.pad(key, ((0,0),(0, 8 - key.shape[1] % 8)))
+			key = numpy.ascontiguousarray(key).view(numpy.uint64)
+
+			# Group by a 64-bit hash of each row, then confirm that every
+			# row matches its group representative exactly.
+			row_hash = numpy.zeros(n_cases, dtype=numpy.uint64)
+			for k in range(key.shape[1]):
+				row_hash = row_hash * numpy.uint64(1099511628211) + pandas.util.hash_array(key[:,k])
+			group, _ = pandas.factorize(row_hash)
+			n_groups = int(group.max()) + 1 if n_cases else 0
+			representative = numpy.empty(n_groups, dtype=numpy.int64)
+			representative[group[::-1]] = numpy.arange(n_cases)[::-1]
+			if not numpy.array_equal(key[representative[group]], key):
+				keyv = key.view(numpy.dtype((numpy.void, key.dtype.itemsize * key.shape[1]))).reshape(-1)
+				_, first, group = numpy.unique(keyv, return_index=True, return_inverse=True)
+				order = numpy.argsort(first)
+				representative = first[order]
+				group = numpy.argsort(order)[group]
+				n_groups = representative.shape[0]
+
+			ch = numpy.asarray(self._array_ch)
+			if self._array_wt is None:
+				wt = numpy.ones(n_cases, dtype=ch.dtype)
+			else:
+				wt = numpy.asarray(self._array_wt)
+			group_wt = numpy.bincount(group, weights=wt, minlength=n_groups)
+			group_ch = numpy.stack([
+				numpy.bincount(group, weights=ch[:,j] * wt, minlength=n_groups)
+				for j in range(ch.shape[1])
+			], axis=1)
+			nonzero = group_wt != 0
+			group_ch[nonzero] /= group_wt[nonzero, None]
+
+			caseindex = self.caseindex
+			data_co = None if self.data_co is None else self.data_co.iloc[representative, :]
+			if self.data_ca is None:
+				data_ca = None
+			else:
+				data_ca = self.data_ca.iloc[numpy.in1d(self.data_ca.index.codes[0], representative), :]
+			data_av = self.data_av.iloc[representative, :]
+			data_ch = pandas.DataFrame(
+				group_ch,
+				index=caseindex[representative],
+				columns=self.data_ch.columns,
+			)
+			data_wt = pandas.DataFrame(
+				group_wt,
+				index=caseindex[representative],
+				columns=[self._data_wt_name or 'computed_weight'],
+			)
+			result = self.__class__(
+				data_co=data_co,
+				data_ca=data_ca,
+				data_av=data_av,
+				data_ch=data_ch,
+				data_wt=data_wt,
+				alt_names = self.alternative_names(),
+				alt_codes = self.alternative_codes(),
+				sys_alts=self.sys_alts,
+				ch_name=self._data_ch_name,
+				wt_name=self._data_wt_name or 'computed_weight',
+				av_name=self._data_av_name,
+			)
+			result._weight_normalization = self._weight_normalization
+			for skim_name, (matrix, rows, cols) in self._skims.items():
+				result.add_skim_ca(skim_name, matrix, rows[representative], cols)
+			result._case_groups = pandas.Series(
+				caseindex[representative][group],
+				index=caseindex,
+				name='group',
+			)
+			logger.debug(f'compressed {n_cases} cases into {n_groups}')
+			return result
+		except:
+			logger.exception('error in DataFrames.compress_cases')
+			raise
+
+	def case_work(self):
+		"""
+		The relative computational work of each case.
+
+		This is the number of available alternatives in each case, plus one
+		for the fixed overhead of each case.  It is computed once and cached
+		until the availability data is changed.
+
+		Returns
+		-------
+		ndarray of int64
+		"""
+		if self._case_work is None:
+			if self._data_av is None:
+				self._case_work = numpy.ones(self.n_cases, dtype=numpy.int64)
+			else:
+				self._case_work = numpy.asarray(self._array_av).sum(1, dtype=numpy.int64) + 1
+		return self._case_work
+
+	@property
+	def case_groups(self):
+		"""pandas.Series or None : For compressed data, the representative case of each original case."""
+		return self._case_groups
+
 	def make_idca(self, *columns, selector=None, float_dtype=numpy.float64):
 		"""
 		Extract a set of idca values into a new dataframe.
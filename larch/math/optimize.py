@@ -253,4 +253,192 @@ def check_gradient(func, grad, x0, epsilon=None, names=None, require_sim=None, s
 def assert_gradient_check(*args, min_similarity=4, **kwargs):
 	kwargs['stylize'] = False
 	df = check_gradient(*args, **kwargs)
-	assert df['similarity'].min() >= min_similarity
\ No newline at end of file
+	assert df['similarity'].min() >= min_similarity
+
+def _trust_region_step(g, eigval, eigvec, radius):
+	"""
+	Solve the trust region subproblem from an eigendecomposition.
+
+	Finds the step `p` that maximizes ``g @ p - 0.5 * p @ B @ p`` subject to
+	``|p| <= radius``, where ``B = eigvec @ diag(eigval) @ eigvec.T`` is
+	positive semi-definite.  The decomposition is computed once per
+	iterate, so rejected steps re-solve the subproblem for a smaller
+	radius without refactoring the matrix.
+
+	Returns
+	-------
+	p : ndarray
+	on_boundary : bool
+	"""
+	gt = eigvec.T @ g
+	tiny = numpy.finfo(float).eps * max(eigval.max(initial=0), 1.0)
+	if eigval.min(initial=numpy.inf) > tiny:
+		p = eigvec @ (gt / eigval)
+		if numpy.linalg.norm(p) <= radius:
+			return p, False
+	# Newton iteration on the secular equation 1/|p(lam)| - 1/radius = 0,
+	# which is nearly linear in lam.
+	lam = max(0.0, -eigval.min(initial=0)) + tiny
+	for _ in range(50):
+		d = eigval + lam
+		pnorm = numpy.sqrt(numpy.sum((gt / d) ** 2))
+		if pnorm == 0:
+			break
+		dpnorm = -numpy.sum(gt ** 2 / d ** 3) / pnorm
+		step = (pnorm - radius) / radius * pnorm / (-dpnorm)
+		lam_new = max(lam + step, lam * 0.1)
+		if abs(lam_new - lam) <= 1e-10 * max(lam, 1.0):
+			lam = lam_new
+			break
+		lam = lam_new
+	return eigvec @ (gt / (eigval + lam)), True
+
+
+def trust_region_bhhh(
+		fun,
+		x0,
+		bounds=None,
+		holdfast=None,
+		ctol=1e-5,
+		maxiter=100,
+		initial_radius=None,
+		max_radius=1e4,
+		eta=1e-4,
+		callback=None,
+):
+	"""
+	Maximize a function with a trust region method using a BHHH matrix.
+
+	Each iteration consumes the value, gradient, and BHHH (or other
+	positive semi-definite negative-Hessian) approximation from a single
+	call to `fun`, so every function evaluation is one pass over the data.
+	The matrix is eigendecomposed once per accepted iterate, and that
+	decomposition is reused to re-solve the subproblem whenever a trial
+	step is rejected and the radius shrinks.
+
+	Parameters
+	----------
+	fun : callable
+		Called as ``fun(x)``, it returns a 3-tuple of the objective value
+		to maximize, its gradient, and the BHHH matrix at `x`.
+	x0 : array-like
+		Starting values.
+	bounds : scipy.optimize.Bounds or 2-tuple of array-like, optional
+		Lower and upper bounds on the parameters.  Trial points are
+		projected onto the bounds, and parameters sitting on a bound
+		whose gradient points outward are held there for the iteration.
+	holdfast : array-like of bool, optional
+		Parameters that are not changed.
+	ctol : float, default 1e-5
+		Convergence tolerance on ``g @ inv(B) @ g`` over the free
+		parameters, the same measure used by `simple_fit_bhhh`.
+	maxiter : int, default 100
+		Maximum number of accepted steps.
+	initial_radius : float, optional
+		The initial trust region radius.  Defaults to the length of the
+		first full BHHH step.
+	max_radius : float, default 1e4
+		The trust region radius is never expanded beyond this.
+	eta : float, default 1e-4
+		Trial steps are accepted when the ratio of actual to predicted
+		improvement exceeds this value.
+	callback : callable, optional
+		Called as ``callback(x)`` after each accepted step.
+
+	Returns
+	-------
+	dict
+		With keys 'loglike', 'x', 'tolerance', 'n_iters', 'n_evaluations',
+		'message', and 'success'.
+	"""
+	x = numpy.array(x0, dtype=numpy.float64)
+	n = x.size
+	if bounds is None:
+		lower = numpy.full(n, -numpy.inf)
+		upper = numpy.full(n, numpy.inf)
+	else:
+		try:
+			lower, upper = bounds.lb, bounds.ub
+		except AttributeError:
+			lower, upper = bounds
+		lower = numpy.broadcast_to(numpy.asarray(lower, dtype=numpy.float64), (n,))
+		upper = numpy.broadcast_to(numpy.asarray(upper, dtype=numpy.float64), (n,))
+	if holdfast is None:
+		holdfast = numpy.zeros(n, dtype=bool)
+	else:
+		holdfast = numpy.asarray(holdfast, dtype=bool)
+	lower = numpy.where(holdfast, x, lower)
+	upper = numpy.where(holdfast, x, upper)
+	x = numpy.clip(x, lower, upper)
+
+	def evaluate(x_):
+		f_, g_, b_ = fun(x_)
+		return float(f_), numpy.asarray(g_, dtype=numpy.float64), numpy.asarray(b_, dtype=numpy.float64)
+
+	f, g, b = evaluate(x)
+	n_evaluations = 1
+	radius = initial_radius
+	n_iters = 0
+	tolerance = numpy.inf
+	message = None
+
+	while True:
+		active = holdfast | ((x <= lower) & (g < 0)) | ((x >= upper) & (g > 0))
+		free = ~active
+		g_free = g[free]
+		b_free = b[numpy.ix_(free, free)]
+		eigval, eigvec = numpy.linalg.eigh(b_free)
+		eigval = numpy.clip(eigval, 0, None)
+		gt = eigvec.T @ g_free
+		positive = eigval > numpy.finfo(float).eps * max(eigval.max(initial=0), 1.0)
+		tolerance = numpy.sum(gt[positive] ** 2 / eigval[positive])
+		if tolerance <= ctol:
+			message = "Optimization terminated successfully."
+			break
+		if n_iters >= maxiter:
+			message = f"Optimization terminated after {n_iters} iterations."
+			break
+		if radius is None:
+			radius = min(numpy.linalg.norm(eigvec[:, positive] @ (gt[positive] / eigval[positive])), max_radius)
+
+		while True:
+			p_free, on_boundary = _trust_region_step(g_free, eigval, eigvec, radius)
+			p = numpy.zeros(n)
+			p[free] = p_free
+			x_trial = numpy.clip(x + p, lower, upper)
+			p = (x_trial - x)[free]
+			predicted = g_free @ p - 0.5 * p @ b_free @ p
+			if predicted <= 0 or not numpy.isfinite(predicted):
+				radius *= 0.25
+				if radius < 1e-12:
+					break
+				continue
+			f_trial, g_trial, b_trial = evaluate(x_trial)
+			n_evaluations += 1
+			rho = (f_trial - f) / predicted if numpy.isfinite(f_trial) else -numpy.inf
+			if rho < 0.25:
+				radius = 0.25 * numpy.linalg.norm(p)
+			elif rho > 0.75 and on_boundary:
+				radius = min(2.0 * radius, max_radius)
+			if rho > eta:
+				break
+			if radius < 1e-12:
+				break
+
+		if radius < 1e-12:
+			message = "Optimization terminated because the trust region collapsed."
+			break
+		x, f, g, b = x_trial, f_trial, g_trial, b_trial
+		n_iters += 1
+		if callback is not None:
+			callback(x)
+
+	return {
+		'loglike': f,
+		'x': x,
+		'tolerance': tolerance,
+		'n_iters': n_iters,
+		'n_evaluations': n_evaluations,
+		'message': message,
+		'success': tolerance <= ctol,
+	}
@@ -9,12 +9,21 @@ from ..general_precision cimport l4_float_t
 from .parameter_frame cimport ParameterFrame
 from .persist_flags cimport *
 from ..exceptions import MissingDataError, BHHHSimpleStepFailure
+from . import reference_cache
 
 import logging
 from ..log import logger_name
 logger = logging.getLogger(logger_name+'.model')
 
 
+class _EstimationStopped(Exception):
+	"""Raised from an optimizer callback to end an estimation at `x`."""
+
+	def __init__(self, x):
+		super().__init__()
+		self.x = x
+
+
 cdef class AbstractChoiceModel(ParameterFrame):
 
 	def __init__(
@@ -261,10 +270,118 @@ cdef class AbstractChoiceModel(ParameterFrame):
 		bhhh_inv = self._free_slots_inverse_matrix(self.bhhh(*args))
 		return numpy.dot(self.d_loglike(*args), bhhh_inv)
 
+	def _loglike_along_direction(self, direction, steps, leave_out=-1, keep_only=-1, subsample=-1):
+		"""
+		Compute the log likelihood at several step lengths along a direction.
+
+		This generic implementation makes one pass over the data for each
+		step length.  Derived classes may override it to evaluate all the
+		step lengths in a single pass.  The parameter values are unchanged
+		when this method returns.
+
+		Parameters
+		----------
+		direction : array-like
+			The search direction, one value per parameter.
+		steps : array-like
+			Candidate step lengths.
+		leave_out, keep_only, subsample : int, optional
+			Settings for cross validation calculations, see :ref:`loglike`.
+
+		Returns
+		-------
+		ndarray
+			The log likelihood at each step length.
+		"""
+		current = self.pvals.copy()
+		result = numpy.empty(len(steps))
+		try:
+			for k, steplen in enumerate(steps):
+				self.set_values(current + direction * steplen)
+				result[k] = self.loglike(leave_out=leave_out, keep_only=keep_only, subsample=subsample)
+		finally:
+			self.set_values(current)
+		return result
+
+	def _loglike_coordinate_shifts(self, shifts):
+		"""
+		Compute the log likelihood with each parameter shifted in turn.
+
+		This generic implementation makes one pass over the data for each
+		non-zero shift.  Derived classes may override it to evaluate all
+		the shifts in a single pass.  The parameter values are unchanged
+		when this method returns.
+
+		Parameters
+		----------
+		shifts : array-like
+			The change to apply to each parameter, one value per parameter.
+
+		Returns
+		-------
+		ndarray
+			The log likelihood with each parameter shifted, or NaN where
+			the shift is zero.
+		"""
+		current = self.pvals.copy()
+		names = self.pnames
+		result = numpy.full(len(current), numpy.nan)
+		for k, shift in enumerate(shifts):
+			if shift != 0:
+				# set_value is used as it also changes holdfast parameters
+				self.set_value(names[k], current[k] + shift)
+				try:
+					result[k] = self.loglike()
+				finally:
+					self.set_value(names[k], current[k])
+		return result
+
+	def _line_search_ladder(
+			self,
+			direction,
+			current_ll,
+			steplen=1.0,
+			minimum_steplen=0.01,
+			ladder=4,
+			leave_out=-1,
+			keep_only=-1,
+			subsample=-1,
+	):
+		"""
+		Backtracking line search that evaluates a ladder of step lengths at once.
+
+		Step lengths `steplen`, `steplen/2`, `steplen/4`, ... are evaluated
+		together, `ladder` at a time, and the best one that improves on
+		`current_ll` is taken.  If none of them do, the next lower rung of
+		the ladder is tried, until the step would fall below `minimum_steplen`.
+
+		Returns
+		-------
+		steplen, loglike : float
+			The chosen step length and the log likelihood there, or
+			(None, None) if no acceptable step was found.
+		"""
+		while steplen >= minimum_steplen:
+			steps = steplen * 0.5 ** numpy.arange(ladder)
+			steps = steps[steps >= minimum_steplen]
+			lls = self._loglike_along_direction(
+				direction, steps,
+				leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+			)
+			best = numpy.argmax(numpy.where(numpy.isnan(lls), -numpy.inf, lls))
+			if lls[best] > current_ll:
+				return steps[best], lls[best]
+			steplen = steps[-1] * 0.5
+		return None, None
+
 	def simple_step_bhhh(self, steplen=1.0, printer=None, leave_out=-1, keep_only=-1, subsample=-1):
 		"""
 		Makes one step using the BHHH algorithm.
 
+		The step length is chosen by a backtracking line search that
+		evaluates several candidate step lengths in a single pass over
+		the data where the model allows it.
+
 		Parameters
 		----------
 		steplen: float
@@ -282,15 +399,16 @@ cdef class AbstractChoiceModel(ParameterFrame):
 		bhhh_inv = self._free_slots_inverse_matrix(current_bhhh)
 		direction = numpy.dot(current_dll, bhhh_inv)
 		tolerance = numpy.dot(direction, current_dll)
-		while True:
-			self.set_values(current + direction * steplen)
-			val = self.loglike()
-			if val > current_ll: break
-			steplen *= 0.5
-			if steplen < 0.01: break
-		if val <= current_ll:
+		steplen, val = self._line_search_ladder(
+			direction, current_ll, steplen=steplen, minimum_steplen=0.01,
+			leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+		)
+		if steplen is None:
 			self.set_values(current)
 			raise BHHHSimpleStepFailure("simple step bhhh failed")
+		self.set_values(current + direction * steplen)
+		if leave_out == -1 and keep_only == -1:
+			self._check_if_best(val)
 		if printer is not None:
 			printer("simple step bhhh {} to gain {}".format(steplen, val - current_ll))
 		return val, tolerance
@@ -320,6 +438,78 @@ cdef class AbstractChoiceModel(ParameterFrame):
 
 
 
+	def warm_start_bhhh(
+			self,
+			schedule=((64, 3), (16, 3), (4, 3)),
+			printer=None,
+			leave_out=-1,
+			keep_only=-1,
+			subsample=-1,
+	):
+		"""
+		Make stochastic BHHH steps on growing subsamples of cases.
+
+		Each step uses every `step_case`-th case, starting from a
+		rotating offset so that successive steps see different cases.
+		A step is taken along the BHHH direction computed on that
+		subsample, clipped to the parameter bounds, and is halved until
+		it improves the log likelihood of the same subsample; if no step
+		improves it after a few halvings, the step is skipped.
+
+		Parameters
+		----------
+		schedule : sequence of (int, int)
+			Pairs of (step_case, n_steps).  Stages are run in order, so
+			decreasing `step_case` values give growing batch sizes.  Stages
+			whose batches would have fewer cases than there are free
+			parameters are skipped.
+		printer : callable, optional
+
+		Returns
+		-------
+		n_steps : int
+			The number of steps taken.
+		passes : float
+			The data processed, measured in full passes over the data.
+		"""
+		n_cases = self.n_cases
+		n_free = int(numpy.sum(self.pf['holdfast'] == 0))
+		n_steps = 0
+		passes = 0.0
+		bounds = self.pbounds
+		for step_case, stage_steps in schedule:
+			step_case = int(step_case)
+			if step_case < 1 or n_cases // step_case < n_free:
+				continue
+			for k in range(int(stage_steps)):
+				start_case = k % step_case
+				batch = dict(
+					start_case=start_case, step_case=step_case,
+					leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+				)
+				batch_fraction = len(range(start_case, n_cases, step_case)) / n_cases
+				current = self.pvals.copy()
+				current_ll, current_dll, current_bhhh = self._loglike2_bhhh_tuple(**batch)
+				passes += batch_fraction
+				bhhh_inv = self._free_slots_inverse_matrix(current_bhhh)
+				direction = numpy.dot(current_dll, bhhh_inv)
+				if not numpy.all(numpy.isfinite(direction)):
+					continue
+				steplen = 1.0
+				for _ in range(4):
+					proposed = numpy.clip(current + direction * steplen, bounds.lb, bounds.ub)
+					proposed_ll = self.loglike(proposed, **batch)
+					passes += batch_fraction
+					if proposed_ll > current_ll:
+						n_steps += 1
+						if printer is not None:
+							printer(f"warm start step 1/{step_case} of cases, step {steplen} to gain {proposed_ll - current_ll}")
+						break
+					steplen *= 0.5
+				else:
+					self.set_values(current)
+		return n_steps, passes
+
 	def simple_fit_bhhh(
 			self,
 			steplen=1.0,
@@ -364,18 +554,34 @@ cdef class AbstractChoiceModel(ParameterFrame):
 
 		while abs(tolerance) > ctol and iter < maxiter:
 			iter += 1
-			while True:
+			# The full step is tried first, then the half step, as their BHHH
+			# matrix is needed anyhow if they are accepted.  If neither is, the
+			# shorter steps are evaluated together.
+			self.set_values(current_pvals + direction * steplen)
+			proposed_ll, proposed_dll, proposed_bhhh = self._loglike2_bhhh_tuple(leave_out=leave_out,
+																				 keep_only=keep_only,
+																				 subsample=subsample,
+																				 )
+			if not proposed_ll > current_ll and steplen * 0.5 >= minimum_steplen:
+				steplen *= 0.5
 				self.set_values(current_pvals + direction * steplen)
 				proposed_ll, proposed_dll, proposed_bhhh = self._loglike2_bhhh_tuple(leave_out=leave_out,
 																					 keep_only=keep_only,
 																					 subsample=subsample,
 																					 )
-				if proposed_ll > current_ll: break
-				steplen *= 0.5
-				if steplen < minimum_steplen: break
-			if proposed_ll <= current_ll:
+			if not proposed_ll > current_ll:
 				self.set_values(current_pvals)
-				raise BHHHSimpleStepFailure(f"simple step bhhh failed\ndirection = {str(direction)}")
+				steplen, _ = self._line_search_ladder(
+					direction, current_ll, steplen=steplen*0.5, minimum_steplen=minimum_steplen,
+					leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+				)
+				if steplen is None:
+					raise BHHHSimpleStepFailure(f"simple step bhhh failed\ndirection = {str(direction)}")
+				self.set_values(current_pvals + direction * steplen)
+				proposed_ll, proposed_dll, proposed_bhhh = self._loglike2_bhhh_tuple(leave_out=leave_out,
+																					 keep_only=keep_only,
+																					 subsample=subsample,
+																					 )
 			if printer is not None:
 				printer("simple step bhhh {} to gain {}".format(steplen, proposed_ll - current_ll))
 			steps.append(steplen)
@@ -395,6 +601,18 @@ cdef class AbstractChoiceModel(ParameterFrame):
 
 		return current_ll, tolerance, iter, numpy.asarray(steps), message
 
+	def _maximize_loglike_em(self, maxiter=100, ctol=1e-6, m_step_maxiter=25, finish_bhhh=0, callback=None):
+		"""
+		Maximize the log likelihood with the EM algorithm.
+
+		Only models with latent classes can be estimated this way.
+
+		Raises
+		------
+		NotImplementedError
+		"""
+		raise NotImplementedError(f'EM estimation is not available for {self.__class__.__name__}')
+
 	def _bhhh_direction_and_convergence_tolerance(self, *args):
 		bhhh_inv = self._free_slots_inverse_matrix(self.bhhh(*args))
 		_1 = self.d_loglike(*args)
@@ -605,6 +823,8 @@ cdef class AbstractChoiceModel(ParameterFrame):
 			leave_out=-1,
 			keep_only=-1,
 			subsample=-1,
+			warm_start=None,
+			callback=None,
 			**kwargs,
 	):
 		"""
@@ -617,18 +837,42 @@ cdef class AbstractChoiceModel(ParameterFrame):
 		----------
 		method : str, optional
 			The optimization method to use.  See scipy.optimize for
-			most possibilities, or use 'BHHH'. Defaults to SLSQP if
-			there are any constraints or finite parameter bounds,
-			otherwise defaults to BHHH.
+			most possibilities, or use 'BHHH', or 'trust-BHHH' for a
+			trust region method that uses the BHHH matrix and honors
+			parameter bounds, or 'EM' for the expectation-maximization
+			algorithm (latent class models only).  The trust region method
+			does not handle other constraints, so if the model has any, a
+			warning is given and SLSQP is used instead.
+			Defaults to SLSQP if there are any constraints or finite parameter
+			bounds, otherwise defaults to BHHH.
 		quiet : bool, default False
 			Whether to suppress the dashboard.
+		options : dict, optional
+			Options for the optimization method.  For 'EM', the keys
+			'maxiter', 'ctol', 'm_step_maxiter' and 'finish_bhhh' are passed
+			to the EM algorithm, see :meth:`LatentClassModel._maximize_loglike_em`.
+		warm_start : bool or sequence of (int, int), optional
+			Before the selected method runs, make stochastic BHHH steps on
+			subsamples of cases, using :meth:`warm_start_bhhh`.  Give a
+			schedule of (step_case, n_steps) pairs, or True to use the
+			default schedule.  The number of steps and the equivalent number
+			of full data passes are reported in the result as
+			'warm_start_steps' and 'warm_start_passes'.
+		callback : callable, optional
+			Called as ``callback(x)`` after each iteration of the selected
+			method, with the current parameter values.  If it returns True,
+			the estimation stops there, and the result has 'stopped' set
+			to True.
 
 		Returns
 		-------
 		dictx
 			A dictionary of results, including final log likelihood,
 			elapsed time, and other statistics.  The exact items
-			included in output will vary by estimation method.
+			included in output will vary by estimation method.  If the
+			model's `profiling` is on, the item 'profile' summarizes the
+			time and work of the likelihood evaluations made during this
+			estimation, see :meth:`ComputeProfile.summary`.
 
 		Raises
 		------
@@ -659,6 +903,9 @@ cdef class AbstractChoiceModel(ParameterFrame):
 				options['maxiter'] = maxiter
 
 			timer = Timer()
+			profile = getattr(self, 'profile', None)
+			if profile is not None:
+				profile_baseline = profile.copy()
 			if isinstance(screen_update_throttle, NonBlockingRateLimiter):
 				throttle_gate = screen_update_throttle
 			else:
@@ -676,6 +923,8 @@ cdef class AbstractChoiceModel(ParameterFrame):
 				tag2 = display_nothing()
 				tag3 = display_nothing()
 
+			user_callback = callback
+
 			def callback(x, status=None):
 				nonlocal iteration_number, throttle_gate
 				iteration_number += 1
@@ -684,23 +933,47 @@ cdef class AbstractChoiceModel(ParameterFrame):
 					tag1.update(f'Iteration {iteration_number:03} {iteration_number_tail}')
 					tag2.update(f'LL = {self._cached_loglike_best}')
 					tag3.update(self.pf)
+				if user_callback is not None and user_callback(x):
+					raise _EstimationStopped(x)
 				return False
 
-			if quiet or _doctest_mode_:
+			if (quiet or _doctest_mode_) and user_callback is None:
 				callback = None
 
+			def stopped_result(stop):
+				self.set_values(stop.x)
+				return {
+					'loglike': self.loglike(leave_out=leave_out, keep_only=keep_only, subsample=subsample),
+					'x': self.pvals,
+					'message': 'Optimization stopped by callback.',
+					'stopped': True,
+				}
+
 			if method is None:
 				if self.constraints or numpy.isfinite(self.pf['minimum'].max()) or numpy.isfinite(self.pf['maximum'].min()):
 					method = 'slsqp'
 				else:
 					method = 'bhhh'
 
-			if method2 is None and method.lower() == 'bhhh':
+			if method2 is None and method.lower() in ('bhhh', 'trust-bhhh', 'em'):
 				method2 = 'slsqp'
 
 			method_used = method
 			raw_result = None
 
+			warm_start_steps, warm_start_passes = 0, 0.0
+			if warm_start:
+				warm_start_kwargs = {} if warm_start is True else {'schedule': warm_start}
+				try:
+					warm_start_steps, warm_start_passes = self.warm_start_bhhh(
+						leave_out=leave_out,
+						keep_only=keep_only,
+						subsample=subsample,
+						**warm_start_kwargs,
+					)
+				except NotImplementedError:
+					pass
+
 			if method.lower()=='bhhh':
 				try:
 					max_iter = options.get('maxiter',100)
@@ -735,12 +1008,74 @@ cdef class AbstractChoiceModel(ParameterFrame):
 					if method2 is not None:
 						method_used = f"{method_used}|{method2}"
 						method = method2
+				except _EstimationStopped as stop:
+					raw_result = stopped_result(stop)
+				except:
+					tag1.update(f'Iteration {iteration_number:03} [Exception] {iteration_number_tail}', force=True)
+					tag3.update(self.pf, force=True)
+					raise
+
+			if method.lower()=='trust-bhhh' and self.constraints:
+				import warnings
+				warnings.warn("the trust-BHHH method does not honor model constraints, using SLSQP instead", stacklevel=2)
+				method_used = 'slsqp'
+				method = 'slsqp'
+
+			if method.lower()=='trust-bhhh':
+				try:
+					from ..math.optimize import trust_region_bhhh
+					raw_result = trust_region_bhhh(
+						lambda x: self._loglike2_bhhh_tuple(
+							x, leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+						),
+						self.pvals,
+						bounds=self.pbounds,
+						holdfast=self.pf['holdfast'].values.astype(bool),
+						ctol=options.get('ctol',1e-5),
+						maxiter=options.get('maxiter',100),
+						callback=callback,
+					)
+					self.set_values(raw_result['x'])
+				except NotImplementedError:
+					tag1.update(f'Iteration {iteration_number:03} [BHHH Not Available] {iteration_number_tail}', force=True)
+					tag3.update(self.pf, force=True)
+					raw_result = None
+					if method2 is not None:
+						method_used = f"{method2}"
+						method = method2
+				except _EstimationStopped as stop:
+					raw_result = stopped_result(stop)
+				except:
+					tag1.update(f'Iteration {iteration_number:03} [Exception] {iteration_number_tail}', force=True)
+					tag3.update(self.pf, force=True)
+					raise
+
+			if method.lower()=='em':
+				try:
+					if leave_out != -1 or keep_only != -1 or subsample != -1:
+						raise NotImplementedError('EM estimation does not support cross validation settings')
+					raw_result = self._maximize_loglike_em(
+						maxiter=options.get('maxiter',100),
+						ctol=options.get('ctol',1e-6),
+						m_step_maxiter=options.get('m_step_maxiter',25),
+						finish_bhhh=options.get('finish_bhhh',0),
+						callback=callback,
+					)
+				except NotImplementedError:
+					tag1.update(f'Iteration {iteration_number:03} [EM Not Available] {iteration_number_tail}', force=True)
+					tag3.update(self.pf, force=True)
+					raw_result = None
+					if method2 is not None:
+						method_used = f"{method2}"
+						method = method2
+				except _EstimationStopped as stop:
+					raw_result = stopped_result(stop)
 				except:
 					tag1.update(f'Iteration {iteration_number:03} [Exception] {iteration_number_tail}', force=True)
 					tag3.update(self.pf, force=True)
 					raise
 
-			if method.lower() != 'bhhh':
+			if method.lower() not in ('bhhh', 'trust-bhhh', 'em'):
 				try:
 					bounds = None
 					if isinstance(method,str) and method.lower() in ('slsqp', 'l-bfgs-b', 'tnc', 'trust-constr'):
@@ -763,6 +1098,8 @@ cdef class AbstractChoiceModel(ParameterFrame):
 						constraints=constraints,
 						**kwargs
 					)
+				except _EstimationStopped as stop:
+					raw_result = stopped_result(stop)
 				except:
 					tag1.update(f'Iteration {iteration_number:03} [Exception] {iteration_number_tail}', force=True)
 					tag3.update(self.pf, force=True)
@@ -771,7 +1108,8 @@ cdef class AbstractChoiceModel(ParameterFrame):
 			timer.stop()
 
 			if final_screen_update and not quiet and not _doctest_mode_ and raw_result is not None:
-				tag1.update(f'Iteration {iteration_number:03} [Converged] {iteration_number_tail}', force=True)
+				final_status = 'Stopped' if raw_result.get('stopped') else 'Converged'
+				tag1.update(f'Iteration {iteration_number:03} [{final_status}] {iteration_number_tail}', force=True)
 				tag2.update(f'LL = {self.loglike()}', force=True)
 				tag3.update(self.pf, force=True)
 
@@ -792,9 +1130,14 @@ cdef class AbstractChoiceModel(ParameterFrame):
 				else:
 					result[k] = v
 			result['elapsed_time'] = timer.elapsed()
+			if profile is not None:
+				result['profile'] = profile.summary(profile_baseline)
 			result['method'] = method_used
 			result['n_cases'] = self.n_cases
 			result['iteration_number'] = iteration_number
+			if warm_start:
+				result['warm_start_steps'] = warm_start_steps
+				result['warm_start_passes'] = warm_start_passes
 
 			if 'loglike' in result:
 				result['logloss'] = -result['loglike'] / self.total_weight()
@@ -876,6 +1219,98 @@ cdef class AbstractChoiceModel(ParameterFrame):
 			self._frame[f'cv_{fold:03d}'] = self._frame['value']
 		return ll_cv
 
+	def cross_validate_parallel(self, cv=5, n_jobs=None, start_values=None, **kwargs):
+		"""
+		A k-fold cross-validation that estimates the folds in parallel.
+
+		Like :meth:`cross_validate`, this method assumes that cases are
+		already ordered randomly, and assigns case rows to folds by
+		rownumber % cv.  Each fold is estimated in a worker process
+		forked from this one, so the loaded data is shared with the
+		workers rather than copied, and each fold starts from the
+		full-sample estimate.  The parameter values and frame of this
+		model are left unchanged.
+
+		On platforms where processes cannot be forked, or if `n_jobs`
+		is 1, the folds are estimated one after another in this process,
+		and the parameter frame is restored afterwards.
+
+		Parameters
+		----------
+		cv : int
+			The number of folds in k-fold cross-validation.
+		n_jobs : int, optional
+			The number of worker processes.  Defaults to the smaller of
+			`cv` and the number of CPUs.
+		start_values : {'null', 'init', 'best', array-like, dict, scalar}, optional
+			The values from which to start each fold.  If not given, the
+			full sample is estimated first, and that estimate is used.
+		**kwargs
+			All other keyword arguments are passed through to
+			`maximize_loglike`.
+
+		Returns
+		-------
+		dictx
+			The sum of the holdout log likelihoods is given by key 'loglike',
+			the holdout and training log likelihoods of each fold by
+			'holdout_loglike' and 'train_loglike', the estimated parameters of
+			each fold (as columns) by 'parameters', and the starting values
+			by 'start_values'.
+		"""
+		from ..util import dictx
+		from ..util.parallel import fork_map
+		import multiprocessing
+
+		kwargs['quiet'] = True
+		if n_jobs is None:
+			n_jobs = min(cv, multiprocessing.cpu_count())
+
+		saved_frame = self._frame.copy()
+		saved_best = self._cached_loglike_best
+		saved_result = self._most_recent_estimation_result
+		try:
+			n_threads = self.n_threads
+		except AttributeError:
+			n_threads = None
+		try:
+			if start_values is None:
+				self.maximize_loglike(**kwargs)
+			else:
+				self.set_values(start_values)
+			x0 = self.pvals.copy()
+
+			def fit_fold(fold):
+				if n_threads is not None and n_jobs > 1:
+					self.n_threads = max(1, n_threads // n_jobs)
+				self.set_values(x0)
+				r = self.maximize_loglike(leave_out=fold, subsample=cv, **kwargs)
+				return (
+					self.pvals.copy(),
+					self.loglike(keep_only=fold, subsample=cv),
+					r.get('loglike', numpy.nan),
+				)
+
+			fold_results = fork_map(fit_fold, range(cv), n_jobs=n_jobs)
+		finally:
+			self._frame = saved_frame
+			self._cached_loglike_best = saved_best
+			self._most_recent_estimation_result = saved_result
+			if n_threads is not None:
+				self.n_threads = n_threads
+
+		result = dictx()
+		result['holdout_loglike'] = pandas.Series([i[1] for i in fold_results], index=pandas.RangeIndex(cv, name='fold'))
+		result['train_loglike'] = pandas.Series([i[2] for i in fold_results], index=pandas.RangeIndex(cv, name='fold'))
+		result['loglike'] = result['holdout_loglike'].sum()
+		result['parameters'] = pandas.DataFrame(
+			numpy.stack([i[0] for i in fold_results], axis=1),
+			index=self.pnames,
+			columns=pandas.RangeIndex(cv, name='fold'),
+		)
+		result['start_values'] = pandas.Series(x0, index=self.pnames)
+		return result
+
 	def noop(self):
 		print("No op!")
 
@@ -893,8 +1328,9 @@ cdef class AbstractChoiceModel(ParameterFrame):
 		Parameters
 		----------
 		use_cache : bool, default True
-			Use the cached value if available.  Set to -1 to
-			raise an exception if there is no cached value.
+			Use the cached value if available, including a value computed
+			for another model on the same data.  Set to -1 to raise an
+			exception if there is no value cached on this model.
 
 		Returns
 		-------
@@ -904,12 +1340,46 @@ cdef class AbstractChoiceModel(ParameterFrame):
 			return self._cached_loglike_null
 		elif use_cache == -1:
 			raise ValueError("no cached value")
+		# When the utility of every alternative is zero at the null values,
+		# the null model is the same as no model at all, which has a closed
+		# form depending only on the data.
+		fingerprint = self._data_fingerprint() if self._null_utility_is_zero() else None
+		if fingerprint is not None and use_cache:
+			cached = reference_cache.get('nil', fingerprint)
+			if cached is not None:
+				self._cached_loglike_null = cached
+				return self._cached_loglike_null
+		if fingerprint is not None:
+			self._cached_loglike_null = self.dataframes._closed_form_loglike_nil()
+			reference_cache.put('nil', fingerprint, self._cached_loglike_null)
 		else:
 			current_parameters = self.get_values()
 			self.set_values('null')
 			self._cached_loglike_null = self.loglike()
 			self.set_values(current_parameters)
-			return self._cached_loglike_null
+		return self._cached_loglike_null
+
+	def _null_utility_is_zero(self):
+		"""
+		Whether the utility of every alternative is zero at the null values.
+
+		This generic implementation makes no such guarantee.  Derived classes
+		may override it when they can tell from the model structure.
+		"""
+		return False
+
+	def _data_fingerprint(self):
+		"""
+		The fingerprint of the choice, availability, and weight data, or None.
+		"""
+		from ..dataframes import DataFrames
+		dataframes = self.dataframes
+		if not isinstance(dataframes, DataFrames):
+			return None
+		try:
+			return dataframes.fingerprint()
+		except MissingDataError:
+			return None
 
 	def rho_sq_null(self, x=None, use_cache=True, adj=False):
 		"""
@@ -949,8 +1419,9 @@ cdef class AbstractChoiceModel(ParameterFrame):
 		Parameters
 		----------
 		use_cache : bool, default True
-			Use the cached value if available.  Set to -1 to
-			raise an exception if there is no cached value.
+			Use the cached value if available, including a value computed
+			for another model on the same data.  Set to -1 to raise an
+			exception if there is no value cached on this model.
 
 		Returns
 		-------
@@ -960,6 +1431,16 @@ cdef class AbstractChoiceModel(ParameterFrame):
 			return self._cached_loglike_nil
 		elif use_cache == -1:
 			raise ValueError("no cached loglike_nil")
+		fingerprint = self._data_fingerprint()
+		if fingerprint is not None and use_cache:
+			cached = reference_cache.get('nil', fingerprint)
+			if cached is not None:
+				self._cached_loglike_nil = cached
+				return self._cached_loglike_nil
+		if fingerprint is not None:
+			self._cached_loglike_nil = self.dataframes._closed_form_loglike_nil()
+			reference_cache.put('nil', fingerprint, self._cached_loglike_nil)
+			return self._cached_loglike_nil
 		else:
 			from .model import Model
 			nil = Model()
@@ -997,17 +1478,56 @@ cdef class AbstractChoiceModel(ParameterFrame):
 		return 1 - ((self.loglike(x=x)-k) / self.loglike_nil(use_cache=use_cache))
 
 
-	def loglike_constants_only(self):
-		raise NotImplementedError
-		# try:
-		# 	return self._cached_loglike_constants_only
-		# except AttributeError:
-		# 	mm = self.constants_only_model()
-		# 	from ..warning import ignore_warnings
-		# 	with ignore_warnings():
-		# 		result = mm.maximize_loglike(quiet=True, final_screen_update=False, check_for_overspecification=False)
-		# 	self._cached_loglike_constants_only = result.loglike
-		# 	return self._cached_loglike_constants_only
+	def loglike_constants_only(self, use_cache=True):
+		"""
+		Compute the log likelihood of a MNL model with only alternative specific constants.
+
+		If every alternative is either available in every case or never
+		available, this is computed in closed form from the weighted choice
+		shares.  Otherwise, a constants-only MNL model is estimated on
+		the same data.
+
+		Parameters
+		----------
+		use_cache : bool, default True
+			Use the cached value if available, including a value computed
+			for another model on the same data.  Set to -1 to raise an
+			exception if there is no value cached on this model.
+
+		Returns
+		-------
+		float
+		"""
+		if self._cached_loglike_constants_only != 0 and use_cache:
+			return self._cached_loglike_constants_only
+		elif use_cache == -1:
+			raise ValueError("no cached loglike_constants_only")
+		fingerprint = self._data_fingerprint()
+		if fingerprint is None:
+			raise ValueError('cannot access model.dataframes')
+		if use_cache:
+			cached = reference_cache.get('constants_only', fingerprint)
+			if cached is not None:
+				self._cached_loglike_constants_only = cached
+				return self._cached_loglike_constants_only
+		value = self.dataframes._closed_form_loglike_constants_only()
+		if value is None:
+			from .model import Model
+			from ..roles import P
+			from ..warning import ignore_warnings
+			ever_available = self.dataframes.data_av.any(axis=0)
+			codes = ever_available.index[ever_available.values]
+			mm = Model()
+			mm.dataservice = self.dataframes
+			for code in codes[1:]:
+				mm.utility_co[code] = P(f'ASC_{code}')
+			mm.load_data(log_warnings=False)
+			with ignore_warnings():
+				result = mm.maximize_loglike(quiet=True, final_screen_update=False, check_for_overspecification=False)
+			value = result.loglike
+		self._cached_loglike_constants_only = value
+		reference_cache.put('constants_only', fingerprint, value)
+		return self._cached_loglike_constants_only
 
 	def estimation_statistics(self, compute_loglike_null=True):
 		"""
@@ -1496,11 +2016,7 @@ cdef class AbstractChoiceModel(ParameterFrame):
 			if _current_ll is None:
 				_current_ll = self.loglike()
 			if param is None:
-				result = pandas.Series(data=numpy.nan, index=self.pf.index)
-				for p in self.pf.index:
-					if not self.pf.loc[p, 'holdfast'] or include_holdfast:
-						result[p] = self.likelihood_ratio(p, ref_value=ref_value, _current_ll=_current_ll)
-				return result
+				return self._likelihood_ratio_batch(self.pf.index, ref_value, include_holdfast, _current_ll)
 			elif isinstance(param, str):
 				if ref_value is None:
 					ref_value = self.pf.loc[param, 'nullvalue']
@@ -1518,11 +2034,29 @@ cdef class AbstractChoiceModel(ParameterFrame):
 						self.pf.loc[param, 'likelihood_ratio'] = like_ratio
 				return like_ratio
 			else:
-				result = pandas.Series(data=numpy.nan, index=list(param))
-				for p in result.index:
-					if not self.pf.loc[p, 'holdfast'] or include_holdfast:
-						result[p] = self.likelihood_ratio(p, ref_value=ref_value, _current_ll=_current_ll)
-				return result
+				return self._likelihood_ratio_batch(list(param), ref_value, include_holdfast, _current_ll)
 		except:
 			logger.exception("error in likelihood_ratio")
 			raise
+
+	def _likelihood_ratio_batch(self, params, ref_value, include_holdfast, current_ll):
+		# All the alternative log likelihoods are computed together by
+		# `_loglike_coordinate_shifts`, in one pass over the data if possible.
+		result = pandas.Series(data=numpy.nan, index=params)
+		frame = self.pf
+		shifts = numpy.zeros(len(frame))
+		for p in result.index:
+			if not frame.loc[p, 'holdfast'] or include_holdfast:
+				alt_value = frame.loc[p, 'nullvalue'] if ref_value is None else ref_value
+				shifts[frame.index.get_loc(p)] = alt_value - frame.loc[p, 'value']
+				result[p] = 0
+		if numpy.any(shifts != 0):
+			ll_alt = pandas.Series(self._loglike_coordinate_shifts(shifts), index=frame.index)
+			for p in result.index:
+				if shifts[frame.index.get_loc(p)] != 0:
+					result[p] = current_ll - ll_alt[p]
+		if ref_value is None:
+			for p in result.index:
+				if not numpy.isnan(result[p]):
+					frame.loc[p, 'likelihood_ratio'] = result[p]
+		return result
@@ -0,0 +1,207 @@
+import multiprocessing
+import numpy
+import pandas
+
+import logging
+from ..log import logger_name
+logger = logging.getLogger(logger_name+'.model')
+
+
+def _n_free_parameters(model):
+	return int(numpy.sum(model.pf['holdfast'] == 0))
+
+
+def _converged(result):
+	return bool(result.get(
+		'success',
+		str(result.get('message', '')).startswith('Optimization terminated successfully'),
+	))
+
+
+def _iterations(result, default):
+	if 'n_iters' in result:
+		return result['n_iters']
+	if 'nit' in result:
+		return result['nit']
+	if 'steps' in result:
+		return len(result['steps'])
+	return default
+
+
+def _loglike_and_tolerance(model, x):
+	try:
+		ll, dll, bhhh = model._loglike2_bhhh_tuple(x)
+	except NotImplementedError:
+		return model.loglike(x), numpy.inf
+	direction = numpy.dot(dll, model._free_slots_inverse_matrix(bhhh))
+	return ll, abs(numpy.dot(direction, dll))
+
+
+def aic_margin_rule(margin=0.0):
+	"""
+	Create a rule that stops specifications that cannot beat the best AIC.
+
+	The log likelihood a specification can still reach is estimated
+	generously as the current value plus the BHHH convergence tolerance,
+	which is twice the improvement predicted by a quadratic model of the
+	log likelihood.  If even that would give an AIC more than `margin`
+	worse than the best AIC among the specifications already finished,
+	the specification is stopped.
+
+	Parameters
+	----------
+	margin : float, default 0
+
+	Returns
+	-------
+	callable
+	"""
+	def rule(loglike, tolerance, n_params, best_aic):
+		return 2 * n_params - 2 * (loglike + tolerance) > best_aic + margin
+	return rule
+
+
+def estimate_many(
+		models,
+		dataservice=None,
+		n_workers=None,
+		early_stop=None,
+		check_every=5,
+		maxiter=100,
+		**kwargs,
+):
+	"""
+	Estimate many model specifications concurrently.
+
+	Each model is loaded and estimated in a worker process forked from
+	this one, so a dataservice or other data already in memory is shared
+	with the workers rather than copied.  Loading data from the
+	dataservice is done by one worker at a time, but the estimations
+	run concurrently.  Jobs are started largest-first
+	(by number of parameters) so that the long estimations do not end up
+	at the back of the queue.  After estimation, the estimated values are
+	written back to each model's parameter frame (data loaded in the
+	workers is not kept).
+
+	Parameters
+	----------
+	models : Sequence[Model] or Mapping[str, Model]
+		The model specifications to estimate.
+	dataservice : DataService, optional
+		The data to load into each model.  If not given, each model
+		must have its own dataservice, or already have dataframes loaded.
+	n_workers : int, optional
+		The number of worker processes.  Defaults to the smaller of
+		the number of models and the number of CPUs.
+	early_stop : float or callable, optional
+		A rule to stop hopeless specifications early.  If a number,
+		specifications are stopped by :func:`aic_margin_rule` with that
+		margin.  If a callable, it is called as
+		``early_stop(loglike, tolerance, n_params, best_aic)`` every
+		`check_every` iterations and should return True to stop.
+		The `best_aic` is the best AIC among specifications already
+		finished, in any worker.  The checks are made from the
+		optimizer's callback, so each specification is estimated in a
+		single `maximize_loglike` call whether or not it is checked.
+	check_every : int, default 5
+		The number of iterations between early stopping checks.
+	maxiter : int, default 100
+		The maximum number of iterations for each specification.
+	**kwargs
+		All other keyword arguments are passed through to
+		`maximize_loglike`.
+
+	Returns
+	-------
+	pandas.DataFrame
+		A comparison table, with one row per model, giving the log
+		likelihood, number of free parameters, rho squared w.r.t. the null
+		model, AIC, iterations, run time, and status.
+	"""
+	from ..util.parallel import fork_map, fork_available
+	from ..util.timesize import Timer
+
+	if isinstance(models, dict):
+		names = list(models.keys())
+		models = list(models.values())
+	else:
+		models = list(models)
+		names = [getattr(m, 'title', None) or f"model_{n}" for n, m in enumerate(models)]
+		if len(set(names)) < len(names):
+			names = [f"model_{n}" for n in range(len(models))]
+
+	if early_stop is not None and not callable(early_stop):
+		early_stop = aic_margin_rule(early_stop)
+	if n_workers is None:
+		n_workers = min(len(models), multiprocessing.cpu_count())
+	n_workers = max(1, n_workers)
+	threads_per_worker = max(1, multiprocessing.cpu_count() // n_workers)
+	kwargs['quiet'] = True
+	best_aic = multiprocessing.Value('d', numpy.inf)
+	load_lock = multiprocessing.Lock()
+
+	def estimate_one(j):
+		model = models[j]
+		timer = Timer()
+		stats = {}
+		try:
+			if n_workers > 1 and fork_available():
+				model.n_threads = threads_per_worker
+			if dataservice is not None or model.dataframes is None:
+				# Forked workers share the parent's open file handles, so
+				# reading from the dataservice is done one worker at a time.
+				with load_lock:
+					model.load_data(dataservice=dataservice)
+			n_params = _n_free_parameters(model)
+			callback_count = 0
+
+			def check(x):
+				nonlocal callback_count
+				callback_count += 1
+				if callback_count % check_every:
+					return False
+				ll, tolerance = _loglike_and_tolerance(model, x)
+				return early_stop(ll, tolerance, n_params, best_aic.value)
+
+			result = model.maximize_loglike(
+				maxiter=maxiter,
+				callback=check if early_stop is not None else None,
+				**kwargs,
+			)
+			if result.get('stopped'):
+				status = 'stopped early'
+			elif _converged(result):
+				status = 'converged'
+			else:
+				status = 'maxiter'
+			iterations = _iterations(result, callback_count)
+			ll = result['loglike']
+			aic = 2 * n_params - 2 * ll
+			if status == 'converged':
+				with best_aic.get_lock():
+					if aic < best_aic.value:
+						best_aic.value = aic
+			stats['loglike'] = ll
+			stats['n_params'] = n_params
+			stats['rho_sq_null'] = 1 - ll / model.loglike_null()
+			stats['aic'] = aic
+			stats['iterations'] = iterations
+			stats['status'] = status
+		except Exception as err:
+			logger.exception(f"error in estimate_many for {names[j]}")
+			stats['status'] = f"error: {err!r}"
+		timer.stop()
+		stats['elapsed_time'] = timer.elapsed().total_seconds()
+		return model.pvals.copy(), stats
+
+	order = sorted(range(len(models)), key=lambda j: len(models[j].pf), reverse=True)
+	results = dict(zip(order, fork_map(estimate_one, order, n_jobs=n_workers)))
+
+	table = pandas.DataFrame(
+		[results[j][1] for j in range(len(models))],
+		index=pandas.Index(names, name='model'),
+		columns=['loglike', 'n_params', 'rho_sq_null', 'aic', 'iterations', 'elapsed_time', 'status'],
+	)
+	for j, model in enumerate(models):
+		model.set_values(results[j][0])
+	return table
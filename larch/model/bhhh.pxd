@@ -0,0 +1,19 @@
+# cython: language_level=3, embedsignature=True
+
+from ..general_precision cimport *
+
+cdef void _bhhh_push(
+		int         n_params,
+		l4_float_t* row,      # input  [n_params]
+		l4_float_t  weight,   # input  scalar
+		l4_float_t* block,    # temp   [BHHH_BLOCK_ROWS, n_params]
+		int*        n_rows,   # in-out scalar, rows held in block
+		l4_float_t* bhhh,     # in-out [n_params, n_params], upper triangle
+) nogil
+
+cdef void _bhhh_flush(
+		int         n_params,
+		l4_float_t* block,    # input  [BHHH_BLOCK_ROWS, n_params]
+		int*        n_rows,   # in-out scalar, rows held in block
+		l4_float_t* bhhh,     # in-out [n_params, n_params], upper triangle
+) nogil
@@ -0,0 +1,133 @@
+# cython: language_level=3, embedsignature=True
+"""
+Accumulation of the BHHH matrix.
+
+The BHHH matrix is the weighted sum over cases of the outer product of
+each case's gradient of the log likelihood with itself.  Instead of adding
+each outer product to a full matrix as it is computed, the gradient rows
+(scaled by the square root of their weights) are gathered into a small
+per-thread block, and each full block is added to the upper triangle of
+the thread's matrix with one BLAS symmetric rank-k update (`syrk`).
+Rows with negative weight cannot be scaled this way, and are added
+directly as rank one updates.  The lower triangle is filled in only once,
+when the per-thread matrices are combined by :func:`combine_bhhh`.
+"""
+
+include "../general_precision.pxi"
+from ..general_precision import l4_float_dtype
+from ..general_precision cimport l4_float_t
+
+from libc.math cimport sqrt
+cimport cython
+
+IF DOUBLE_PRECISION:
+	from scipy.linalg.cython_blas cimport dsyrk as _syrk
+ELSE:
+	from scipy.linalg.cython_blas cimport ssyrk as _syrk
+
+import numpy
+from .thread_buffers import thread_local_zeros
+
+BHHH_BLOCK_ROWS = 32
+cdef int _BLOCK_ROWS = BHHH_BLOCK_ROWS
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _bhhh_flush(
+		int         n_params,
+		l4_float_t* block,    # input  [BHHH_BLOCK_ROWS, n_params]
+		int*        n_rows,   # in-out scalar, rows held in block
+		l4_float_t* bhhh,     # in-out [n_params, n_params], upper triangle
+) nogil:
+	# The row-major block is the column-major [n_params, n_rows] matrix A,
+	# and the upper triangle of the row-major bhhh is the lower triangle of
+	# the column-major one, so this is C += A A' with uplo='L', trans='N'.
+	cdef:
+		char uplo = b'L'
+		char trans = b'N'
+		l4_float_t one = 1
+	if n_rows[0] > 0 and n_params > 0:
+		_syrk(&uplo, &trans, &n_params, n_rows, &one, block, &n_params, &one, bhhh, &n_params)
+	n_rows[0] = 0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _bhhh_push(
+		int         n_params,
+		l4_float_t* row,      # input  [n_params]
+		l4_float_t  weight,   # input  scalar
+		l4_float_t* block,    # temp   [BHHH_BLOCK_ROWS, n_params]
+		int*        n_rows,   # in-out scalar, rows held in block
+		l4_float_t* bhhh,     # in-out [n_params, n_params], upper triangle
+) nogil:
+	cdef:
+		int v, v2
+		l4_float_t scale
+		l4_float_t* target
+	if weight > 0:
+		scale = sqrt(weight)
+		target = block + n_rows[0] * n_params
+		for v in range(n_params):
+			target[v] = row[v] * scale
+		n_rows[0] += 1
+		if n_rows[0] >= _BLOCK_ROWS:
+			_bhhh_flush(n_params, block, n_rows, bhhh)
+	elif weight < 0:
+		for v in range(n_params):
+			scale = row[v] * weight
+			if scale == 0:
+				continue
+			for v2 in range(v, n_params):
+				bhhh[v * n_params + v2] += scale * row[v2]
+
+
+def bhhh_blocks(num_threads, n_params):
+	"""
+	Working space for gathering BHHH gradient rows.
+
+	Parameters
+	----------
+	num_threads, n_params : int
+
+	Returns
+	-------
+	block : ndarray, shape [num_threads, BHHH_BLOCK_ROWS, n_params]
+	n_rows : ndarray of int32, shape [num_threads]
+	"""
+	return (
+		thread_local_zeros(num_threads, [BHHH_BLOCK_ROWS, n_params], l4_float_dtype),
+		thread_local_zeros(num_threads, [], numpy.intc),
+	)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def combine_bhhh(
+		l4_float_t[:,:,:] bhhh_total,
+		l4_float_t[:,:,:] block,
+		int[:]            n_rows,
+):
+	"""
+	Flush the per-thread blocks and combine the per-thread BHHH matrices.
+
+	Parameters
+	----------
+	bhhh_total : array, shape [num_threads, n_params, n_params]
+		The per-thread matrices, with only the upper triangles filled.
+	block : array, shape [num_threads, BHHH_BLOCK_ROWS, n_params]
+	n_rows : array of int32, shape [num_threads]
+		As given by :func:`bhhh_blocks`.
+
+	Returns
+	-------
+	ndarray, shape [n_params, n_params]
+		The full symmetric sum of the per-thread matrices.
+	"""
+	cdef int t, n_params = bhhh_total.shape[2]
+	for t in range(bhhh_total.shape[0]):
+		if n_rows[t] > 0:
+			_bhhh_flush(n_params, &block[t,0,0], &n_rows[t], &bhhh_total[t,0,0])
+	upper = numpy.triu(numpy.asarray(bhhh_total).sum(0))
+	return upper + numpy.triu(upper, 1).T
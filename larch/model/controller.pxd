@@ -33,4 +33,8 @@ cdef class Model5c(AbstractChoiceModel):
 		object _graph
 
 		int _n_threads
+		str _schedule
+		int _chunksize
+
+		object _profile
 
@@ -42,6 +42,8 @@ cdef class Model5c(AbstractChoiceModel):
 			rename_parameters=None,
 			frame=None,
 			n_threads=-1,
+			schedule='static',
+			chunksize=0,
 			is_clone=False,
 			title=None,
 	):
@@ -70,6 +72,9 @@ cdef class Model5c(AbstractChoiceModel):
 		self._most_recent_estimation_result = None
 
 		self.n_threads = n_threads
+		self.schedule = schedule
+		self.chunksize = chunksize
+		self._profile = None
 
 		self._dataservice = dataservice
 
@@ -158,6 +163,9 @@ cdef class Model5c(AbstractChoiceModel):
 
 		self.unmangle(True)
 		self.n_threads = 0
+		self.schedule = 'static'
+		self.chunksize = 0
+		self._profile = None
 		self._prior_frame_values = None
 		# if self._graph is not None:
 		# 	self.graph.set_touch_callback(self.mangle)
@@ -175,6 +183,63 @@ cdef class Model5c(AbstractChoiceModel):
 		else:
 			self._n_threads = int(value)
 
+	@property
+	def schedule(self):
+		"""
+		str : How the cases are shared among threads in the likelihood computations.
+
+		One of 'static' (the default, equal numbers of cases per thread),
+		'dynamic' (blocks of `chunksize` cases handed out as threads become
+		free), 'guided' (blocks that shrink down to `chunksize` cases), or
+		'balanced' (several blocks per thread, each with about the same
+		number of available alternatives).  See :mod:`larch.model.scheduling`.
+		"""
+		return self._schedule
+
+	@schedule.setter
+	def schedule(self, value):
+		from .scheduling import check_schedule
+		self._schedule = check_schedule(value)
+
+	@property
+	def chunksize(self):
+		"""int : The block size for the 'dynamic' and 'guided' schedules, or 0 to choose automatically."""
+		return self._chunksize
+
+	@chunksize.setter
+	def chunksize(self, value):
+		if value < 0:
+			raise ValueError('chunksize must not be negative')
+		self._chunksize = int(value)
+
+	@property
+	def profiling(self):
+		"""
+		bool : Whether to record timing and counters for likelihood evaluations.
+
+		Turning this on creates a new, empty :attr:`profile`, and turning
+		it off discards the profile.  See :mod:`larch.model.profiling`.
+		"""
+		return self._profile is not None
+
+	@profiling.setter
+	def profiling(self, value):
+		if not value:
+			self._profile = None
+		elif self._profile is None:
+			from .profiling import ComputeProfile
+			self._profile = ComputeProfile()
+
+	@property
+	def profile(self):
+		"""ComputeProfile or None : The timing and counters recorded while :attr:`profiling` is on."""
+		return self._profile
+
+	def _n_selected_cases(self, start_case=0, stop_case=-1, step_case=1):
+		if stop_case < 0:
+			stop_case = self._dataframes._n_cases()
+		return len(range(start_case, stop_case, step_case))
+
 	def mangle(self, *args, **kwargs):
 		super().mangle(*args, **kwargs)
 
@@ -276,6 +341,33 @@ cdef class Model5c(AbstractChoiceModel):
 
 
 
+	def _parameter_names_in_use(self):
+		"""
+		The names of the parameters that appear in this model's functions.
+
+		Returns
+		-------
+		set
+		"""
+		nameset = set()
+		if self._utility_co is not None:
+			for linear_function in self._utility_co.values():
+				for component in linear_function:
+					nameset.add(self.__p_rename(component.param))
+		for linear_function in (self._utility_ca, self._quantity_ca):
+			if linear_function is not None:
+				for component in linear_function:
+					nameset.add(self.__p_rename(component.param))
+		if self._quantity_ca is not None and len(self._quantity_ca)>0 and self.quantity_scale is not None:
+			nameset.add(self.__p_rename(self.quantity_scale))
+		if self.logsum_parameter is not None:
+			nameset.add(self.__p_rename(self.logsum_parameter))
+		if self._graph is not None:
+			for nodecode in self._graph.topological_sorted_no_elementals:
+				if nodecode != self._graph._root_id:
+					nameset.add(self.__p_rename(self._graph.nodes[nodecode]['parameter']))
+		return nameset
+
 	@property
 	def quantity_scale(self):
 		return self._quantity_scale
@@ -510,6 +602,9 @@ cdef class Model5c(AbstractChoiceModel):
 			int         subsample= 1,
 			bint        probability_only=False,
 	):
+		profile = self._profile
+		if profile is not None:
+			allocated = profile.start_pass()
 		if self.is_mnl() and not (persist & PERSIST_D_PROBABILITY):
 			from .mnl import mnl_d_log_likelihood_from_dataframes_all_rows
 			y = mnl_d_log_likelihood_from_dataframes_all_rows(
@@ -525,6 +620,9 @@ cdef class Model5c(AbstractChoiceModel):
 				keep_only=keep_only,
 				subsample=subsample,
 				probability_only=probability_only,
+				schedule=self._schedule,
+				chunksize=self._chunksize,
+				profile=profile,
 			)
 		else:
 			if self.graph is None:
@@ -546,7 +644,12 @@ cdef class Model5c(AbstractChoiceModel):
 				keep_only=keep_only,
 				subsample=subsample,
 				probability_only=probability_only,
+				schedule=self._schedule,
+				chunksize=self._chunksize,
+				profile=profile,
 			)
+		if profile is not None:
+			profile.end_pass(self._n_selected_cases(start_case, stop_case, step_case), allocated)
 		return y
 
 	def loglike2(
@@ -678,12 +781,109 @@ cdef class Model5c(AbstractChoiceModel):
 		)
 		if start_case==0 and stop_case==-1 and step_case==1:
 			self._check_if_best(y.ll)
+		if self._profile is not None:
+			lap = self._profile.clock()
 		if return_series and 'dll' in y and not isinstance(y['dll'], (pandas.DataFrame, pandas.Series)):
 			y['dll'] = pandas.Series(y['dll'], index=self._frame.index, )
 		if return_series and 'bhhh' in y and not isinstance(y['bhhh'], pandas.DataFrame):
 			y['bhhh'] = pandas.DataFrame(y['bhhh'], index=self._frame.index, columns=self._frame.index)
+		if self._profile is not None:
+			self._profile.lap('wrap', lap)
 		return y
 
+	def _loglike_along_direction(self, direction, steps, leave_out=-1, keep_only=-1, subsample=-1):
+		"""
+		Compute the log likelihood at several step lengths along a direction.
+
+		For MNL models without a quantity function, the utility is affine in
+		the step length, so all the step lengths are evaluated in a single
+		pass over the data.  Other models evaluate each step separately.
+
+		Parameters
+		----------
+		direction : array-like
+			The search direction, one value per parameter.
+		steps : array-like
+			Candidate step lengths.
+		leave_out, keep_only, subsample : int, optional
+			Settings for cross validation calculations, see :ref:`loglike`.
+
+		Returns
+		-------
+		ndarray
+			The log likelihood at each step length.
+		"""
+		if not self.is_mnl() or (self._quantity_ca is not None and len(self._quantity_ca)):
+			return super()._loglike_along_direction(
+				direction, steps,
+				leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+			)
+		self.__prepare_for_compute()
+		profile = self._profile
+		if profile is not None:
+			lap = profile.clock()
+			allocated = profile.start_pass()
+		from .mnl import mnl_log_likelihood_along_direction_from_dataframes_all_rows
+		result = mnl_log_likelihood_along_direction_from_dataframes_all_rows(
+			self._dataframes,
+			direction,
+			steps,
+			num_threads=self.n_threads,
+			leave_out=leave_out,
+			keep_only=keep_only,
+			subsample=subsample,
+		)
+		if profile is not None:
+			profile.lap('kernel', lap)
+			profile.end_pass(self._n_selected_cases(), allocated, calls=len(result))
+		return result
+
+	def _loglike_coordinate_shifts(self, shifts):
+		"""
+		Compute the log likelihood with each parameter shifted in turn.
+
+		For MNL models without a quantity function, the utility is affine in
+		each parameter, so all the shifts are evaluated in a single pass over
+		the data.  Other models evaluate each shift separately.
+
+		Parameters
+		----------
+		shifts : array-like
+			The change to apply to each parameter, one value per parameter.
+
+		Returns
+		-------
+		ndarray
+			The log likelihood with each parameter shifted, or NaN where
+			the shift is zero.
+		"""
+		if not self.is_mnl() or (self._quantity_ca is not None and len(self._quantity_ca)):
+			return super()._loglike_coordinate_shifts(shifts)
+		shifts = numpy.asarray(shifts, dtype=numpy.float64)
+		holdfast = self.pf['holdfast'].values != 0
+		if numpy.any(shifts[holdfast] != 0):
+			# Holdfast parameters have no derivative in the kernel.
+			result = super()._loglike_coordinate_shifts(numpy.where(holdfast, shifts, 0))
+			free_shifts = numpy.where(holdfast, 0, shifts)
+			if numpy.any(free_shifts != 0):
+				result[~holdfast] = self._loglike_coordinate_shifts(free_shifts)[~holdfast]
+			return result
+		self.__prepare_for_compute()
+		profile = self._profile
+		if profile is not None:
+			lap = profile.clock()
+			allocated = profile.start_pass()
+		from .mnl import mnl_log_likelihood_coordinate_shifts_from_dataframes_all_rows
+		result = mnl_log_likelihood_coordinate_shifts_from_dataframes_all_rows(
+			self._dataframes,
+			shifts,
+			num_threads=self.n_threads,
+		)
+		if profile is not None:
+			profile.lap('kernel', lap)
+			profile.end_pass(self._n_selected_cases(), allocated, calls=int(numpy.count_nonzero(shifts)))
+		return result
+
 	def d_probability(
 			self,
 			x=None,
@@ -717,14 +917,23 @@ cdef class Model5c(AbstractChoiceModel):
 
 	def __prepare_for_compute(self, x=None, allow_missing_ch=False, allow_missing_av=False):
 		missing_ch, missing_av = False, False
+		profile = self._profile
+		if profile is not None:
+			lap = profile.clock()
 		if self._dataframes is None:
 			raise MissingDataError('dataframes is not set, maybe you need to call `load_data` first?')
 		if not self._dataframes.is_computational_ready(activate=True):
 			raise ValueError('DataFrames is not computational-ready')
 		if x is not None:
 			self.set_values(x)
+		if profile is not None:
+			lap = profile.lap('prepare', lap)
 		self.unmangle()
+		if profile is not None:
+			lap = profile.lap('unmangle', lap)
 		self._dataframes._read_in_model_parameters()
+		if profile is not None:
+			profile.lap('read_parameters', lap)
 		if self._dataframes._data_ch is None:
 			if allow_missing_ch:
 				missing_ch = True
@@ -783,6 +992,16 @@ cdef class Model5c(AbstractChoiceModel):
 			A dictx is returned if `persist` is non-zero.
 
 		"""
+		if (
+				probability_only and self.is_mnl()
+				and not (persist & ~PERSIST_PROBABILITY)
+				and leave_out == -1 and keep_only == -1
+		):
+			pr = self.__mnl_probability(x, start_case=start_case, stop_case=stop_case, step_case=step_case)
+			if persist:
+				from ..util import dictx
+				return dictx(ll=numpy.nan, probability=pr)
+			return pr
 		self.__prepare_for_compute(x, allow_missing_ch=probability_only)
 		y = self.__d_log_likelihood_from_dataframes_all_rows(
 			return_dll=False,
@@ -805,6 +1024,48 @@ cdef class Model5c(AbstractChoiceModel):
 		return y.ll
 
 
+	def __mnl_probability(self, x=None, out=None, start_case=0, stop_case=-1, step_case=1):
+		self.__prepare_for_compute(x, allow_missing_ch=True)
+		if stop_case < 0:
+			stop_case = self._dataframes._n_cases()
+		shape = (len(range(start_case, stop_case, step_case)), self._dataframes._n_alts())
+		if out is None:
+			out = numpy.zeros(shape, dtype=l4_float_dtype)
+		elif out.dtype != l4_float_dtype:
+			raise TypeError(f'out must have dtype {numpy.dtype(l4_float_dtype)}, not {out.dtype}')
+		profile = self._profile
+		if profile is not None:
+			allocated = profile.start_pass()
+		from .mnl import mnl_probability_from_dataframes_all_rows
+		result = mnl_probability_from_dataframes_all_rows(
+			self._dataframes,
+			out,
+			num_threads=self.n_threads,
+			start_case=start_case,
+			stop_case=stop_case,
+			step_case=step_case,
+			schedule=self._schedule,
+			chunksize=self._chunksize,
+			profile=profile,
+		)
+		if profile is not None:
+			profile.end_pass(shape[0], allocated)
+		return result
+
+	def _probability_array(self, x=None, out=None, start_case=0, stop_case=-1, step_case=1, include_nests=False):
+		"""
+		Compute probability values as an array, see :meth:`probability`.
+		"""
+		if self.is_mnl():
+			return self.__mnl_probability(x, out=out, start_case=start_case, stop_case=stop_case, step_case=step_case)
+		arr = self.loglike(x=x, persist=PERSIST_PROBABILITY, start_case=start_case, stop_case=stop_case, step_case=step_case, probability_only=True)
+		if not include_nests:
+			arr = arr[:,:self._dataframes._n_alts()]
+		if out is not None:
+			out[...] = arr
+			arr = out
+		return arr
+
 	def logsums(self, x=None, arr=None):
 		"""
 		Returns the model logsums.
@@ -861,6 +1122,7 @@ cdef class Model5c(AbstractChoiceModel):
 			step_case=1,
 			return_dataframe=False,
 			include_nests=False,
+			out=None,
 	):
 		"""
 		Compute probability values.
@@ -889,6 +1151,11 @@ cdef class Model5c(AbstractChoiceModel):
 		include_nests : bool, default False
 			Whether to include the nests section in a nested model.  This argument is ignored for MNL models
 			as the probability array is naturally limited to only the elemental alternatives.
+		out : ndarray, optional
+			An array to write the probabilities into, with one row for each selected case and one column
+			for each alternative (and nest, if `include_nests` is set).  It can be a memory-mapped array.  For
+			MNL models, the probabilities are computed directly into this array, and nothing else of that size is
+			allocated.
 
 		Returns
 		-------
@@ -898,9 +1165,11 @@ cdef class Model5c(AbstractChoiceModel):
 		try:
 			# if include_nests and return_dataframe is not in (False, 'names'):
 			# 	raise ValueError('cannot use both `include_nests` and `return_dataframe`')
-			arr = self.loglike(x=x, persist=PERSIST_PROBABILITY, start_case=start_case, stop_case=stop_case, step_case=step_case, probability_only=True)
-			if not include_nests:
-				arr = arr[:,:self._dataframes._n_alts()]
+			arr = self._probability_array(
+				x, out=out,
+				start_case=start_case, stop_case=stop_case, step_case=step_case,
+				include_nests=include_nests,
+			)
 			if return_dataframe:
 				idx = self._dataframes._data_co.index if self._dataframes._data_co is not None else None
 				if idx is not None:
@@ -1106,6 +1375,38 @@ cdef class Model5c(AbstractChoiceModel):
 				g.add_node(a, name=name)
 		self.graph = g
 
+	def _null_utility_is_zero(self):
+		"""
+		Whether the utility of every alternative is zero at the null values.
+
+		This holds when there is no quantity function, every utility
+		parameter has a null value of zero, and every logsum parameter
+		has a null value of one.  Holdfast parameters keep their current
+		value when the null values are set, so it is their current value
+		that must match instead.
+		"""
+		if self._quantity_ca is not None and len(self._quantity_ca):
+			return False
+		logsum_parameters = set()
+		if self._logsum_parameter is not None:
+			logsum_parameters.add(self._logsum_parameter)
+		if self._graph is not None:
+			for code in self._graph.nodes:
+				if self._graph.nodes[code].get('parameter', None) is not None:
+					logsum_parameters.add(self._graph.nodes[code]['parameter'])
+			for edge in self._graph.edges:
+				if self._graph.edges[edge].get('parameter', None) is not None:
+					return False
+		holdfast = self.pf['holdfast'] != 0
+		nullvalues = self.pf['nullvalue'].where(~holdfast, self.pf['value'])
+		for name, nullvalue in nullvalues.items():
+			if name in logsum_parameters:
+				if nullvalue != 1:
+					return False
+			elif nullvalue != 0:
+				return False
+		return True
+
 	def is_mnl(self):
 		"""
 		Check if this model is a MNL model
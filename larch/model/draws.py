@@ -0,0 +1,178 @@
+"""
+Quasi-random draws for simulated likelihoods.
+
+The draws are never stored as a [cases, draws] array.  Instead, draw `r`
+of group `g` (a case, or a person in a panel) is the point with index
+``g * n_draws + r + 1`` of a low discrepancy sequence, so each group
+gets its own consecutive block of the sequence and any draw can be
+computed on demand from its index.  The sequence is randomized by a
+shift derived from a seed: a Cranley-Patterson rotation for Halton
+sequences, and a digital shift for Sobol sequences.
+
+The functions here prepare the small tables used by the likelihood
+kernels, and give a pure numpy version of the same draws.
+"""
+
+import numpy
+
+DRAW_TYPES = {
+	'halton': 0,
+	'sobol': 1,
+}
+
+# Primitive polynomials and initial direction numbers for Sobol
+# dimensions 2 through 21, from the new-joe-kuo-6.21201 table of
+# S. Joe and F. Y. Kuo, "Constructing Sobol sequences with better
+# two-dimensional projections", SIAM J. Sci. Comput. 30 (2008).
+# Each row is (degree, coefficients, initial direction numbers).
+_JOE_KUO = (
+	(1,  0, (1,)),
+	(2,  1, (1, 3)),
+	(3,  1, (1, 3, 1)),
+	(3,  2, (1, 1, 1)),
+	(4,  1, (1, 1, 3, 3)),
+	(4,  4, (1, 3, 5, 13)),
+	(5,  2, (1, 1, 5, 5, 17)),
+	(5,  4, (1, 1, 5, 5, 5)),
+	(5,  7, (1, 1, 7, 11, 19)),
+	(5, 11, (1, 1, 5, 1, 1)),
+	(5, 13, (1, 1, 1, 3, 11)),
+	(5, 14, (1, 3, 5, 5, 31)),
+	(6,  1, (1, 3, 3, 9, 7, 49)),
+	(6, 13, (1, 1, 1, 15, 21, 21)),
+	(6, 16, (1, 3, 1, 13, 27, 49)),
+	(6, 19, (1, 1, 1, 15, 7, 5)),
+	(6, 22, (1, 3, 1, 15, 13, 25)),
+	(6, 25, (1, 1, 5, 5, 19, 61)),
+	(7,  1, (1, 3, 7, 11, 23, 15, 103)),
+	(7,  4, (1, 3, 7, 13, 13, 15, 69)),
+)
+
+SOBOL_MAX_DIMS = len(_JOE_KUO) + 1
+
+SOBOL_BITS = 32
+
+
+def halton_bases(n_dims):
+	"""
+	The prime bases for a Halton sequence.
+
+	Parameters
+	----------
+	n_dims : int
+
+	Returns
+	-------
+	ndarray of int64
+		The first `n_dims` prime numbers.
+	"""
+	primes = []
+	candidate = 2
+	while len(primes) < n_dims:
+		if all(candidate % p for p in primes if p * p <= candidate):
+			primes.append(candidate)
+		candidate += 1
+	return numpy.asarray(primes, dtype=numpy.int64)
+
+
+def sobol_direction_numbers(n_dims):
+	"""
+	The direction numbers for a Sobol sequence.
+
+	Parameters
+	----------
+	n_dims : int
+		The number of dimensions, at most `SOBOL_MAX_DIMS`.
+
+	Returns
+	-------
+	ndarray of uint32, shape [n_dims, SOBOL_BITS]
+	"""
+	if n_dims > SOBOL_MAX_DIMS:
+		raise ValueError(f'Sobol draws are available for at most {SOBOL_MAX_DIMS} dimensions, not {n_dims}')
+	v = numpy.zeros([max(n_dims, 0), SOBOL_BITS], dtype=numpy.uint32)
+	for d in range(n_dims):
+		if d == 0:
+			for i in range(SOBOL_BITS):
+				v[d, i] = 1 << (SOBOL_BITS - 1 - i)
+			continue
+		s, a, m = _JOE_KUO[d - 1]
+		vd = [0] * SOBOL_BITS
+		for i in range(min(s, SOBOL_BITS)):
+			vd[i] = m[i] << (SOBOL_BITS - 1 - i)
+		for i in range(s, SOBOL_BITS):
+			vd[i] = vd[i - s] ^ (vd[i - s] >> s)
+			for k in range(1, s):
+				if (a >> (s - 1 - k)) & 1:
+					vd[i] ^= vd[i - k]
+		v[d] = vd
+	return v
+
+
+def draw_shifts(n_dims, seed=0):
+	"""
+	The random shifts that randomize a sequence, one per dimension.
+
+	Parameters
+	----------
+	n_dims : int
+	seed : int, default 0
+
+	Returns
+	-------
+	ndarray of float64
+		Values in [0,1).  For Sobol sequences, the leading bits of each
+		value are used as a digital shift.
+	"""
+	return numpy.random.RandomState(seed).uniform(size=n_dims)
+
+
+def uniform_draws(n_groups, n_draws, n_dims, draw_type='halton', seed=0):
+	"""
+	Generate uniform quasi-random draws.
+
+	This gives the same draws that are generated on demand inside the
+	simulated likelihood kernels, as a complete array.  It is meant for
+	inspection and testing, not for estimation.
+
+	Parameters
+	----------
+	n_groups, n_draws, n_dims : int
+	draw_type : {'halton', 'sobol'}
+	seed : int, default 0
+
+	Returns
+	-------
+	ndarray, shape [n_groups, n_draws, n_dims]
+	"""
+	draw_type = _draw_type_code(draw_type)
+	index = numpy.arange(1, n_groups * n_draws + 1, dtype=numpy.int64)
+	shifts = draw_shifts(n_dims, seed)
+	u = numpy.zeros([len(index), n_dims])
+	if draw_type == DRAW_TYPES['halton']:
+		for d, base in enumerate(halton_bases(n_dims)):
+			n = index.copy()
+			f = 1.0 / base
+			while numpy.any(n > 0):
+				u[:, d] += (n % base) * f
+				n //= base
+				f /= base
+			u[:, d] = numpy.fmod(u[:, d] + shifts[d], 1.0)
+	else:
+		v = sobol_direction_numbers(n_dims)
+		gray = index ^ (index >> 1)
+		for d in range(n_dims):
+			x = numpy.zeros(len(index), dtype=numpy.uint32)
+			for k in range(SOBOL_BITS):
+				bit = ((gray >> k) & 1).astype(bool)
+				x[bit] ^= v[d, k]
+			x ^= numpy.uint32(shifts[d] * 4294967296.0)
+			u[:, d] = (x.astype(numpy.float64) + 0.5) / 4294967296.0
+	return u.reshape(n_groups, n_draws, n_dims)
+
+
+def _draw_type_code(draw_type):
+	try:
+		return DRAW_TYPES[str(draw_type).lower()]
+	except KeyError:
+		raise ValueError(f'unknown draw_type {draw_type!r}, use one of {set(DRAW_TYPES)}') from None
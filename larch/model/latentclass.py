@@ -41,8 +41,11 @@ class LatentClassModel(AbstractChoiceModel):
 			dataservice=None,
 			title=None,
 			frame=None,
+			groupid=None,
 	):
 		self._k_membership = k_membership
+		self._groupid = groupid
+		self._panel = None
 		if not isinstance(k_models, MutableMapping):
 			raise ValueError(f'k_models must be a MutableMapping, not {type(k_models)}')
 		self._k_models = k_models
@@ -66,6 +69,44 @@ class LatentClassModel(AbstractChoiceModel):
 	def _k_model_names(self):
 		return list(sorted(self._k_models.keys()))
 
+	@property
+	def groupid(self):
+		"""
+		str : The name of an idco variable that groups cases into a panel.
+
+		If set, class membership applies to each group (e.g. each person
+		making repeated choices) instead of to each case, and the
+		likelihood of each group is the product of the likelihoods of its
+		cases within each class.  The class membership data and the weight
+		of the first case in each group are used for the whole group.
+		"""
+		return self._groupid
+
+	@groupid.setter
+	def groupid(self, value):
+		self._groupid = value
+		self._panel = None
+		if self._dataframes is not None:
+			self._panel = self._make_panel(self._dataframes)
+
+	def _make_panel(self, dfs):
+		if self._groupid is None:
+			return None
+		if dfs.data_co is None or self._groupid not in dfs.data_co.columns:
+			raise MissingDataError(f'groupid {self._groupid!r} is not in data_co')
+		codes, uniques = pandas.factorize(dfs.data_co[self._groupid])
+		order = numpy.argsort(codes, kind='stable').astype(numpy.int64)
+		ptr = numpy.zeros(len(uniques) + 1, dtype=numpy.int64)
+		numpy.cumsum(numpy.bincount(codes, minlength=len(uniques)), out=ptr[1:])
+		return Dict(codes=codes, ptr=ptr, cases=order)
+
+	@property
+	def n_groups(self):
+		"""int : The number of panel groups, or the number of cases if there is no groupid."""
+		if self._panel is None:
+			return self.n_cases
+		return len(self._panel.ptr) - 1
+
 	def required_data(self):
 		# combine all required_data from all class-level submodels
 		req = Dict()
@@ -88,6 +129,8 @@ class LatentClassModel(AbstractChoiceModel):
 		top_req = self._k_membership.required_data()
 		if 'co' in top_req:
 			req['co'] = list(sorted(set(req.get('co', [])) | set(top_req.get('co', []))))
+		if self._groupid is not None:
+			req['co'] = list(sorted(set(req.get('co', [])) | {self._groupid}))
 		return req
 
 	def __prep_for_compute(self, x=None):
@@ -216,6 +259,273 @@ class LatentClassModel(AbstractChoiceModel):
 		return p
 
 
+	def _can_use_fused_kernel(self):
+		"""bool : Whether the fused latent class kernel can be used."""
+		from .controller import Model5c
+		for m in [self._k_membership, *self._k_models.values()]:
+			if not isinstance(m, Model5c) or not m.is_mnl() or m.dataframes is None:
+				return False
+			if getattr(m, '_mixtures', None):
+				return False
+		return True
+
+	def _fused_loglike2(
+			self,
+			return_dll=True,
+			return_bhhh=False,
+			start_case=0,
+			stop_case=-1,
+			step_case=1,
+			persist=0,
+			leave_out=-1,
+			keep_only=-1,
+			subsample=-1,
+			probability_only=False,
+	):
+		"""
+		Compute the log likelihood and derivatives with the fused kernel.
+
+		The class membership and within-class probabilities are computed
+		and reduced case by case, without building the complete array of
+		probability derivatives.  If there is a `groupid`, the likelihood
+		is computed for each group instead, and `start_case`, `stop_case`,
+		`step_case`, and the cross validation settings select groups
+		rather than cases.
+		"""
+		from .mnl import latent_class_d_log_likelihood_from_dataframes_all_rows
+		class_dfs = []
+		for k_name in self._k_membership.dataframes.alternative_names():
+			k_model = self._k_models[k_name]
+			k_model.unmangle()
+			k_model.dataframes.read_in_model_parameters()
+			class_dfs.append(k_model.dataframes)
+		self._k_membership.unmangle()
+		self._k_membership.dataframes.read_in_model_parameters()
+		if subsample <= 0:
+			if leave_out != -1 or keep_only != -1:
+				raise ValueError('subsample must be set to use leave_out or keep_only')
+			subsample = 1
+		if self._panel is not None and not probability_only:
+			from .mnl import latent_class_panel_d_log_likelihood_from_dataframes
+			return latent_class_panel_d_log_likelihood_from_dataframes(
+				self._k_membership.dataframes,
+				class_dfs,
+				self._panel.ptr,
+				self._panel.cases,
+				num_threads=self._k_membership.n_threads,
+				return_dll=return_dll,
+				return_bhhh=return_bhhh,
+				start_group=start_case,
+				stop_group=stop_case,
+				step_group=step_case,
+				persist=persist,
+				leave_out=leave_out,
+				keep_only=keep_only,
+				subsample=subsample,
+			)
+		return latent_class_d_log_likelihood_from_dataframes_all_rows(
+			self._k_membership.dataframes,
+			class_dfs,
+			num_threads=self._k_membership.n_threads,
+			return_dll=return_dll,
+			return_bhhh=return_bhhh,
+			start_case=start_case,
+			stop_case=stop_case,
+			step_case=step_case,
+			persist=persist,
+			leave_out=leave_out,
+			keep_only=keep_only,
+			subsample=subsample,
+			probability_only=probability_only,
+		)
+
+	def _em_posterior(self):
+		"""
+		Compute posterior class membership probabilities.
+
+		Returns
+		-------
+		posterior : ndarray
+			The probability of membership in each class (in the order of
+			the class membership model's alternatives), conditional on the
+			observed choices, with shape [n_cases, n_classes].  For a panel,
+			all the cases in a group have the posterior of the group.
+		casewise_ll : ndarray
+			The log likelihood of each case, or of each group for a
+			panel, unweighted.
+		"""
+		import warnings
+		k_names = self._k_membership.dataframes.alternative_names()
+		ch = self.dataframes.array_ch()
+		n_alts = self.dataframes.n_alts
+		log_joint = numpy.zeros([self.n_cases, len(k_names)])
+		with warnings.catch_warnings():
+			warnings.simplefilter("ignore", category=ParameterNotInModelWarning)
+			membership = self.class_membership_probability()
+			for k, k_name in enumerate(k_names):
+				k_pr = numpy.asarray(self._k_models[k_name].probability())[:, :n_alts]
+				log_joint[:, k] = (ch * numpy.log(numpy.where(ch != 0, k_pr, 1))).sum(1)
+		with numpy.errstate(divide='ignore'):
+			log_pi = numpy.log(membership.loc[:, k_names].values)
+		if self._panel is not None:
+			first = self._panel.cases[self._panel.ptr[:-1]]
+			log_joint = numpy.stack([
+				numpy.bincount(self._panel.codes, weights=log_joint[:, k], minlength=len(first))
+				for k in range(len(k_names))
+			], axis=1)
+			log_pi = log_pi[first]
+		log_joint += log_pi
+		max_joint = log_joint.max(1)
+		finite = numpy.isfinite(max_joint)
+		max_joint[~finite] = 0
+		casewise_ll = max_joint + numpy.log(numpy.exp(log_joint - max_joint[:, None]).sum(1))
+		posterior = numpy.exp(log_joint - casewise_ll[:, None])
+		posterior[~finite] = 1 / len(k_names)
+		if self._panel is not None:
+			posterior = posterior[self._panel.codes]
+		return posterior, casewise_ll
+
+	def _maximize_loglike_em(self, maxiter=100, ctol=1e-6, m_step_maxiter=25, finish_bhhh=0, callback=None):
+		"""
+		Maximize the log likelihood with the EM algorithm.
+
+		Each iteration computes the posterior probability of membership
+		in each class for each case, then re-estimates each class model
+		on its own, with the case weights multiplied by those posteriors,
+		and the class membership model with the posteriors as (fractional)
+		choices.  The re-estimation uses the usual MNL kernels.
+
+		Parameters that appear in more than one of the class and class
+		membership models do not separate this way, and are held at their
+		current values by the EM iterations.  They are only estimated if
+		`finish_bhhh` steps are made.
+
+		Parameters
+		----------
+		maxiter : int, default 100
+			The maximum number of EM iterations.
+		ctol : float, default 1e-6
+			Stop when an iteration improves the log likelihood by less
+			than this.
+		m_step_maxiter : int, default 25
+			The maximum number of BHHH iterations in each re-estimation.
+		finish_bhhh : int, default 0
+			After EM, make up to this many BHHH iterations on all the
+			parameters jointly, which also estimates any shared parameters
+			and leaves the model at a point where the standard errors
+			computed from the full likelihood are correct.
+		callback : callable, optional
+			Called with the parameter values after each iteration.
+
+		Returns
+		-------
+		dict
+		"""
+		self.unmangle()
+		k_names = self._k_membership.dataframes.alternative_names()
+		submodels = [self._k_membership] + [self._k_models[k_name] for k_name in k_names]
+		names_in = [m._parameter_names_in_use() for m in submodels]
+		shared = set()
+		for i, names_i in enumerate(names_in):
+			for names_j in names_in[i+1:]:
+				shared |= names_i & names_j
+		if shared and not finish_bhhh:
+			import warnings
+			warnings.warn(f'EM holds parameters shared between submodels fixed: {sorted(shared)}')
+
+		holdfast = self.pf['holdfast'].copy()
+		weight = self.dataframes.data_wt
+		weight = numpy.ones(self.n_cases) if weight is None else weight.values[:, 0]
+		if self._panel is not None:
+			group_weight = weight[self._panel.cases[self._panel.ptr[:-1]]]
+			# each group is counted once by the membership model
+			membership_weight = weight / numpy.diff(self._panel.ptr)[self._panel.codes]
+		else:
+			group_weight = membership_weight = weight
+		membership_dfs = self._k_membership.dataframes
+		membership_ch = membership_dfs.data_ch
+		membership_wt = membership_dfs.data_wt
+
+		def m_step(model, owned):
+			self.pf['holdfast'] = numpy.where(self.pf.index.isin(owned), holdfast, 1).astype(holdfast.dtype)
+			try:
+				if (self.pf['holdfast'] == 0).any():
+					model.maximize_loglike(
+						method='bhhh',
+						quiet=True,
+						maxiter=m_step_maxiter,
+						check_for_overspecification=False,
+					)
+			finally:
+				self.pf['holdfast'] = holdfast
+
+		n_iters = 0
+		ll = None
+		message = f"Optimization terminated after {maxiter} iterations."
+		try:
+			while True:
+				posterior, casewise_ll = self._em_posterior()
+				prev_ll, ll = ll, float(numpy.sum(casewise_ll * group_weight))
+				if prev_ll is not None and ll - prev_ll < ctol:
+					message = "Optimization terminated successfully."
+					break
+				if n_iters >= maxiter:
+					break
+				n_iters += 1
+
+				for k, k_name in enumerate(k_names):
+					k_dfs = self._k_models[k_name].dataframes
+					k_wt = k_dfs.data_wt
+					k_dfs.data_wt = pandas.DataFrame(
+						{'em_weight': posterior[:, k] * weight},
+						index=k_dfs.caseindex,
+					)
+					try:
+						m_step(self._k_models[k_name], names_in[k+1] - shared)
+					finally:
+						k_dfs.data_wt = k_wt
+
+				membership_dfs.data_ch = pandas.DataFrame(
+					posterior,
+					index=membership_ch.index,
+					columns=membership_ch.columns,
+				)
+				if self.dataframes.data_wt is not None or self._panel is not None:
+					membership_dfs.data_wt = pandas.DataFrame(
+						{'em_weight': membership_weight},
+						index=membership_dfs.caseindex,
+					)
+				try:
+					m_step(self._k_membership, names_in[0] - shared)
+				finally:
+					membership_dfs.data_ch = membership_ch
+					membership_dfs.data_wt = membership_wt
+
+				if callback is not None:
+					callback(self.pvals)
+		finally:
+			self._frame_values_have_changed()
+
+		result = {
+			'loglike': ll,
+			'x': self.pvals,
+			'n_iters': n_iters,
+			'message': message,
+			'success': message.startswith("Optimization terminated successfully"),
+		}
+		if finish_bhhh:
+			current_ll, tolerance, iter_bhhh, steps_bhhh, message = self.simple_fit_bhhh(
+				maxiter=finish_bhhh,
+				callback=callback,
+			)
+			result['loglike'] = current_ll
+			result['x'] = self.pvals
+			result['tolerance'] = tolerance
+			result['steps'] = steps_bhhh
+			result['finish_message'] = message
+		self._check_if_best(result['loglike'])
+		return result
+
 	def loglike2(
 			self,
 			x=None,
@@ -264,12 +574,32 @@ class LatentClassModel(AbstractChoiceModel):
 			Other arrays are also included if `persist` is set to True.
 
 		"""
-		if leave_out != -1 or keep_only != -1 or subsample != -1:
-			raise NotImplementedError()
-
 		from ..util import dictx
 
 		self.__prep_for_compute(x)
+
+		if self._can_use_fused_kernel():
+			y = self._fused_loglike2(
+				return_dll=not probability_only,
+				return_bhhh=bool(persist & persist_flags.PERSIST_BHHH),
+				start_case=start_case, stop_case=stop_case, step_case=step_case,
+				persist=persist & ~persist_flags.PERSIST_BHHH,
+				leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+				probability_only=probability_only,
+			)
+			if (
+					not probability_only
+					and start_case==0 and (stop_case==-1 or stop_case==self.n_cases) and step_case==1
+					and leave_out==-1 and keep_only==-1
+			):
+				self._check_if_best(y.ll)
+			return y
+
+		if leave_out != -1 or keep_only != -1 or subsample != -1:
+			raise NotImplementedError()
+		if self._panel is not None and not probability_only:
+			raise NotImplementedError('panel latent class models require MNL class models')
+
 		pr = self.probability(
 			x=None,
 			start_case=start_case, stop_case=stop_case, step_case=step_case,
@@ -442,6 +772,29 @@ class LatentClassModel(AbstractChoiceModel):
 			A dictx is returned if `persist` is non-zero.
 		"""
 		self.__prep_for_compute(x)
+
+		if self._can_use_fused_kernel():
+			y = self._fused_loglike2(
+				return_dll=False,
+				start_case=start_case, stop_case=stop_case, step_case=step_case,
+				persist=persist,
+				leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+				probability_only=probability_only,
+			)
+			if probability_only:
+				return y.probability
+			if (
+					start_case==0 and (stop_case==-1 or stop_case==self.n_cases) and step_case==1
+					and leave_out==-1 and keep_only==-1
+			):
+				self._check_if_best(y.ll)
+			if persist:
+				return y
+			return y.ll
+
+		if self._panel is not None and not probability_only:
+			raise NotImplementedError('panel latent class models require MNL class models')
+
 		pr = self.probability(
 			x=None,
 			start_case=start_case,
@@ -488,6 +841,7 @@ class LatentClassModel(AbstractChoiceModel):
 
 	@dataframes.setter
 	def dataframes(self, x):
+		self._panel = self._make_panel(x)
 		self._dataframes = x
 		top_data = DataFrames(
 			co = x.make_idco(*self._k_membership.required_data().get('co', [])),
@@ -590,3 +944,15 @@ class LatentClassModel(AbstractChoiceModel):
 		return self._k_membership.n_cases
 
 
+
+	def total_weight(self):
+		"""
+		The total weight of cases in the attached dataframes.
+
+		Returns
+		-------
+		float
+		"""
+		if self._dataframes is None:
+			raise MissingDataError("no dataframes are set")
+		return self._dataframes.total_weight()
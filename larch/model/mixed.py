@@ -0,0 +1,457 @@
+import numpy
+import pandas
+
+from ..util import Dict
+from ..exceptions import MissingDataError
+from .model import Model
+from .abstract_model import AbstractChoiceModel
+from . import persist_flags
+from .draws import _draw_type_code
+
+import logging
+from ..log import logger_name
+logger = logging.getLogger(logger_name+'.model')
+
+DISTRIBUTIONS = {
+	'normal': 0,
+	'lognormal': 1,
+}
+
+
+class MixedLogitModel(Model):
+	"""A mixed logit model, with random coefficients.
+
+	The utility functions are given as for an MNL :class:`Model`.  Some of
+	the parameters are then made random, each distributed across decision
+	makers with its own standard deviation parameter.  The likelihood is
+	simulated with quasi-random draws, which are generated on demand for
+	each case (or each group, when there is a `groupid`) so that the
+	simulation is reproducible for a given seed.
+
+	Parameters
+	----------
+	mixtures : Mapping[str, str or tuple], optional
+		The random coefficients.  Each key is the name of a parameter in
+		the utility function, which becomes the mean of the random
+		coefficient.  Each value is the name of the standard deviation
+		parameter, or a tuple of that name and the distribution, which is
+		'normal' (the default) or 'lognormal'.  For a lognormal random
+		coefficient, the mean and standard deviation parameters are those
+		of the log of the coefficient.
+	n_draws : int, default 100
+		The number of draws used to simulate the probabilities.
+	draw_type : {'halton', 'sobol'}
+		The kind of quasi-random sequence used for the draws.
+	seed : int, default 0
+		Sets the random shift applied to the quasi-random sequence.
+	groupid : str, optional
+		The name of an idco variable that groups cases into a panel.  If
+		given, the random coefficients are drawn once per group (e.g. per
+		person making repeated choices) instead of once per case.
+	**kwargs
+		All other arguments are passed to :class:`Model`.
+	"""
+
+	def __init__(
+			self,
+			*args,
+			mixtures=None,
+			n_draws=100,
+			draw_type='halton',
+			seed=0,
+			groupid=None,
+			**kwargs,
+	):
+		self._mixtures = {}
+		self._n_draws = int(n_draws)
+		self._draw_type = draw_type
+		_draw_type_code(draw_type)
+		self._seed = int(seed)
+		self._groupid = groupid
+		self._panel = None
+		super().__init__(*args, **kwargs)
+		if mixtures is not None:
+			self.mixtures = mixtures
+
+	def __getstate__(self):
+		return (
+			super().__getstate__(),
+			(self._mixtures, self._n_draws, self._draw_type, self._seed, self._groupid),
+		)
+
+	def __setstate__(self, state):
+		state, mixed_state = state
+		self._mixtures, self._n_draws, self._draw_type, self._seed, self._groupid = mixed_state
+		self._panel = None
+		super().__setstate__(state)
+
+	def __repr__(self):
+		s = "<larch.MixedLogitModel"
+		if self.title != "Untitled":
+			s += f' "{self.title}"'
+		s += ">"
+		return s
+
+	@property
+	def mixtures(self):
+		"""Dict : The random coefficients, as {mean: (std_dev, distribution)}."""
+		return Dict(self._mixtures)
+
+	@mixtures.setter
+	def mixtures(self, value):
+		mixtures = {}
+		for mean, spec in dict(value or {}).items():
+			if isinstance(spec, str):
+				sigma, distribution = spec, 'normal'
+			else:
+				sigma, distribution = spec
+			if distribution not in DISTRIBUTIONS:
+				raise ValueError(f'unknown distribution {distribution!r}, use one of {set(DISTRIBUTIONS)}')
+			mixtures[str(mean)] = (str(sigma), distribution)
+		self._mixtures = mixtures
+		self.mangle()
+
+	@property
+	def n_draws(self):
+		"""int : The number of draws used to simulate the probabilities."""
+		return self._n_draws
+
+	@n_draws.setter
+	def n_draws(self, value):
+		value = int(value)
+		if value <= 0:
+			raise ValueError('n_draws must be positive')
+		self._n_draws = value
+		self.clear_best_loglike()
+
+	@property
+	def draw_type(self):
+		"""str : The kind of quasi-random sequence used for the draws, 'halton' or 'sobol'."""
+		return self._draw_type
+
+	@draw_type.setter
+	def draw_type(self, value):
+		_draw_type_code(value)
+		self._draw_type = value
+		self.clear_best_loglike()
+
+	@property
+	def seed(self):
+		"""int : Sets the random shift applied to the quasi-random sequence."""
+		return self._seed
+
+	@seed.setter
+	def seed(self, value):
+		self._seed = int(value)
+		self.clear_best_loglike()
+
+	@property
+	def groupid(self):
+		"""
+		str : The name of an idco variable that groups cases into a panel.
+
+		If set, the random coefficients are drawn once for each group, and
+		the likelihood of each group is the product of the likelihoods of
+		its cases, averaged over the draws.  The weight of the first case
+		in each group is used for the whole group.
+		"""
+		return self._groupid
+
+	@groupid.setter
+	def groupid(self, value):
+		self._groupid = value
+		self._panel = None
+		self.mangle()
+
+	def _make_panel(self, dfs):
+		if self._groupid is None:
+			n_cases = dfs.n_cases
+			return Dict(
+				dataframes=dfs,
+				codes=None,
+				ptr=numpy.arange(n_cases + 1, dtype=numpy.int64),
+				cases=numpy.arange(n_cases, dtype=numpy.int64),
+			)
+		if dfs.data_co is None or self._groupid not in dfs.data_co.columns:
+			raise MissingDataError(f'groupid {self._groupid!r} is not in data_co')
+		codes, uniques = pandas.factorize(dfs.data_co[self._groupid])
+		order = numpy.argsort(codes, kind='stable').astype(numpy.int64)
+		ptr = numpy.zeros(len(uniques) + 1, dtype=numpy.int64)
+		numpy.cumsum(numpy.bincount(codes, minlength=len(uniques)), out=ptr[1:])
+		return Dict(dataframes=dfs, codes=codes, ptr=ptr, cases=order)
+
+	def _get_panel(self):
+		dfs = self.dataframes
+		if self._panel is None or self._panel.dataframes is not dfs:
+			self._panel = self._make_panel(dfs)
+		return self._panel
+
+	@property
+	def n_groups(self):
+		"""int : The number of panel groups, or the number of cases if there is no groupid."""
+		return len(self._get_panel().ptr) - 1
+
+	def _scan_all_ensure_names(self):
+		sigmas = [sigma for sigma, _ in self._mixtures.values()]
+		if sigmas:
+			# Starting exactly at zero would leave the standard deviations
+			# at a stationary point of the simulated likelihood.
+			self._ensure_names(sigmas, initvalue=0.1)
+		super()._scan_all_ensure_names()
+
+	def required_data(self):
+		req = super().required_data()
+		if req is not None and self._groupid is not None:
+			req['co'] = list(sorted(set(req.get('co', [])) | {self._groupid}))
+		return req
+
+	def _mixture_arrays(self):
+		"""
+		The positions and distributions of the random coefficients.
+
+		Returns
+		-------
+		mean, sigma : ndarray of int32
+			Positions in the parameter frame.
+		distribution : ndarray of int8
+		"""
+		if not self.is_mnl() or (self.quantity_ca is not None and len(self.quantity_ca)):
+			raise NotImplementedError('mixed logit is only available for MNL models without a quantity function')
+		in_use = self._parameter_names_in_use()
+		index = self.pf.index
+		mean, sigma, distribution = [], [], []
+		for mean_name, (sigma_name, dist_name) in self._mixtures.items():
+			if mean_name not in in_use:
+				raise ValueError(f'random coefficient {mean_name!r} is not in the utility function')
+			if sigma_name in in_use:
+				raise ValueError(f'standard deviation {sigma_name!r} must not appear in the utility function')
+			mean.append(index.get_loc(mean_name))
+			sigma.append(index.get_loc(sigma_name))
+			distribution.append(DISTRIBUTIONS[dist_name])
+		return (
+			numpy.asarray(mean, dtype=numpy.int32),
+			numpy.asarray(sigma, dtype=numpy.int32),
+			numpy.asarray(distribution, dtype=numpy.int8),
+		)
+
+	def _simulated_loglike(
+			self,
+			x=None,
+			*,
+			return_dll=True,
+			return_bhhh=False,
+			start_case=0,
+			stop_case=-1,
+			step_case=1,
+			persist=0,
+			leave_out=-1,
+			keep_only=-1,
+			subsample=-1,
+			probability_only=False,
+	):
+		if self.dataframes is None:
+			raise MissingDataError('dataframes is not set, maybe you need to call `load_data` first?')
+		if x is not None:
+			self.set_values(x)
+		self.unmangle()
+		mean, sigma, distribution = self._mixture_arrays()
+		# The data multiplying each mean parameter is read from the
+		# derivative of utility, which is skipped for holdfast parameters.
+		self.dataframes.read_in_model_parameters(release=mean)
+		panel = self._get_panel()
+		if subsample <= 0:
+			if leave_out != -1 or keep_only != -1:
+				raise ValueError('subsample must be set to use leave_out or keep_only')
+			subsample = 1
+		from .mnl import mixed_logit_d_log_likelihood_from_dataframes
+		y = mixed_logit_d_log_likelihood_from_dataframes(
+			self.dataframes,
+			mean,
+			sigma,
+			distribution,
+			panel.ptr,
+			panel.cases,
+			n_draws=self._n_draws,
+			draw_type=self._draw_type,
+			seed=self._seed,
+			num_threads=self.n_threads,
+			return_dll=return_dll,
+			return_bhhh=return_bhhh,
+			start_group=start_case,
+			stop_group=stop_case,
+			step_group=step_case,
+			persist=persist,
+			leave_out=leave_out,
+			keep_only=keep_only,
+			subsample=subsample,
+			probability_only=probability_only,
+		)
+		holdfast = self.pf['holdfast'].values != 0
+		if 'dll' in y:
+			y.dll[holdfast] = 0
+		if 'bhhh' in y:
+			y.bhhh[holdfast, :] = 0
+			y.bhhh[:, holdfast] = 0
+		if 'probability' in y and panel.codes is None:
+			stop = self.n_cases if stop_case == -1 else stop_case
+			y.probability = y.probability[start_case:stop:step_case]
+		if (
+				not probability_only
+				and start_case == 0 and stop_case == -1 and step_case == 1
+				and leave_out == -1 and keep_only == -1
+		):
+			self._check_if_best(y.ll)
+		return y
+
+	def loglike(
+			self,
+			x=None,
+			*,
+			start_case=0, stop_case=-1, step_case=1,
+			persist=0,
+			leave_out=-1, keep_only=-1, subsample=-1,
+			probability_only=False,
+	):
+		"""
+		Compute a simulated log likelihood value.
+
+		Parameters
+		----------
+		x : {'null', 'init', 'best', array-like, dict, scalar}, optional
+			Values for the parameters.  See :ref:`set_values` for details.
+		start_case, stop_case, step_case : int, optional
+			Select the cases to include, as for :meth:`Model.loglike`.  If
+			there is a `groupid`, these select groups instead of cases.
+		persist : int, default 0
+			Whether to return a variety of internal and intermediate arrays in the result dictionary.
+			If set to 0, only the final `ll` value is included.
+		leave_out, keep_only, subsample : int, optional
+			Settings for cross validation calculations, applied to groups
+			if there is a `groupid`.
+		probability_only : bool, default False
+			Compute only the simulated probability and ignore the likelihood.
+
+		Returns
+		-------
+		float or array or dictx
+		"""
+		y = self._simulated_loglike(
+			x,
+			return_dll=False,
+			start_case=start_case, stop_case=stop_case, step_case=step_case,
+			persist=persist,
+			leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+			probability_only=probability_only,
+		)
+		if probability_only:
+			return y.probability
+		if persist:
+			return y
+		return y.ll
+
+	def loglike2(
+			self,
+			x=None,
+			*,
+			start_case=0, stop_case=-1, step_case=1,
+			persist=0,
+			leave_out=-1, keep_only=-1, subsample=-1,
+			return_series=True,
+			probability_only=False,
+	):
+		"""
+		Compute a simulated log likelihood value and its first derivative.
+
+		The derivative is the analytic derivative of the simulated log
+		likelihood, including with respect to the standard deviations
+		of the random coefficients.  See :meth:`loglike` for the
+		parameters.
+
+		Returns
+		-------
+		dictx
+			The log likelihood is given by key 'll' and the first derivative by key 'dll'.
+		"""
+		return self._simulated_loglike(
+			x,
+			return_dll=True,
+			start_case=start_case, stop_case=stop_case, step_case=step_case,
+			persist=persist,
+			leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+			probability_only=probability_only,
+		)
+
+	def loglike2_bhhh(
+			self,
+			x=None,
+			*,
+			return_series=False,
+			start_case=0, stop_case=-1, step_case=1,
+			persist=0,
+			leave_out=-1, keep_only=-1, subsample=-1,
+	):
+		"""
+		Compute a simulated log likelihood value, its first derivative, and the BHHH matrix.
+
+		The BHHH matrix is the sum of the outer products of the derivative
+		of the simulated log likelihood of each case, or of each group if
+		there is a `groupid`.  See :meth:`loglike` for the parameters.
+
+		Returns
+		-------
+		dictx
+			The log likelihood is given by key 'll', the first derivative by key 'dll', and the BHHH matrix by 'bhhh'.
+		"""
+		y = self._simulated_loglike(
+			x,
+			return_dll=True,
+			return_bhhh=True,
+			start_case=start_case, stop_case=stop_case, step_case=step_case,
+			persist=persist,
+			leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+		)
+		if return_series and 'bhhh' in y and not isinstance(y['bhhh'], pandas.DataFrame):
+			y['bhhh'] = pandas.DataFrame(y['bhhh'], index=self.pf.index, columns=self.pf.index)
+		return y
+
+	def _probability_array(self, x=None, out=None, start_case=0, stop_case=-1, step_case=1, include_nests=False):
+		if self._get_panel().codes is None:
+			arr = self.loglike(
+				x,
+				start_case=start_case, stop_case=stop_case, step_case=step_case,
+				persist=persist_flags.PERSIST_PROBABILITY,
+				probability_only=True,
+			)
+		else:
+			# The case range selects groups in the simulated likelihood, so
+			# every group is simulated and the cases are selected here.
+			arr = self.loglike(
+				x,
+				persist=persist_flags.PERSIST_PROBABILITY,
+				probability_only=True,
+			)
+			stop = self.n_cases if stop_case == -1 else stop_case
+			arr = arr[start_case:stop:step_case]
+		if out is not None:
+			out[...] = arr
+			arr = out
+		return arr
+
+	def _loglike_along_direction(self, direction, steps, leave_out=-1, keep_only=-1, subsample=-1):
+		# The simulated likelihood is not affine in the step length.
+		return AbstractChoiceModel._loglike_along_direction(
+			self, direction, steps,
+			leave_out=leave_out, keep_only=keep_only, subsample=subsample,
+		)
+
+	def _loglike_coordinate_shifts(self, shifts):
+		return AbstractChoiceModel._loglike_coordinate_shifts(self, shifts)
+
+	def d_probability(self, *args, **kwargs):
+		raise NotImplementedError('probability derivatives are not available for mixed logit models')
+
+	def logsums(self, *args, **kwargs):
+		raise NotImplementedError('logsums are not available for mixed logit models')
+
+	def exputility(self, *args, **kwargs):
+		raise NotImplementedError('utility is random in mixed logit models')
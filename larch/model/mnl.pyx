@@ -6,13 +6,19 @@ from ..general_precision cimport l4_float_t
 
 include "fastmath.pxi"
 from libc.stdlib cimport malloc, free
-from libc.math cimport exp, log
+from libc.stdint cimport int8_t, int64_t, uint32_t
+from cpython.ref cimport PyObject
+from libc.math cimport exp, log, sqrt
 from numpy.math cimport expf, logf
 
 from cython.parallel cimport prange, parallel, threadid
 
 from ..dataframes cimport DataFrames
 from .persist_flags cimport *
+from .bhhh cimport _bhhh_push
+from .bhhh import bhhh_blocks, combine_bhhh
+from .scheduling import case_blocks
+from .thread_buffers import thread_local_zeros, working_zeros
 
 import numpy
 import pandas
@@ -315,6 +321,42 @@ cdef l4_float_t _mnl_log_likelihood_from_probability_stride2(
 	return ll
 
 
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.wraparound(False)
+cdef l4_float_t _mnl_log_likelihood_from_shifted_utility(
+		int    n_alts,
+		l4_float_t[:] utility,   # input [n_alts]
+		l4_float_t[:] shift,     # input [n_alts]
+		l4_float_t    steplen,
+		l4_float_t[:] choice,    # input [n_alts]
+) nogil:
+	"""The MNL log likelihood of one case, with utility `utility + steplen * shift`."""
+	cdef:
+		l4_float_t ll = 0
+		l4_float_t u, max_u, sum_expU
+		int j
+
+	max_u = -INFINITY32
+	for j in range(n_alts):
+		if utility[j] > -3.402823e38:
+			u = utility[j] + steplen * shift[j]
+			if u > max_u:
+				max_u = u
+	sum_expU = 0
+	for j in range(n_alts):
+		if utility[j] > -3.402823e38:
+			sum_expU += exp(utility[j] + steplen * shift[j] - max_u)
+	for j in range(n_alts):
+		if choice[j] != 0:
+			if utility[j] > -3.402823e38:
+				u = utility[j] + steplen * shift[j] - max_u
+				ll += (u - log(sum_expU)) * choice[j]
+			else:
+				ll = -INFINITY32
+	return ll
+
+
 ctypedef l4_float_t (*LL_FROM_PROB)(
 		int         n_alts,
 		l4_float_t[:] probability, # input [n_alts]
@@ -409,8 +451,10 @@ cdef void _mnl_d_log_likelihood_from_d_utility(
 		int             accel,
 		bint            return_bhhh,
 		l4_float_t[:]   d_loglike_cum,  # input [n_params]
-		l4_float_t[:,:] bhhh_cum,       # input [n_alts, n_params]
+		l4_float_t*     bhhh_cum,       # input [n_params, n_params], upper triangle
 		l4_float_t*     dLL_temp,       # temp  [n_params]
+		l4_float_t*     bhhh_block,     # temp  [BHHH_BLOCK_ROWS, n_params]
+		int*            bhhh_rows,      # temp  scalar
 ) nogil:
 
 	cdef:
@@ -451,9 +495,7 @@ cdef void _mnl_d_log_likelihood_from_d_utility(
 				d_loglike_cum[v]  += tempvalue2
 
 		if return_bhhh:
-			for v in range(n_params):
-				for v2 in range(n_params):
-					bhhh_cum[v,v2] += dLL_temp[v] * dLL_temp[v2] * this_ch
+			_bhhh_push(n_params, dLL_temp, this_ch, bhhh_block, bhhh_rows, bhhh_cum)
 
 
 
@@ -474,10 +516,15 @@ def mnl_d_log_likelihood_from_dataframes_all_rows(
 		int         keep_only=-1,
 		int         subsample= 1,
 		bint        probability_only=False,
+		schedule='static',
+		int         chunksize=0,
+		profile=None,
 ):
 	cdef:
 		int c = 0
 		int c_local = 0
+		int b, n_blocks
+		int64_t[:] blocks
 		int v
 		int v2
 		int n_cases = dfs._n_cases()
@@ -493,6 +540,8 @@ def mnl_d_log_likelihood_from_dataframes_all_rows(
 		l4_float_t[:,:] quantity
 		l4_float_t[:,:,:] dU
 		l4_float_t[:,:,:] bhhh_total
+		l4_float_t[:,:,:] bhhh_block
+		int[:]          bhhh_rows
 		l4_float_t*     buffer_exp_utility
 		l4_float_t*     buffer_probability
 		l4_float_t      ll = 0
@@ -527,6 +576,9 @@ def mnl_d_log_likelihood_from_dataframes_all_rows(
 	if step_case <= 0:
 		raise NotImplementedError('non-positive step')
 
+	if profile is not None:
+		lap = profile.clock()
+
 	try:
 
 		if num_threads <= 0:
@@ -540,6 +592,8 @@ def mnl_d_log_likelihood_from_dataframes_all_rows(
 			return_dll = True
 
 		n_cases_local = ((stop_case - start_case) // step_case) + (1 if (stop_case - start_case) % step_case else 0)
+		blocks = case_blocks(dfs, num_threads, schedule, chunksize, start_case, stop_case, step_case)
+		n_blocks = blocks.shape[0] - 1
 
 		storage_size_U    = n_cases_local if persist & PERSIST_UTILITY            else num_threads
 		storage_size_expU = n_cases_local if persist & PERSIST_EXP_UTILITY        else num_threads
@@ -549,98 +603,110 @@ def mnl_d_log_likelihood_from_dataframes_all_rows(
 		storage_size_dU   = n_cases_local if persist & PERSIST_D_UTILITY          else num_threads
 		storage_size_Q    = n_cases_local if persist & PERSIST_QUANTITY           else 0
 
-		raw_utility = numpy.zeros([storage_size_U,   n_alts], dtype=l4_float_dtype)
-		exp_utility = numpy.zeros([storage_size_expU,n_alts], dtype=l4_float_dtype)
-		probability = numpy.zeros([storage_size_P,   n_alts], dtype=l4_float_dtype)
+		raw_utility = working_zeros(storage_size_U, num_threads, [n_alts], l4_float_dtype)
+		exp_utility = working_zeros(storage_size_expU, num_threads, [n_alts], l4_float_dtype)
+		probability = working_zeros(storage_size_P, num_threads, [n_alts], l4_float_dtype)
 		if persist & PERSIST_QUANTITY:
-			quantity = numpy.zeros([storage_size_Q,  n_alts], dtype=l4_float_dtype)
+			quantity = working_zeros(storage_size_Q, num_threads, [n_alts], l4_float_dtype)
 		else:
 			quantity = None
 
-		LL_case  = numpy.zeros([storage_size_LLc,], dtype=l4_float_dtype)
+		LL_case  = working_zeros(storage_size_LLc, num_threads, [], l4_float_dtype)
 
 		if return_dll:
-			dU = numpy.zeros([storage_size_dU,n_alts, n_params], dtype=l4_float_dtype)
-			dLL_case  = numpy.zeros([storage_size_dLLc,n_params], dtype=l4_float_dtype)
-			dLL_total = numpy.zeros([num_threads,n_params], dtype=l4_float_dtype)
-			dLL_temp  = numpy.zeros([num_threads,n_params], dtype=l4_float_dtype)
+			dU = working_zeros(storage_size_dU, num_threads, [n_alts, n_params], l4_float_dtype)
+			dLL_case  = working_zeros(storage_size_dLLc, num_threads, [n_params], l4_float_dtype)
+			dLL_total = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+			dLL_temp  = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
 		if return_bhhh:
-			bhhh_total = numpy.zeros([num_threads,n_params,n_params], dtype=l4_float_dtype)
+			bhhh_total = thread_local_zeros(num_threads, [n_params,n_params], l4_float_dtype)
+			bhhh_block, bhhh_rows = bhhh_blocks(num_threads, n_params)
+		else:
+			bhhh_total = thread_local_zeros(num_threads, [1,1], l4_float_dtype)
+			bhhh_block, bhhh_rows = bhhh_blocks(num_threads, 1)
+
+		if profile is not None:
+			lap = profile.lap('allocate', lap)
 
 		with nogil, parallel(num_threads=num_threads):
 			thread_number = threadid()
 
-			for c in prange(start_case, stop_case, step_case):
-
-				if leave_out >= 0 and c % subsample == leave_out:
-					continue
-
-				if keep_only >= 0 and c % subsample != keep_only:
-					continue
+			for b in prange(n_blocks, schedule='dynamic', chunksize=1):
+				for c_local in range(blocks[b], blocks[b+1]):
+					c = start_case + c_local * step_case
 
-				c_local = (c-start_case)//step_case
+					if leave_out >= 0 and c % subsample == leave_out:
+						continue
 
-				store_number_U    = c_local if persist & PERSIST_UTILITY            else thread_number
-				store_number_expU = c_local if persist & PERSIST_EXP_UTILITY        else thread_number
-				store_number_P    = c_local if persist & PERSIST_PROBABILITY        else thread_number
-				store_number_LLc  = c_local if persist & PERSIST_LOGLIKE_CASEWISE   else thread_number
-				store_number_dLLc = c_local if persist & PERSIST_D_LOGLIKE_CASEWISE else thread_number
-				store_number_dU   = c_local if persist & PERSIST_D_UTILITY          else thread_number
-				store_number_Q    = c_local if persist & PERSIST_QUANTITY           else -1
+					if keep_only >= 0 and c % subsample != keep_only:
+						continue
 
-				buffer_exp_utility = &exp_utility[store_number_expU,0]
-				buffer_probability = &probability[store_number_P,0]
+					store_number_U    = c_local if persist & PERSIST_UTILITY            else thread_number
+					store_number_expU = c_local if persist & PERSIST_EXP_UTILITY        else thread_number
+					store_number_P    = c_local if persist & PERSIST_PROBABILITY        else thread_number
+					store_number_LLc  = c_local if persist & PERSIST_LOGLIKE_CASEWISE   else thread_number
+					store_number_dLLc = c_local if persist & PERSIST_D_LOGLIKE_CASEWISE else thread_number
+					store_number_dU   = c_local if persist & PERSIST_D_UTILITY          else thread_number
+					store_number_Q    = c_local if persist & PERSIST_QUANTITY           else -1
 
-				if dfs._array_wt is not None:
-					weight = dfs._array_wt[c]
-				else:
-					weight = 1
+					buffer_exp_utility = &exp_utility[store_number_expU,0]
+					buffer_probability = &probability[store_number_P,0]
 
-				if return_dll:
-					if store_number_Q >= 0:
-						dfs._compute_d_utility_onecase(c,raw_utility[store_number_U],dU[store_number_dU],n_alts,quantity[store_number_Q])
-					else:
-						dfs._compute_d_utility_onecase(c,raw_utility[store_number_U],dU[store_number_dU],n_alts)
-				else:
-					if store_number_Q >= 0:
-						dfs._compute_utility_onecase(c,raw_utility[store_number_U],n_alts,quantity[store_number_Q])
+					if dfs._array_wt is not None:
+						weight = dfs._array_wt[c]
 					else:
-						dfs._compute_utility_onecase(c,raw_utility[store_number_U],n_alts)
-
-				_mnl_probability_from_utility(
-					n_alts,
-					&raw_utility[store_number_U,0],     # input
-					buffer_exp_utility, # output
-					buffer_probability, # output
-				)
-
-				if probability_only:
-					continue
-
-				ll_temp = _mnl_log_likelihood_from_probability_stride(
-					n_alts,
-					probability[store_number_P], # output
-					dfs._array_ch[c,:],
-				) * weight
-				ll += ll_temp
-				LL_case[store_number_LLc] += ll_temp
+						weight = 1
 
-				if return_dll:
-					if weight:
-						_mnl_d_log_likelihood_from_d_utility(
-							n_alts,
-							n_params,
-							dfs._array_ch[c,:],         # input [n_alts]
-							weight,                     # input scalar
-							dU[store_number_dU],          # input [n_alts, n_params]
-							buffer_probability,         # output [n_alts]
-							&dLL_case[store_number_dLLc,0],  # output [n_params]
-							0,                          # accelerator
-							return_bhhh,
-							dLL_total[thread_number],
-							bhhh_total[thread_number],
-							&dLL_temp[thread_number,0],
-						)
+					if return_dll:
+						if store_number_Q >= 0:
+							dfs._compute_d_utility_onecase(c,raw_utility[store_number_U],dU[store_number_dU],n_alts,quantity[store_number_Q])
+						else:
+							dfs._compute_d_utility_onecase(c,raw_utility[store_number_U],dU[store_number_dU],n_alts)
+					else:
+						if store_number_Q >= 0:
+							dfs._compute_utility_onecase(c,raw_utility[store_number_U],n_alts,quantity[store_number_Q])
+						else:
+							dfs._compute_utility_onecase(c,raw_utility[store_number_U],n_alts)
+
+					_mnl_probability_from_utility(
+						n_alts,
+						&raw_utility[store_number_U,0],     # input
+						buffer_exp_utility, # output
+						buffer_probability, # output
+					)
+
+					if probability_only:
+						continue
+
+					ll_temp = _mnl_log_likelihood_from_probability_stride(
+						n_alts,
+						probability[store_number_P], # output
+						dfs._array_ch[c,:],
+					) * weight
+					ll += ll_temp
+					LL_case[store_number_LLc] += ll_temp
+
+					if return_dll:
+						if weight:
+							_mnl_d_log_likelihood_from_d_utility(
+								n_alts,
+								n_params,
+								dfs._array_ch[c,:],         # input [n_alts]
+								weight,                     # input scalar
+								dU[store_number_dU],          # input [n_alts, n_params]
+								buffer_probability,         # output [n_alts]
+								&dLL_case[store_number_dLLc,0],  # output [n_params]
+								0,                          # accelerator
+								return_bhhh,
+								dLL_total[thread_number],
+								&bhhh_total[thread_number,0,0],
+								&dLL_temp[thread_number,0],
+								&bhhh_block[thread_number,0,0],
+								&bhhh_rows[thread_number],
+							)
+
+		if profile is not None:
+			lap = profile.lap('kernel', lap)
 
 		if probability_only:
 			ll = numpy.nan
@@ -649,7 +715,9 @@ def mnl_d_log_likelihood_from_dataframes_all_rows(
 		if return_dll:
 			dll = dLL_total.base.sum(0) * dfs._weight_normalization
 		if return_bhhh:
-			bhhh = bhhh_total.base.sum(0) * dfs._weight_normalization
+			bhhh = combine_bhhh(bhhh_total, bhhh_block, bhhh_rows) * dfs._weight_normalization
+		if profile is not None:
+			lap = profile.lap('reduce', lap)
 
 		from ..util import dictx
 		result = dictx(
@@ -684,6 +752,8 @@ def mnl_d_log_likelihood_from_dataframes_all_rows(
 		if return_bhhh:
 			result.bhhh = bhhh
 
+		if profile is not None:
+			profile.lap('wrap', lap)
 		return result
 
 	except:
@@ -694,6 +764,237 @@ def mnl_d_log_likelihood_from_dataframes_all_rows(
 
 
 
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def mnl_log_likelihood_along_direction_from_dataframes_all_rows(
+		DataFrames  dfs,
+		direction,
+		steps,
+		int         num_threads=1,
+		int         start_case=0,
+		int         stop_case=-1,
+		int         step_case=1,
+		int         leave_out=-1,
+		int         keep_only=-1,
+		int         subsample= 1,
+):
+	"""
+	Compute the log likelihood at several step lengths along a direction, in one pass.
+
+	The utility of a linear-in-parameters MNL model is affine in the step
+	length along any direction in parameter space, so for each case the
+	utility and its derivative at the current parameters give the utility
+	at every candidate step: U + step * (dU @ direction).
+
+	Parameters
+	----------
+	dfs : DataFrames
+		Already linked to the model, with current parameter values read in.
+		The model must not have a quantity function, which is not linear in
+		the parameters.
+	direction : array-like
+		The search direction, one value per model parameter.
+	steps : array-like
+		Candidate step lengths.
+
+	Returns
+	-------
+	ndarray
+		The log likelihood at each step length.
+	"""
+	cdef:
+		int c = 0
+		int j, k, v
+		int n_cases = dfs._n_cases()
+		int n_alts  = dfs._n_alts()
+		int n_params= dfs._n_model_params
+		int n_steps
+		int thread_number = 0
+		l4_float_t[:] dirn = numpy.asarray(direction, dtype=l4_float_dtype)
+		l4_float_t[:] stepsize = numpy.asarray(steps, dtype=l4_float_dtype).reshape(-1)
+		l4_float_t[:,:] raw_utility
+		l4_float_t[:,:] gradient_utility
+		l4_float_t[:,:,:] dU
+		l4_float_t[:,:] ll_total
+		l4_float_t weight
+		l4_float_t ll_temp
+
+	if not dfs._is_computational_ready(activate=True):
+		raise ValueError('DataFrames is not computational-ready')
+	if dfs._data_ch is None:
+		raise ValueError('DataFrames does not define data_ch')
+	if dfs._data_av is None:
+		raise ValueError('DataFrames does not define data_av')
+	if dfs.model_quantity_ca_param.shape[0]:
+		raise NotImplementedError('log likelihood is not affine along a direction with a quantity function')
+	if step_case <= 0:
+		raise NotImplementedError('non-positive step')
+	if dirn.shape[0] != n_params:
+		raise ValueError(f'direction has {dirn.shape[0]} values, but there are {n_params} parameters')
+
+	if num_threads <= 0:
+		num_threads = 1
+	if stop_case<0:
+		stop_case = n_cases
+	n_steps = stepsize.shape[0]
+
+	raw_utility = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	gradient_utility = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	dU = thread_local_zeros(num_threads, [n_alts, n_params], l4_float_dtype)
+	ll_total = thread_local_zeros(num_threads, [n_steps], l4_float_dtype)
+
+	with nogil, parallel(num_threads=num_threads):
+		thread_number = threadid()
+
+		for c in prange(start_case, stop_case, step_case):
+
+			if leave_out >= 0 and c % subsample == leave_out:
+				continue
+
+			if keep_only >= 0 and c % subsample != keep_only:
+				continue
+
+			if dfs._array_wt is not None:
+				weight = dfs._array_wt[c]
+			else:
+				weight = 1
+			if weight == 0:
+				continue
+
+			dfs._compute_d_utility_onecase(c, raw_utility[thread_number], dU[thread_number], n_alts)
+
+			for j in range(n_alts):
+				gradient_utility[thread_number,j] = 0
+				for v in range(n_params):
+					gradient_utility[thread_number,j] += dU[thread_number,j,v] * dirn[v]
+
+			for k in range(n_steps):
+				ll_temp = _mnl_log_likelihood_from_shifted_utility(
+					n_alts,
+					raw_utility[thread_number],
+					gradient_utility[thread_number],
+					stepsize[k],
+					dfs._array_ch[c,:],
+				)
+				ll_total[thread_number,k] += ll_temp * weight
+
+	return ll_total.base.sum(0) * dfs._weight_normalization
+
+
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.wraparound(False)
+def mnl_log_likelihood_coordinate_shifts_from_dataframes_all_rows(
+		DataFrames  dfs,
+		shifts,
+		int         num_threads=1,
+		int         start_case=0,
+		int         stop_case=-1,
+		int         step_case=1,
+		int         leave_out=-1,
+		int         keep_only=-1,
+		int         subsample= 1,
+):
+	"""
+	Compute the log likelihood with each parameter shifted in turn, in one pass.
+
+	The utility of a linear-in-parameters MNL model is affine in each
+	parameter, so for each case the utility and its derivative at the
+	current parameters give the utility with any one parameter shifted:
+	U + shifts[v] * dU[:,v].
+
+	Parameters
+	----------
+	dfs : DataFrames
+		Already linked to the model, with current parameter values read in.
+		The model must not have a quantity function, which is not linear in
+		the parameters.
+	shifts : array-like
+		The change to apply to each parameter, one value per model parameter.
+		Parameters with a zero shift are skipped.  Holdfast parameters have
+		a zero derivative, so shifting them has no effect here.
+
+	Returns
+	-------
+	ndarray
+		The log likelihood with each parameter shifted, or NaN where
+		the shift is zero.
+	"""
+	cdef:
+		int c = 0
+		int v
+		int n_cases = dfs._n_cases()
+		int n_alts  = dfs._n_alts()
+		int n_params= dfs._n_model_params
+		int thread_number = 0
+		l4_float_t[:] shift = numpy.asarray(shifts, dtype=l4_float_dtype).reshape(-1)
+		l4_float_t[:,:] raw_utility
+		l4_float_t[:,:,:] dU
+		l4_float_t[:,:] ll_total
+		l4_float_t weight
+		l4_float_t ll_temp
+
+	if not dfs._is_computational_ready(activate=True):
+		raise ValueError('DataFrames is not computational-ready')
+	if dfs._data_ch is None:
+		raise ValueError('DataFrames does not define data_ch')
+	if dfs._data_av is None:
+		raise ValueError('DataFrames does not define data_av')
+	if dfs.model_quantity_ca_param.shape[0]:
+		raise NotImplementedError('log likelihood is not affine in the parameters with a quantity function')
+	if step_case <= 0:
+		raise NotImplementedError('non-positive step')
+	if shift.shape[0] != n_params:
+		raise ValueError(f'shifts has {shift.shape[0]} values, but there are {n_params} parameters')
+
+	if num_threads <= 0:
+		num_threads = 1
+	if stop_case<0:
+		stop_case = n_cases
+
+	raw_utility = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	dU = thread_local_zeros(num_threads, [n_alts, n_params], l4_float_dtype)
+	ll_total = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+
+	with nogil, parallel(num_threads=num_threads):
+		thread_number = threadid()
+
+		for c in prange(start_case, stop_case, step_case):
+
+			if leave_out >= 0 and c % subsample == leave_out:
+				continue
+
+			if keep_only >= 0 and c % subsample != keep_only:
+				continue
+
+			if dfs._array_wt is not None:
+				weight = dfs._array_wt[c]
+			else:
+				weight = 1
+			if weight == 0:
+				continue
+
+			dfs._compute_d_utility_onecase(c, raw_utility[thread_number], dU[thread_number], n_alts)
+
+			for v in range(n_params):
+				if shift[v] == 0:
+					continue
+				ll_temp = _mnl_log_likelihood_from_shifted_utility(
+					n_alts,
+					raw_utility[thread_number],
+					dU[thread_number,:,v],
+					shift[v],
+					dfs._array_ch[c,:],
+				)
+				ll_total[thread_number,v] += ll_temp * weight
+
+	result = ll_total.base.sum(0) * dfs._weight_normalization
+	result[numpy.asarray(shift) == 0] = numpy.nan
+	return result
+
+
 @cython.boundscheck(False)
 @cython.initializedcheck(False)
 @cython.wraparound(False)
@@ -762,6 +1063,1041 @@ def mnl_logsums_from_dataframes_all_rows(
 
 
 
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def mnl_probability_from_dataframes_all_rows(
+		DataFrames      dfs,
+		l4_float_t[:,:] probability, # output
+		int             num_threads=1,
+		int             start_case=0,
+		int             stop_case=-1,
+		int             step_case=1,
+		schedule='static',
+		int             chunksize=0,
+		profile=None,
+):
+	"""
+	Compute MNL probabilities directly into an output array.
+
+	This is the lean path for prediction: no choice data is needed, and
+	apart from the output only per-thread scratch space for utility is
+	allocated, so the output can be a memory-mapped array larger than
+	the available memory.
+
+	Parameters
+	----------
+	dfs : DataFrames
+		Linked to an MNL model, with current parameter values read in.
+	probability : l4_float_t[n_cases_local, n_alts]
+		The output array, with one row for each selected case.
+	profile : ComputeProfile, optional
+		If given, the time spent allocating and in the kernel is added
+		to this profile.
+
+	Returns
+	-------
+	l4_float_t[n_cases_local, n_alts]
+		The `probability` array.
+	"""
+	cdef:
+		int c = 0
+		int c_local = 0
+		int b, n_blocks
+		int64_t[:] blocks
+		int j
+		int n_cases = dfs._n_cases()
+		int n_cases_local
+		int n_alts  = dfs._n_alts()
+		int thread_number = 0
+		l4_float_t[:,:] raw_utility
+		l4_float_t[:,:] exp_utility
+
+	if not dfs._is_computational_ready(activate=True):
+		raise ValueError('DataFrames is not computational-ready')
+
+	if dfs._data_av is None:
+		raise ValueError('DataFrames does not define data_av')
+
+	if step_case <= 0:
+		raise NotImplementedError('non-positive step')
+
+	if profile is not None:
+		lap = profile.clock()
+
+	if num_threads <= 0:
+		num_threads = 1
+
+	if stop_case<0:
+		stop_case = n_cases
+
+	n_cases_local = ((stop_case - start_case) // step_case) + (1 if (stop_case - start_case) % step_case else 0)
+	if probability.shape[0] != n_cases_local or probability.shape[1] != n_alts:
+		raise ValueError(
+			f'probability array has shape {(probability.shape[0], probability.shape[1])}, '
+			f'but {(n_cases_local, n_alts)} is required'
+		)
+
+	blocks = case_blocks(dfs, num_threads, schedule, chunksize, start_case, stop_case, step_case)
+	n_blocks = blocks.shape[0] - 1
+	raw_utility = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	exp_utility = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+
+	if profile is not None:
+		lap = profile.lap('allocate', lap)
+
+	with nogil, parallel(num_threads=num_threads):
+		thread_number = threadid()
+
+		for b in prange(n_blocks, schedule='dynamic', chunksize=1):
+			for c_local in range(blocks[b], blocks[b+1]):
+				c = start_case + c_local * step_case
+				dfs._compute_utility_onecase(c, raw_utility[thread_number], n_alts)
+				if probability.strides[1] == sizeof(l4_float_t):
+					_mnl_probability_from_utility(
+						n_alts,
+						&raw_utility[thread_number,0],
+						&exp_utility[thread_number,0],
+						&probability[c_local,0],
+					)
+				else:
+					_mnl_probability_from_utility(
+						n_alts,
+						&raw_utility[thread_number,0],
+						&exp_utility[thread_number,0],
+						&raw_utility[thread_number,0],
+					)
+					for j in range(n_alts):
+						probability[c_local,j] = raw_utility[thread_number,j]
+
+	if profile is not None:
+		profile.lap('kernel', lap)
+	return probability.base
+
+
+def _check_latent_class_dataframes(DataFrames membership_dfs, class_dfs, bint probability_only=False):
+	"""
+	Check that class model dataframes are consistent with each other.
+
+	Returns
+	-------
+	list
+		The class model dataframes.
+	"""
+	cdef:
+		int k
+		int n_classes = len(class_dfs)
+		int n_cases = membership_dfs._n_cases()
+		int n_params = membership_dfs._n_model_params
+		DataFrames dfs
+	if n_classes != membership_dfs._n_alts():
+		raise ValueError(f'{n_classes} class models but {membership_dfs._n_alts()} classes in the membership model')
+	if n_classes == 0:
+		raise ValueError('no class models')
+	if not membership_dfs._is_computational_ready(activate=True):
+		raise ValueError('DataFrames is not computational-ready')
+	linked_dfs = list(class_dfs)
+	for k in range(n_classes):
+		if not isinstance(linked_dfs[k], DataFrames):
+			raise TypeError('class_dfs must contain DataFrames')
+		dfs = linked_dfs[k]
+		if not dfs._is_computational_ready(activate=True):
+			raise ValueError('DataFrames is not computational-ready')
+		if dfs._n_alts() != (<DataFrames>linked_dfs[0])._n_alts():
+			raise ValueError('class models have differing numbers of alternatives')
+		if dfs._n_cases() != n_cases:
+			raise ValueError('class models have differing numbers of cases')
+		if dfs._n_model_params != n_params:
+			raise ValueError('class models do not share the parameter frame')
+	dfs = linked_dfs[0]
+	if dfs._data_ch is None and not probability_only:
+		raise ValueError('DataFrames does not define data_ch')
+	if dfs._data_av is None:
+		raise ValueError('DataFrames does not define data_av')
+	return linked_dfs
+
+
+cdef inline void _latent_class_d_utility_onecase(
+		PyObject*       dfs,
+		int             c,
+		l4_float_t[:]   U,
+		l4_float_t[:,:] dU,
+		int             n_alts,
+) nogil:
+	(<DataFrames>dfs)._compute_d_utility_onecase(c, U, dU, n_alts)
+
+
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def latent_class_d_log_likelihood_from_dataframes_all_rows(
+		DataFrames  membership_dfs,
+		class_dfs,
+		int         num_threads=1,
+		bint        return_dll=True,
+		bint        return_bhhh=False,
+		int         start_case=0,
+		int         stop_case=-1,
+		int         step_case=1,
+		int         persist=0,
+		int         leave_out=-1,
+		int         keep_only=-1,
+		int         subsample= 1,
+		bint        probability_only=False,
+):
+	"""
+	Compute a latent class log likelihood and its derivatives in one pass.
+
+	For each case, the class membership probabilities and the MNL
+	probabilities within each class are computed, and the log likelihood,
+	its derivative and the BHHH matrix are accumulated directly into
+	per-thread buffers, so that no [cases, alts, params] array of
+	probability derivatives is ever built.
+
+	Parameters
+	----------
+	membership_dfs : DataFrames
+		Linked to the class membership model, with one alternative per class
+		and current parameter values read in.
+	class_dfs : Sequence[DataFrames]
+		Linked to the class models (which must be MNL models), in the same
+		order as the alternatives of `membership_dfs`, with current parameter
+		values read in.  All models must share the same parameter frame.
+
+	Returns
+	-------
+	dictx
+	"""
+	cdef:
+		int c = 0
+		int c_local = 0
+		int i, j, k, v, v2
+		int n_cases = membership_dfs._n_cases()
+		int n_cases_local
+		int n_classes = len(class_dfs)
+		int n_alts
+		int n_params= membership_dfs._n_model_params
+		int thread_number = 0
+		int store_number_P
+		int storage_size_P
+		PyObject**        class_ptrs
+		DataFrames        dfs0
+		l4_float_t[:,:]   U_member, pi_member, exp_member, dU_member_mean
+		l4_float_t[:,:,:] dU_member
+		l4_float_t[:,:]   U_class, exp_class, P_class, dU_class_mean
+		l4_float_t[:,:,:] dU_class
+		l4_float_t[:,:]   probability
+		l4_float_t[:,:,:] d_probability
+		l4_float_t[:,:]   dLL_total
+		l4_float_t[:,:,:] bhhh_total
+		l4_float_t[:]     LL_case
+		l4_float_t        ll = 0
+		l4_float_t        ll_temp
+		l4_float_t        weight, this_ch, pr_k, grad_v
+		object            linked_dfs
+
+	linked_dfs = _check_latent_class_dataframes(membership_dfs, class_dfs, probability_only)
+	dfs0 = linked_dfs[0]
+	n_alts = dfs0._n_alts()
+	if step_case <= 0:
+		raise NotImplementedError('non-positive step')
+
+	if num_threads <= 0:
+		num_threads = 1
+	if stop_case<0:
+		stop_case = n_cases
+	if return_bhhh:
+		# must compute dll to get bhhh
+		return_dll = True
+	if probability_only:
+		return_dll = return_bhhh = False
+
+	n_cases_local = ((stop_case - start_case) // step_case) + (1 if (stop_case - start_case) % step_case else 0)
+	if probability_only:
+		persist |= PERSIST_PROBABILITY
+	storage_size_P = n_cases_local if persist & PERSIST_PROBABILITY else num_threads
+
+	U_member       = thread_local_zeros(num_threads, [n_classes], l4_float_dtype)
+	exp_member     = thread_local_zeros(num_threads, [n_classes], l4_float_dtype)
+	pi_member      = thread_local_zeros(num_threads, [n_classes], l4_float_dtype)
+	dU_member      = thread_local_zeros(num_threads, [n_classes, n_params], l4_float_dtype)
+	dU_member_mean = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+	U_class        = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	exp_class      = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	P_class        = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	dU_class       = thread_local_zeros(num_threads, [n_alts, n_params], l4_float_dtype)
+	dU_class_mean  = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+	probability    = working_zeros(storage_size_P, num_threads, [n_alts], l4_float_dtype)
+	d_probability  = thread_local_zeros(num_threads, [n_alts, n_params], l4_float_dtype)
+	dLL_total      = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+	LL_case        = working_zeros(n_cases_local if persist & PERSIST_LOGLIKE_CASEWISE else num_threads, num_threads, [], l4_float_dtype)
+	if return_bhhh:
+		bhhh_total = thread_local_zeros(num_threads, [n_params, n_params], l4_float_dtype)
+	else:
+		bhhh_total = thread_local_zeros(num_threads, [1, 1], l4_float_dtype)
+
+	class_ptrs = <PyObject**> malloc(n_classes * sizeof(PyObject*))
+	if class_ptrs == NULL:
+		raise MemoryError()
+	try:
+		for k in range(n_classes):
+			class_ptrs[k] = <PyObject*> linked_dfs[k]
+
+		with nogil, parallel(num_threads=num_threads):
+			thread_number = threadid()
+
+			for c in prange(start_case, stop_case, step_case):
+
+				if leave_out >= 0 and c % subsample == leave_out:
+					continue
+
+				if keep_only >= 0 and c % subsample != keep_only:
+					continue
+
+				c_local = (c-start_case)//step_case
+				store_number_P = c_local if persist & PERSIST_PROBABILITY else thread_number
+
+				if dfs0._array_wt is not None:
+					weight = dfs0._array_wt[c]
+				else:
+					weight = 1
+
+				# Class membership probabilities
+				membership_dfs._compute_d_utility_onecase(
+					c, U_member[thread_number], dU_member[thread_number], n_classes,
+				)
+				_mnl_probability_from_utility(
+					n_classes,
+					&U_member[thread_number,0],
+					&exp_member[thread_number,0],
+					&pi_member[thread_number,0],
+				)
+				if return_dll:
+					for v in range(n_params):
+						dU_member_mean[thread_number,v] = 0
+						for k in range(n_classes):
+							dU_member_mean[thread_number,v] += pi_member[thread_number,k] * dU_member[thread_number,k,v]
+
+				for j in range(n_alts):
+					probability[store_number_P,j] = 0
+					if return_dll:
+						for v in range(n_params):
+							d_probability[thread_number,j,v] = 0
+
+				# Within-class probabilities, mixed over classes
+				for k in range(n_classes):
+					_latent_class_d_utility_onecase(
+						class_ptrs[k], c, U_class[thread_number], dU_class[thread_number], n_alts,
+					)
+					_mnl_probability_from_utility(
+						n_alts,
+						&U_class[thread_number,0],
+						&exp_class[thread_number,0],
+						&P_class[thread_number,0],
+					)
+					for j in range(n_alts):
+						probability[store_number_P,j] += pi_member[thread_number,k] * P_class[thread_number,j]
+					if not return_dll:
+						continue
+					for v in range(n_params):
+						dU_class_mean[thread_number,v] = 0
+						for j in range(n_alts):
+							dU_class_mean[thread_number,v] += P_class[thread_number,j] * dU_class[thread_number,j,v]
+					for j in range(n_alts):
+						if dfs0._array_ch[c,j] == 0:
+							continue
+						pr_k = pi_member[thread_number,k] * P_class[thread_number,j]
+						if pr_k == 0:
+							continue
+						for v in range(n_params):
+							d_probability[thread_number,j,v] += pr_k * (
+								dU_class[thread_number,j,v] - dU_class_mean[thread_number,v]
+								+ dU_member[thread_number,k,v] - dU_member_mean[thread_number,v]
+							)
+
+				if probability_only:
+					continue
+
+				ll_temp = _mnl_log_likelihood_from_probability_stride(
+					n_alts,
+					probability[store_number_P],
+					dfs0._array_ch[c,:],
+				) * weight
+				ll += ll_temp
+				LL_case[c_local if persist & PERSIST_LOGLIKE_CASEWISE else thread_number] += ll_temp
+
+				if return_dll and weight:
+					for j in range(n_alts):
+						this_ch = dfs0._array_ch[c,j]
+						if this_ch == 0 or probability[store_number_P,j] <= 0:
+							continue
+						for v in range(n_params):
+							d_probability[thread_number,j,v] /= probability[store_number_P,j]
+							dLL_total[thread_number,v] += d_probability[thread_number,j,v] * this_ch * weight
+						if return_bhhh:
+							for v in range(n_params):
+								grad_v = d_probability[thread_number,j,v] * this_ch * weight
+								if grad_v == 0:
+									continue
+								for v2 in range(n_params):
+									bhhh_total[thread_number,v,v2] += grad_v * d_probability[thread_number,j,v2]
+	finally:
+		free(class_ptrs)
+
+	from ..util import dictx
+	if probability_only:
+		ll = numpy.nan
+	result = dictx(
+		ll=ll * dfs0._weight_normalization,
+	)
+	if persist & PERSIST_PROBABILITY:
+		result.probability = probability.base
+	if persist & PERSIST_LOGLIKE_CASEWISE:
+		result.ll_casewise = LL_case.base * dfs0._weight_normalization
+	if return_dll:
+		result.dll = pandas.Series(
+			data=dLL_total.base.sum(0) * dfs0._weight_normalization,
+			index=dfs0._model_param_names,
+		)
+	if return_bhhh:
+		result.bhhh = bhhh_total.base.sum(0) * dfs0._weight_normalization
+	return result
+
+
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def latent_class_panel_d_log_likelihood_from_dataframes(
+		DataFrames  membership_dfs,
+		class_dfs,
+		int64_t[:]  panel_ptr,
+		int64_t[:]  panel_cases,
+		int         num_threads=1,
+		bint        return_dll=True,
+		bint        return_bhhh=False,
+		int         start_group=0,
+		int         stop_group=-1,
+		int         step_group=1,
+		int         persist=0,
+		int         leave_out=-1,
+		int         keep_only=-1,
+		int         subsample= 1,
+):
+	"""
+	Compute a panel latent class log likelihood and its derivatives in one pass.
+
+	Class membership is evaluated once per group (e.g. per person), and
+	the likelihood of each class is the product of the within-class MNL
+	probabilities of the chosen alternatives over all of the group's cases,
+	accumulated in log space.  The log likelihood, its derivative and the
+	BHHH matrix (with one outer product per group) are accumulated directly
+	into per-thread buffers.
+
+	Parameters
+	----------
+	membership_dfs : DataFrames
+		Linked to the class membership model, with one alternative per class
+		and current parameter values read in.  The membership data of the
+		first case of each group is used for the whole group.
+	class_dfs : Sequence[DataFrames]
+		Linked to the class models (which must be MNL models), in the same
+		order as the alternatives of `membership_dfs`, with current parameter
+		values read in.  All models must share the same parameter frame.
+	panel_ptr : int64_t[n_groups+1]
+		Offsets into `panel_cases` where each group starts.
+	panel_cases : int64_t[n_cases]
+		Case indexes, ordered by group.
+	start_group, stop_group, step_group, leave_out, keep_only, subsample : int
+		Select groups, in the same way as cases are selected in the
+		non-panel kernels.  The weight of the first case of each group is
+		used for the whole group.
+
+	Returns
+	-------
+	dictx
+	"""
+	cdef:
+		int g = 0
+		int g_local = 0
+		int64_t c, i
+		int j, k, v, v2
+		int n_groups = panel_ptr.shape[0] - 1
+		int n_groups_local
+		int n_classes = len(class_dfs)
+		int n_alts
+		int n_params= membership_dfs._n_model_params
+		int thread_number = 0
+		PyObject**        class_ptrs
+		DataFrames        dfs0
+		l4_float_t[:,:]   U_member, pi_member, exp_member, dU_member_mean
+		l4_float_t[:,:,:] dU_member
+		l4_float_t[:,:]   U_class, exp_class, P_class
+		l4_float_t[:,:,:] dU_class
+		l4_float_t[:,:]   log_L_class
+		l4_float_t[:,:,:] d_log_L_class
+		l4_float_t[:,:]   dLL_group
+		l4_float_t[:,:]   dLL_total
+		l4_float_t[:,:,:] bhhh_total
+		l4_float_t[:]     LL_group
+		l4_float_t        ll = 0
+		l4_float_t        ll_temp, max_joint, sum_joint
+		l4_float_t        weight, this_ch, mean_dU, posterior
+		object            linked_dfs
+
+	linked_dfs = _check_latent_class_dataframes(membership_dfs, class_dfs)
+	dfs0 = linked_dfs[0]
+	n_alts = dfs0._n_alts()
+	if panel_cases.shape[0] != dfs0._n_cases():
+		raise ValueError(f'panel_cases has {panel_cases.shape[0]} cases, but there are {dfs0._n_cases()} cases')
+	if step_group <= 0:
+		raise NotImplementedError('non-positive step')
+
+	if num_threads <= 0:
+		num_threads = 1
+	if stop_group<0:
+		stop_group = n_groups
+	if return_bhhh:
+		# must compute dll to get bhhh
+		return_dll = True
+
+	n_groups_local = ((stop_group - start_group) // step_group) + (1 if (stop_group - start_group) % step_group else 0)
+
+	U_member       = thread_local_zeros(num_threads, [n_classes], l4_float_dtype)
+	exp_member     = thread_local_zeros(num_threads, [n_classes], l4_float_dtype)
+	pi_member      = thread_local_zeros(num_threads, [n_classes], l4_float_dtype)
+	dU_member      = thread_local_zeros(num_threads, [n_classes, n_params], l4_float_dtype)
+	dU_member_mean = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+	U_class        = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	exp_class      = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	P_class        = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	dU_class       = thread_local_zeros(num_threads, [n_alts, n_params], l4_float_dtype)
+	log_L_class    = thread_local_zeros(num_threads, [n_classes], l4_float_dtype)
+	d_log_L_class  = thread_local_zeros(num_threads, [n_classes, n_params], l4_float_dtype)
+	dLL_group      = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+	dLL_total      = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+	LL_group       = working_zeros(n_groups_local if persist & PERSIST_LOGLIKE_CASEWISE else num_threads, num_threads, [], l4_float_dtype)
+	if return_bhhh:
+		bhhh_total = thread_local_zeros(num_threads, [n_params, n_params], l4_float_dtype)
+	else:
+		bhhh_total = thread_local_zeros(num_threads, [1, 1], l4_float_dtype)
+
+	class_ptrs = <PyObject**> malloc(n_classes * sizeof(PyObject*))
+	if class_ptrs == NULL:
+		raise MemoryError()
+	try:
+		for k in range(n_classes):
+			class_ptrs[k] = <PyObject*> linked_dfs[k]
+
+		with nogil, parallel(num_threads=num_threads):
+			thread_number = threadid()
+
+			for g in prange(start_group, stop_group, step_group):
+
+				if leave_out >= 0 and g % subsample == leave_out:
+					continue
+
+				if keep_only >= 0 and g % subsample != keep_only:
+					continue
+
+				if panel_ptr[g+1] == panel_ptr[g]:
+					continue
+
+				g_local = (g-start_group)//step_group
+				c = panel_cases[panel_ptr[g]]
+
+				if dfs0._array_wt is not None:
+					weight = dfs0._array_wt[c]
+				else:
+					weight = 1
+				if weight == 0:
+					continue
+
+				# Class membership probabilities, once per group
+				membership_dfs._compute_d_utility_onecase(
+					c, U_member[thread_number], dU_member[thread_number], n_classes,
+				)
+				_mnl_probability_from_utility(
+					n_classes,
+					&U_member[thread_number,0],
+					&exp_member[thread_number,0],
+					&pi_member[thread_number,0],
+				)
+
+				# Log likelihood of the group's choices within each class
+				for k in range(n_classes):
+					log_L_class[thread_number,k] = 0
+					if return_dll:
+						for v in range(n_params):
+							d_log_L_class[thread_number,k,v] = 0
+					for i in range(panel_ptr[g], panel_ptr[g+1]):
+						c = panel_cases[i]
+						_latent_class_d_utility_onecase(
+							class_ptrs[k], c, U_class[thread_number], dU_class[thread_number], n_alts,
+						)
+						_mnl_probability_from_utility(
+							n_alts,
+							&U_class[thread_number,0],
+							&exp_class[thread_number,0],
+							&P_class[thread_number,0],
+						)
+						log_L_class[thread_number,k] += _mnl_log_likelihood_from_probability_stride(
+							n_alts,
+							P_class[thread_number],
+							dfs0._array_ch[c,:],
+						)
+						if return_dll:
+							for j in range(n_alts):
+								this_ch = dfs0._array_ch[c,j]
+								if this_ch == 0:
+									continue
+								for v in range(n_params):
+									d_log_L_class[thread_number,k,v] += this_ch * dU_class[thread_number,j,v]
+							this_ch = 0
+							for j in range(n_alts):
+								this_ch = this_ch + dfs0._array_ch[c,j]
+							for v in range(n_params):
+								mean_dU = 0
+								for j in range(n_alts):
+									mean_dU = mean_dU + P_class[thread_number,j] * dU_class[thread_number,j,v]
+								d_log_L_class[thread_number,k,v] -= this_ch * mean_dU
+
+				# Mix over classes, in log space
+				max_joint = -INFINITY32
+				for k in range(n_classes):
+					if pi_member[thread_number,k] > 0:
+						U_member[thread_number,k] = log(pi_member[thread_number,k]) + log_L_class[thread_number,k]
+						if U_member[thread_number,k] > max_joint:
+							max_joint = U_member[thread_number,k]
+					else:
+						U_member[thread_number,k] = -INFINITY32
+				sum_joint = 0
+				if max_joint > -INFINITY32:
+					for k in range(n_classes):
+						if U_member[thread_number,k] > -INFINITY32:
+							sum_joint = sum_joint + exp(U_member[thread_number,k] - max_joint)
+					ll_temp = (max_joint + log(sum_joint)) * weight
+				else:
+					ll_temp = -INFINITY32
+				ll += ll_temp
+				LL_group[g_local if persist & PERSIST_LOGLIKE_CASEWISE else thread_number] += ll_temp
+
+				if return_dll and max_joint > -INFINITY32:
+					for v in range(n_params):
+						dU_member_mean[thread_number,v] = 0
+						for k in range(n_classes):
+							dU_member_mean[thread_number,v] += pi_member[thread_number,k] * dU_member[thread_number,k,v]
+						dLL_group[thread_number,v] = 0
+					for k in range(n_classes):
+						if U_member[thread_number,k] > -INFINITY32:
+							posterior = exp(U_member[thread_number,k] - max_joint) / sum_joint
+						else:
+							continue
+						for v in range(n_params):
+							dLL_group[thread_number,v] += posterior * (
+								d_log_L_class[thread_number,k,v]
+								+ dU_member[thread_number,k,v] - dU_member_mean[thread_number,v]
+							)
+					for v in range(n_params):
+						dLL_total[thread_number,v] += dLL_group[thread_number,v] * weight
+					if return_bhhh:
+						for v in range(n_params):
+							if dLL_group[thread_number,v] == 0:
+								continue
+							for v2 in range(n_params):
+								bhhh_total[thread_number,v,v2] += dLL_group[thread_number,v] * dLL_group[thread_number,v2] * weight
+	finally:
+		free(class_ptrs)
+
+	from ..util import dictx
+	result = dictx(
+		ll=ll * dfs0._weight_normalization,
+	)
+	if persist & PERSIST_LOGLIKE_CASEWISE:
+		result.ll_casewise = LL_group.base * dfs0._weight_normalization
+	if return_dll:
+		result.dll = pandas.Series(
+			data=dLL_total.base.sum(0) * dfs0._weight_normalization,
+			index=dfs0._model_param_names,
+		)
+	if return_bhhh:
+		result.bhhh = bhhh_total.base.sum(0) * dfs0._weight_normalization
+	return result
+
+
+############
+
+cdef double _radical_inverse(int64_t n, int64_t base) nogil:
+	cdef:
+		double result = 0
+		double f = 1.0 / base
+	while n > 0:
+		result = result + (n % base) * f
+		n = n // base
+		f = f / base
+	return result
+
+
+cdef double _sobol_uniform(int64_t n, uint32_t* v, uint32_t shift) nogil:
+	cdef:
+		int64_t gray = n ^ (n >> 1)
+		uint32_t x = 0
+		int k = 0
+	while gray > 0 and k < 32:
+		if gray & 1:
+			x = x ^ v[k]
+		gray = gray >> 1
+		k = k + 1
+	x = x ^ shift
+	return (x + 0.5) / 4294967296.0
+
+
+cdef double _inverse_normal_cdf(double p) nogil:
+	# Acklam's rational approximation, relative error below 1.15e-9
+	cdef double q, r
+	if p < 1e-12:
+		p = 1e-12
+	elif p > 1 - 1e-12:
+		p = 1 - 1e-12
+	if p < 0.02425:
+		q = sqrt(-2 * log(p))
+		return (((((-7.784894002430293e-03 * q - 3.223964580411365e-01) * q - 2.400758277161838e+00) * q
+				- 2.549732539343734e+00) * q + 4.374664141464968e+00) * q + 2.938163982698783e+00) / (
+				(((7.784695709041462e-03 * q + 3.224671290700398e-01) * q + 2.445134137142996e+00) * q
+				+ 3.754408661907416e+00) * q + 1)
+	if p > 1 - 0.02425:
+		return -_inverse_normal_cdf(1 - p)
+	q = p - 0.5
+	r = q * q
+	return (((((-3.969683028665376e+01 * r + 2.209460984245205e+02) * r - 2.759285104469687e+02) * r
+			+ 1.383577518672690e+02) * r - 3.066479806614716e+01) * r + 2.506628277459239e+00) * q / (
+			((((-5.447609879822406e+01 * r + 1.615858368580409e+02) * r - 1.556989798598866e+02) * r
+			+ 6.680131188771972e+01) * r - 1.328068155288572e+01) * r + 1)
+
+
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def mixed_logit_d_log_likelihood_from_dataframes(
+		DataFrames  dfs,
+		int[:]      mixture_mean,
+		int[:]      mixture_sigma,
+		int8_t[:]   mixture_dist,
+		int64_t[:]  panel_ptr,
+		int64_t[:]  panel_cases,
+		int         n_draws=100,
+		draw_type='halton',
+		int         seed=0,
+		int         num_threads=1,
+		bint        return_dll=True,
+		bint        return_bhhh=False,
+		int         start_group=0,
+		int         stop_group=-1,
+		int         step_group=1,
+		int         persist=0,
+		int         leave_out=-1,
+		int         keep_only=-1,
+		int         subsample= 1,
+		bint        probability_only=False,
+):
+	"""
+	Compute a simulated mixed logit log likelihood and its derivatives.
+
+	The utility of each case is computed once at the mean parameter values,
+	and the random part of each coefficient is added for each draw, using
+	the derivative of utility w.r.t. the mean parameter as the data that
+	the coefficient multiplies.  Draws are generated on demand from their
+	index in a quasi-random sequence (see :mod:`larch.model.draws`), so no
+	[cases, draws] array is built.  The simulated probabilities and the
+	log likelihood of each draw, and its derivative, are accumulated in
+	per-thread buffers.
+
+	Parameters
+	----------
+	dfs : DataFrames
+		Linked to an MNL model without a quantity function, with current
+		parameter values read in.  Holdfast flags must be released for the
+		mean parameters, so that the data they multiply is available.
+	mixture_mean, mixture_sigma : int[n_dims]
+		The positions in the parameter frame of the mean and the standard
+		deviation parameters of each random coefficient.
+	mixture_dist : int8_t[n_dims]
+		The distribution of each random coefficient, 0 for normal, or 1 for
+		lognormal (in which case the mean and standard deviation are those of
+		the log of the coefficient).
+	panel_ptr : int64_t[n_groups+1]
+		Offsets into `panel_cases` where each group starts.  The random
+		coefficients are drawn once per group.
+	panel_cases : int64_t[n_cases]
+		Case indexes, ordered by group.
+	n_draws : int
+	draw_type : {'halton', 'sobol'}
+	seed : int
+		Sets the random shift applied to the quasi-random sequence.
+	start_group, stop_group, step_group, leave_out, keep_only, subsample : int
+		Select groups, in the same way as cases are selected in the
+		non-panel kernels.  The weight of the first case of each group is
+		used for the whole group.
+
+	Returns
+	-------
+	dictx
+		If `persist` includes PERSIST_PROBABILITY, the simulated
+		probability is given for all cases, with zeros for cases in
+		groups that are not selected.
+	"""
+	from .draws import _draw_type_code, halton_bases, sobol_direction_numbers, draw_shifts, DRAW_TYPES
+	cdef:
+		int g = 0
+		int g_local = 0
+		int64_t c, i, n
+		int j, d, r, v, v2
+		int n_groups = panel_ptr.shape[0] - 1
+		int n_groups_local
+		int n_cases = dfs._n_cases()
+		int n_alts = dfs._n_alts()
+		int n_params = dfs._n_model_params
+		int n_dims = mixture_mean.shape[0]
+		int thread_number = 0
+		int store_number_P
+		int i_draw_type = _draw_type_code(draw_type)
+		int64_t[:]        bases
+		uint32_t[:,:]     sobol_v
+		uint32_t[:]       shift_bits
+		double[:]         shift
+		double[:]         mean_value
+		double[:]         sigma_value
+		l4_float_t[:,:]   U, U_draw, exp_U, P_draw, resid
+		l4_float_t[:,:,:] dU
+		double[:,:]       delta, d_coef_mean, d_coef_sigma
+		l4_float_t[:,:]   log_L_draw
+		l4_float_t[:,:,:] d_log_L_draw
+		l4_float_t[:,:]   dLL_group
+		l4_float_t[:,:]   dLL_total
+		l4_float_t[:,:,:] bhhh_total
+		l4_float_t[:,:]   probability
+		l4_float_t[:]     LL_group
+		l4_float_t        ll = 0
+		l4_float_t        ll_temp, max_joint, sum_joint, total_ch, sum_resid
+		l4_float_t        weight, posterior
+		double            u, z, b
+
+	if not dfs._is_computational_ready(activate=True):
+		raise ValueError('DataFrames is not computational-ready')
+	if dfs._data_ch is None and not probability_only:
+		raise ValueError('DataFrames does not define data_ch')
+	if dfs._data_av is None:
+		raise ValueError('DataFrames does not define data_av')
+	if panel_cases.shape[0] != n_cases:
+		raise ValueError(f'panel_cases has {panel_cases.shape[0]} cases, but there are {n_cases} cases')
+	if mixture_sigma.shape[0] != n_dims or mixture_dist.shape[0] != n_dims:
+		raise ValueError('mixture_mean, mixture_sigma and mixture_dist must have the same length')
+	if n_draws <= 0:
+		raise ValueError('n_draws must be positive')
+	if step_group <= 0:
+		raise NotImplementedError('non-positive step')
+	if i_draw_type == DRAW_TYPES['sobol'] and (<int64_t>n_groups) * n_draws >= 4294967295:
+		raise ValueError('too many groups and draws for Sobol draws')
+
+	if num_threads <= 0:
+		num_threads = 1
+	if stop_group<0:
+		stop_group = n_groups
+	if return_bhhh:
+		# must compute dll to get bhhh
+		return_dll = True
+	if probability_only:
+		return_dll = return_bhhh = False
+		persist |= PERSIST_PROBABILITY
+
+	n_groups_local = ((stop_group - start_group) // step_group) + (1 if (stop_group - start_group) % step_group else 0)
+
+	bases = halton_bases(n_dims)
+	sobol_v = sobol_direction_numbers(n_dims if i_draw_type == DRAW_TYPES['sobol'] else 0)
+	shift = draw_shifts(n_dims, seed)
+	shift_bits = (numpy.asarray(shift) * 4294967296.0).astype(numpy.uint32)
+	pvalues = dfs._model._frame['value'].values.astype(numpy.float64)
+	mean_value = pvalues[numpy.asarray(mixture_mean)]
+	sigma_value = pvalues[numpy.asarray(mixture_sigma)]
+
+	U              = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	U_draw         = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	exp_U          = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	P_draw         = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	resid          = thread_local_zeros(num_threads, [n_alts], l4_float_dtype)
+	dU             = thread_local_zeros(num_threads, [n_alts, n_params], l4_float_dtype)
+	delta          = thread_local_zeros(num_threads, [n_dims], numpy.float64)
+	d_coef_mean    = thread_local_zeros(num_threads, [n_dims], numpy.float64)
+	d_coef_sigma   = thread_local_zeros(num_threads, [n_dims], numpy.float64)
+	log_L_draw     = thread_local_zeros(num_threads, [n_draws], l4_float_dtype)
+	d_log_L_draw   = thread_local_zeros(num_threads, [n_draws, n_params if return_dll else 1], l4_float_dtype)
+	dLL_group      = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+	dLL_total      = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+	probability    = numpy.zeros([n_cases if persist & PERSIST_PROBABILITY else 1, n_alts], dtype=l4_float_dtype)
+	LL_group       = working_zeros(n_groups_local if persist & PERSIST_LOGLIKE_CASEWISE else num_threads, num_threads, [], l4_float_dtype)
+	if return_bhhh:
+		bhhh_total = thread_local_zeros(num_threads, [n_params, n_params], l4_float_dtype)
+	else:
+		bhhh_total = thread_local_zeros(num_threads, [1, 1], l4_float_dtype)
+
+	with nogil, parallel(num_threads=num_threads):
+		thread_number = threadid()
+
+		for g in prange(start_group, stop_group, step_group):
+
+			if leave_out >= 0 and g % subsample == leave_out:
+				continue
+
+			if keep_only >= 0 and g % subsample != keep_only:
+				continue
+
+			if panel_ptr[g+1] == panel_ptr[g]:
+				continue
+
+			g_local = (g-start_group)//step_group
+			c = panel_cases[panel_ptr[g]]
+
+			if dfs._array_wt is not None:
+				weight = dfs._array_wt[c]
+			else:
+				weight = 1
+			if weight == 0 and not probability_only:
+				continue
+
+			for r in range(n_draws):
+				log_L_draw[thread_number,r] = 0
+				if return_dll:
+					for v in range(n_params):
+						d_log_L_draw[thread_number,r,v] = 0
+
+			for i in range(panel_ptr[g], panel_ptr[g+1]):
+				c = panel_cases[i]
+				dfs._compute_d_utility_onecase(c, U[thread_number], dU[thread_number], n_alts)
+				if not probability_only:
+					total_ch = 0
+					for j in range(n_alts):
+						total_ch = total_ch + dfs._array_ch[c,j]
+
+				for r in range(n_draws):
+					n = (<int64_t>g) * n_draws + r + 1
+
+					# Random coefficients for this draw
+					for d in range(n_dims):
+						if i_draw_type == 1:
+							u = _sobol_uniform(n, &sobol_v[d,0], shift_bits[d])
+						else:
+							u = _radical_inverse(n, bases[d]) + shift[d]
+							if u >= 1:
+								u = u - 1
+						z = _inverse_normal_cdf(u)
+						if mixture_dist[d] == 1:
+							b = exp(mean_value[d] + sigma_value[d] * z)
+							delta[thread_number,d] = b - mean_value[d]
+							d_coef_mean[thread_number,d] = b - 1
+							d_coef_sigma[thread_number,d] = z * b
+						else:
+							delta[thread_number,d] = sigma_value[d] * z
+							d_coef_mean[thread_number,d] = 0
+							d_coef_sigma[thread_number,d] = z
+
+					for j in range(n_alts):
+						U_draw[thread_number,j] = U[thread_number,j]
+						for d in range(n_dims):
+							U_draw[thread_number,j] = U_draw[thread_number,j] + delta[thread_number,d] * dU[thread_number,j,mixture_mean[d]]
+					_mnl_probability_from_utility(
+						n_alts,
+						&U_draw[thread_number,0],
+						&exp_U[thread_number,0],
+						&P_draw[thread_number,0],
+					)
+
+					if persist & PERSIST_PROBABILITY:
+						for j in range(n_alts):
+							probability[c,j] += P_draw[thread_number,j] / n_draws
+
+					if probability_only:
+						continue
+
+					log_L_draw[thread_number,r] += _mnl_log_likelihood_from_probability_stride(
+						n_alts,
+						P_draw[thread_number],
+						dfs._array_ch[c,:],
+					)
+
+					if return_dll:
+						for j in range(n_alts):
+							resid[thread_number,j] = dfs._array_ch[c,j] - total_ch * P_draw[thread_number,j]
+						for v in range(n_params):
+							sum_resid = 0
+							for j in range(n_alts):
+								sum_resid = sum_resid + resid[thread_number,j] * dU[thread_number,j,v]
+							d_log_L_draw[thread_number,r,v] += sum_resid
+						for d in range(n_dims):
+							sum_resid = 0
+							for j in range(n_alts):
+								sum_resid = sum_resid + resid[thread_number,j] * dU[thread_number,j,mixture_mean[d]]
+							d_log_L_draw[thread_number,r,mixture_mean[d]] += d_coef_mean[thread_number,d] * sum_resid
+							d_log_L_draw[thread_number,r,mixture_sigma[d]] += d_coef_sigma[thread_number,d] * sum_resid
+
+			if probability_only:
+				continue
+
+			# Average the likelihood over draws, in log space
+			max_joint = -INFINITY32
+			for r in range(n_draws):
+				if log_L_draw[thread_number,r] > max_joint:
+					max_joint = log_L_draw[thread_number,r]
+			sum_joint = 0
+			if max_joint > -INFINITY32:
+				for r in range(n_draws):
+					sum_joint = sum_joint + exp(log_L_draw[thread_number,r] - max_joint)
+				ll_temp = (max_joint + log(sum_joint / n_draws)) * weight
+			else:
+				ll_temp = -INFINITY32
+			ll += ll_temp
+			LL_group[g_local if persist & PERSIST_LOGLIKE_CASEWISE else thread_number] += ll_temp
+
+			if return_dll and max_joint > -INFINITY32:
+				for v in range(n_params):
+					dLL_group[thread_number,v] = 0
+				for r in range(n_draws):
+					posterior = exp(log_L_draw[thread_number,r] - max_joint) / sum_joint
+					if posterior == 0:
+						continue
+					for v in range(n_params):
+						dLL_group[thread_number,v] += posterior * d_log_L_draw[thread_number,r,v]
+				for v in range(n_params):
+					dLL_total[thread_number,v] += dLL_group[thread_number,v] * weight
+				if return_bhhh:
+					for v in range(n_params):
+						if dLL_group[thread_number,v] == 0:
+							continue
+						for v2 in range(n_params):
+							bhhh_total[thread_number,v,v2] += dLL_group[thread_number,v] * dLL_group[thread_number,v2] * weight
+
+	from ..util import dictx
+	if probability_only:
+		ll = numpy.nan
+	result = dictx(
+		ll=ll * dfs._weight_normalization,
+	)
+	if persist & PERSIST_PROBABILITY:
+		result.probability = probability.base
+	if persist & PERSIST_LOGLIKE_CASEWISE:
+		result.ll_casewise = LL_group.base * dfs._weight_normalization
+	if return_dll:
+		result.dll = pandas.Series(
+			data=dLL_total.base.sum(0) * dfs._weight_normalization,
+			index=dfs._model_param_names,
+		)
+	if return_bhhh:
+		result.bhhh = bhhh_total.base.sum(0) * dfs._weight_normalization
+	return result
+
+
 ############
 
 @cython.boundscheck(False)
@@ -1,5 +1,9 @@
 
 
+import multiprocessing
+import numpy
+import pandas
+
 from .abstract_model import AbstractChoiceModel
 from . import persist_flags
 from ..exceptions import ParameterNotInModelWarning
@@ -19,6 +23,7 @@ class ModelGroup(AbstractChoiceModel, MutableSequence):
 			title=None,
 			dataservice=None,
 			constraints=None,
+			n_threads=-1,
 	):
 		super().__init__(
 			parameters=parameters,
@@ -30,6 +35,7 @@ class ModelGroup(AbstractChoiceModel, MutableSequence):
 		self._dataframes = None
 		self._mangled = True
 		self.constraints = constraints
+		self.n_threads = n_threads
 
 	def __getitem__(self, x):
 		return self._k_models[x]
@@ -67,6 +73,78 @@ class ModelGroup(AbstractChoiceModel, MutableSequence):
 		"""
 		return sum(k.total_weight() for k in self._k_models)
 
+	@property
+	def n_threads(self):
+		"""
+		int : The total number of threads for evaluating the grouped models.
+
+		Grouped models are evaluated concurrently, and this thread budget
+		is shared among them in proportion to their numbers of cases.  Set
+		to -1 to use the number of CPUs.
+		"""
+		return self._n_threads
+
+	@n_threads.setter
+	def n_threads(self, value):
+		if value <= 0:
+			self._n_threads = multiprocessing.cpu_count()
+		else:
+			self._n_threads = int(value)
+
+	def _thread_allocation(self):
+		"""
+		Share the thread budget among grouped models by their numbers of cases.
+
+		Each model gets at least one thread.
+
+		Returns
+		-------
+		ndarray
+		"""
+		sizes = numpy.asarray([k.n_cases for k in self._k_models], dtype=float)
+		if sizes.sum() <= 0:
+			return numpy.ones(len(sizes), dtype=int)
+		return numpy.maximum(1, numpy.floor(self.n_threads * sizes / sizes.sum())).astype(int)
+
+	def _map_models(self, func):
+		"""
+		Apply a function to each grouped model, concurrently where possible.
+
+		The compute kernels release the GIL, so the grouped models are
+		evaluated in a pool of threads, largest first, each with its share
+		of the thread budget.  Models are evaluated one at a time if there
+		is only one thread, or if any of them share the same dataframes.
+
+		Parameters
+		----------
+		func : callable
+			Called as ``func(model)`` for each grouped model.
+
+		Returns
+		-------
+		list
+			The results, in the order of the grouped models.
+		"""
+		models = self._k_models
+		dataframes_ids = {id(k.dataframes) for k in models}
+		if self.n_threads <= 1 or len(models) < 2 or len(dataframes_ids) < len(models):
+			return [func(k) for k in models]
+		from concurrent.futures import ThreadPoolExecutor
+		allocation = self._thread_allocation()
+		saved_threads = [getattr(k, 'n_threads', None) for k in models]
+		try:
+			for k, n in zip(models, allocation):
+				if hasattr(k, 'n_threads'):
+					k.n_threads = int(n)
+			order = numpy.argsort(-allocation, kind='stable')
+			with ThreadPoolExecutor(max_workers=min(len(models), self.n_threads)) as pool:
+				futures = {j: pool.submit(func, models[j]) for j in order}
+				return [futures[j].result() for j in range(len(models))]
+		finally:
+			for k, n in zip(models, saved_threads):
+				if n is not None:
+					k.n_threads = n
+
 	def unmangle(self):
 		super().unmangle()
 		for k in self._k_models:
@@ -144,7 +222,7 @@ class ModelGroup(AbstractChoiceModel, MutableSequence):
 
 		from ..util import dictx
 		self.__prep_for_compute(x)
-		ll2_parts = [m.loglike(persist=persist) for m in self._k_models]
+		ll2_parts = self._map_models(lambda m: m.loglike(persist=persist))
 		if not persist:
 			result = sum(ll2_parts)
 			self._check_if_best(result)
@@ -209,7 +287,7 @@ class ModelGroup(AbstractChoiceModel, MutableSequence):
 
 		from ..util import dictx
 		self.__prep_for_compute(x)
-		ll2_parts = [m.loglike2(persist=persist) for m in self._k_models]
+		ll2_parts = self._map_models(lambda m: m.loglike2(persist=persist))
 		dll = ll2_parts[0].dll
 		for y in ll2_parts[1:]:
 			dll = dll.add(y.dll, fill_value=0)
@@ -223,3 +301,73 @@ class ModelGroup(AbstractChoiceModel, MutableSequence):
 				ll2[key] = list(y[key] for y in ll2_parts)
 		self._check_if_best(ll2.ll)
 		return ll2
+
+	def loglike2_bhhh(
+			self,
+			x=None,
+			*,
+			return_series=False,
+			start_case=0,
+			stop_case=-1,
+			step_case=1,
+			persist=0,
+			leave_out=-1,
+			keep_only=-1,
+			subsample=-1,
+	):
+		"""
+		Compute a log like, it first deriv, and the BHHH approx of the Hessian.
+
+		Parameters
+		----------
+		x : {'null', 'init', 'best', array-like, dict, scalar}, optional
+			Values for the parameters.  See :ref:`set_values` for details.
+		return_series : bool
+			Whether to return the BHHH matrix as a DataFrame.  The
+			derivative is always returned as a Series.
+
+		Returns
+		-------
+		dictx
+			The log likelihood is given by key 'll', the first derivative
+			by key 'dll', and the BHHH matrix by 'bhhh'.
+		"""
+
+		if start_case != 0:
+			raise NotImplementedError('start_case != 0')
+		if stop_case != -1:
+			raise NotImplementedError('stop_case != -1')
+		if step_case != 1:
+			raise NotImplementedError('step_case != 1')
+		if leave_out != -1:
+			raise NotImplementedError('leave_out != -1')
+		if keep_only != -1:
+			raise NotImplementedError('keep_only != -1')
+		if subsample != -1:
+			raise NotImplementedError('subsample != -1')
+
+		from ..util import dictx
+		self.__prep_for_compute(x)
+		ll2_parts = self._map_models(lambda m: m.loglike2_bhhh(persist=persist, return_series=True))
+		index = self.pf.index
+		dll = pandas.Series(0.0, index=index)
+		bhhh = pandas.DataFrame(0.0, index=index, columns=index)
+		for m, y in zip(self._k_models, ll2_parts):
+			m_dll = y.dll
+			if not isinstance(m_dll, pandas.Series):
+				m_dll = pandas.Series(m_dll, index=m.pf.index)
+			m_bhhh = y.bhhh
+			if not isinstance(m_bhhh, pandas.DataFrame):
+				m_bhhh = pandas.DataFrame(m_bhhh, index=m.pf.index, columns=m.pf.index)
+			dll = dll.add(m_dll, fill_value=0)[index]
+			bhhh = bhhh.add(m_bhhh, fill_value=0).loc[index, index]
+		ll2 = dictx(
+			ll=sum(y.ll for y in ll2_parts),
+			dll=dll,
+			bhhh=bhhh if return_series else bhhh.values,
+		)
+		for key in ll2_parts[0].keys():
+			if key not in {'ll','dll','bhhh'}:
+				ll2[key] = list(y[key] for y in ll2_parts)
+		self._check_if_best(ll2.ll)
+		return ll2
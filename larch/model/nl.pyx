@@ -6,6 +6,7 @@ from ..general_precision cimport l4_float_t
 
 include "fastmath.pxi"
 from libc.stdlib cimport malloc, free
+from libc.stdint cimport int64_t
 from libc.math cimport exp, log
 from numpy.math cimport expf, logf
 
@@ -16,6 +17,10 @@ from .tree_struct cimport TreeStructure
 from .controller cimport Model5c
 from .mnl cimport _mnl_log_likelihood_from_probability_stride
 from .persist_flags cimport *
+from .bhhh cimport _bhhh_push
+from .bhhh import BHHH_BLOCK_ROWS, bhhh_blocks, combine_bhhh
+from .scheduling import case_blocks
+from .thread_buffers import thread_local_zeros, working_zeros
 
 import numpy
 import pandas
@@ -219,8 +224,10 @@ cdef int _nl_d_loglike_from_d_probability(
 
 		bint            return_bhhh,
 		l4_float_t[:]   d_loglike_cum, # input [n_params]
-		l4_float_t[:,:] bhhh_cum,      # input [n_alts, n_params]
+		l4_float_t*     bhhh_cum,      # input [n_params, n_params], upper triangle
 		l4_float_t*     dLL_temp,      # temp  [n_params]
+		l4_float_t*     bhhh_block,    # temp  [BHHH_BLOCK_ROWS, n_params]
+		int*            bhhh_rows,     # temp  scalar
 
 ) nogil:
 	cdef int a, i, v, v2, flag=0
@@ -247,9 +254,7 @@ cdef int _nl_d_loglike_from_d_probability(
 				d_loglike_cum[i] += tempvalue
 
 			if return_bhhh:
-				for v in range(n_params):
-					for v2 in range(n_params):
-						bhhh_cum[v,v2] += dLL_temp[v] * dLL_temp[v2] * this_ch * weight
+				_bhhh_push(n_params, dLL_temp, this_ch * weight, bhhh_block, bhhh_rows, bhhh_cum)
 
 		else:
 			flag= -1 # ZeroProbWhenChosen
@@ -273,22 +278,26 @@ def d_loglike_from_d_probability(
 		int c = 0
 		int n_alts = probability.shape[1]
 		int n_params = d_probability.shape[2]
+		l4_float_t[:] d_LL_case
 		l4_float_t[:] d_LL_temp
 		l4_float_t[:] d_LL_cum
-		l4_float_t[:,:] bhhh_temp
 		l4_float_t[:,:] bhhh_cum
+		l4_float_t[:,:] bhhh_block
+		int bhhh_rows = 0
 		l4_float_t wt
 
 	try:
 		if probability.shape[0] != array_ch.shape[0] or probability.shape[1] != array_ch.shape[1]:
 			raise ValueError(f"probabilities.shape ~= choices.shape {probability.shape} != {array_ch.shape}")
 
+		d_LL_case = numpy.zeros(n_params, dtype=l4_float_dtype)
 		d_LL_temp = numpy.zeros(n_params, dtype=l4_float_dtype)
 		d_LL_cum = numpy.zeros(n_params, dtype=l4_float_dtype)
 		if return_bhhh:
 			bhhh_cum = numpy.zeros([n_params, n_params], dtype=l4_float_dtype)
 		else:
 			bhhh_cum = numpy.zeros([1,1], dtype=l4_float_dtype)
+		bhhh_block = numpy.zeros([BHHH_BLOCK_ROWS, max(n_params, 1)], dtype=l4_float_dtype)
 
 		for c in range(probability.shape[0]):
 
@@ -302,17 +311,19 @@ def d_loglike_from_d_probability(
 					n_alts,
 					probability[c],
 					d_probability[c],
-					d_LL_temp,
+					d_LL_case,
 					array_ch[c],
 					wt,
 					return_bhhh,
 					d_LL_cum,
-					bhhh_cum,
+					&bhhh_cum[0,0],
 					&d_LL_temp[0],
+					&bhhh_block[0,0],
+					&bhhh_rows,
 			)
 
 		if return_bhhh:
-			return d_LL_cum.base, bhhh_cum.base
+			return d_LL_cum.base, combine_bhhh(bhhh_cum.base[None, :, :], bhhh_block.base[None, :, :], numpy.array([bhhh_rows], dtype=numpy.intc))
 		return d_LL_cum.base
 	except:
 		logger.exception('error in d_loglike_from_d_probability')
@@ -437,10 +448,15 @@ def nl_d_log_likelihood_from_dataframes_all_rows(
 		int         keep_only=-1,
 		int         subsample= 1,
 		bint        probability_only=False,
+		schedule='static',
+		int         chunksize=0,
+		profile=None,
 ):
 	cdef:
 		int c = 0
 		int c_local = 0
+		int b, n_blocks
+		int64_t[:] blocks
 		int v, v2
 		int n_cases = dfs._n_cases()
 		int n_cases_local = n_cases
@@ -465,6 +481,8 @@ def nl_d_log_likelihood_from_dataframes_all_rows(
 		l4_float_t      weight = 1 # default
 		TreeStructure   tree
 		l4_float_t[:,:,:] bhhh_total # thread-local
+		l4_float_t[:,:,:] bhhh_block # thread-local
+		int[:]            bhhh_rows  # thread-local
 		int             thread_number = 0
 		int             storage_size_U
 		int             store_number_U
@@ -494,6 +512,9 @@ def nl_d_log_likelihood_from_dataframes_all_rows(
 	if step_case <= 0:
 		raise NotImplementedError('non-positive step')
 
+	if profile is not None:
+		lap = profile.clock()
+
 	try:
 		if num_threads <= 0:
 			num_threads = model._n_threads
@@ -506,6 +527,8 @@ def nl_d_log_likelihood_from_dataframes_all_rows(
 			return_dll = True
 
 		n_cases_local = ((stop_case - start_case) // step_case) + (1 if (stop_case - start_case) % step_case else 0)
+		blocks = case_blocks(dfs, num_threads, schedule, chunksize, start_case, stop_case, step_case)
+		n_blocks = blocks.shape[0] - 1
 
 		storage_size_U    = n_cases_local if persist & PERSIST_UTILITY            else num_threads
 		storage_size_CP   = n_cases_local if persist & PERSIST_COND_LOG_PROB      else num_threads
@@ -518,155 +541,167 @@ def nl_d_log_likelihood_from_dataframes_all_rows(
 		tree = TreeStructure(model, model._graph)
 		_check_for_zero_mu(n_alts, tree.n_nodes, tree.model_mu_param_values)
 
-		scratch             = numpy.zeros([num_threads,n_params], dtype=l4_float_dtype)
+		scratch             = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
 
-		raw_utility         = numpy.zeros([storage_size_U, tree.n_nodes], dtype=l4_float_dtype)
-		cond_logprobability = numpy.zeros([storage_size_CP, tree.n_edges], dtype=l4_float_dtype)
-		total_probability   = numpy.zeros([storage_size_P, tree.n_nodes], dtype=l4_float_dtype)
+		raw_utility         = working_zeros(storage_size_U, num_threads, [tree.n_nodes], l4_float_dtype)
+		cond_logprobability = working_zeros(storage_size_CP, num_threads, [tree.n_edges], l4_float_dtype)
+		total_probability   = working_zeros(storage_size_P, num_threads, [tree.n_nodes], l4_float_dtype)
 
-		array_ch_wide = numpy.zeros([num_threads, tree.n_nodes], dtype=l4_float_dtype)
+		array_ch_wide = thread_local_zeros(num_threads, [tree.n_nodes], l4_float_dtype)
 		choice_width = dfs._array_ch.shape[1]
 		if not (choice_width == n_alts or choice_width == tree.n_nodes):
 			raise ValueError("choice_width ({}) must be n_alts ({}) or n_nodes ({})".format(choice_width, n_alts, tree.n_nodes))
 
-		LL_case =  numpy.zeros([storage_size_LLc, ], dtype=l4_float_dtype)
+		LL_case =  working_zeros(storage_size_LLc, num_threads, [], l4_float_dtype)
 
 		if return_dll:
-			dU = numpy.zeros([storage_size_dU, tree.n_nodes, n_params], dtype=l4_float_dtype)
-			dP = numpy.zeros([storage_size_dP, tree.n_nodes, n_params], dtype=l4_float_dtype)
-			dLL_case  = numpy.zeros([storage_size_dLLc, n_params], dtype=l4_float_dtype)
-			dLL_total = numpy.zeros([num_threads, n_params], dtype=l4_float_dtype)
-			dLL_temp  = numpy.zeros([num_threads, n_params], dtype=l4_float_dtype)
+			dU = working_zeros(storage_size_dU, num_threads, [tree.n_nodes, n_params], l4_float_dtype)
+			dP = working_zeros(storage_size_dP, num_threads, [tree.n_nodes, n_params], l4_float_dtype)
+			dLL_case  = working_zeros(storage_size_dLLc, num_threads, [n_params], l4_float_dtype)
+			dLL_total = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
+			dLL_temp  = thread_local_zeros(num_threads, [n_params], l4_float_dtype)
 		if return_bhhh:
-			bhhh_total = numpy.zeros([num_threads,n_params,n_params], dtype=l4_float_dtype)
+			bhhh_total = thread_local_zeros(num_threads, [n_params,n_params], l4_float_dtype)
+			bhhh_block, bhhh_rows = bhhh_blocks(num_threads, n_params)
+		else:
+			bhhh_total = thread_local_zeros(num_threads, [1,1], l4_float_dtype)
+			bhhh_block, bhhh_rows = bhhh_blocks(num_threads, 1)
+
+		if profile is not None:
+			lap = profile.lap('allocate', lap)
 
 		with nogil, parallel(num_threads=num_threads):
 			thread_number = threadid()
 
-			for c in prange(start_case, stop_case, step_case):
+			for b in prange(n_blocks, schedule='dynamic', chunksize=1):
+				for c_local in range(blocks[b], blocks[b+1]):
+					c = start_case + c_local * step_case
 
-				if leave_out >= 0 and c % subsample == leave_out:
-					continue
+					if leave_out >= 0 and c % subsample == leave_out:
+						continue
 
-				if keep_only >= 0 and c % subsample != keep_only:
-					continue
+					if keep_only >= 0 and c % subsample != keep_only:
+						continue
 
-				c_local = (c-start_case)//step_case
-
-				store_number_U    = c_local if persist & PERSIST_UTILITY            else thread_number
-				store_number_CP   = c_local if persist & PERSIST_COND_LOG_PROB      else thread_number
-				store_number_P    = c_local if persist & PERSIST_PROBABILITY        else thread_number
-				store_number_dP   = c_local if persist & PERSIST_D_PROBABILITY      else thread_number
-				store_number_LLc  = c_local if persist & PERSIST_LOGLIKE_CASEWISE   else thread_number
-				store_number_dLLc = c_local if persist & PERSIST_D_LOGLIKE_CASEWISE else thread_number
-				store_number_dU   = c_local if persist & PERSIST_D_UTILITY          else thread_number
-
-				if return_dll:
-					dfs._compute_d_utility_onecase(c,raw_utility[store_number_U,:],dU[store_number_dU],n_alts)
-				else:
-					dfs._compute_utility_onecase(c,raw_utility[store_number_U,:],n_alts)
-
-				_nl_utility_upstream_v2(
-					tree.n_elementals,
-					tree.n_nodes,
-					raw_utility[store_number_U,:], # in-out [n_nodes]
-					tree.model_mu_param_values,  # input  [n_nodes]  elemental alternatives are ignored
-					tree.edge_alpha_values,      # input  [n_edges]
-					tree.edge_logalpha_values,   # input  [n_edges]
-					tree.first_edge_for_up,      # input  [n_nodes] index of first edge where this node is the up
-					tree.n_edges_for_up,         # input  [n_nodes] n edge where this node is the up
-					tree.edge_dn                 # input  [n_edges] child on each edge
-				)
-
-				_nl_conditional_logprobability_from_utility(
-						tree.n_edges,
-						&raw_utility[store_number_U,0],          # input  [n_nodes]
-						&tree.model_mu_param_values[0],        # input  [n_nodes]
-						&cond_logprobability[store_number_CP,0],  # output [n_edges]
-						&tree.edge_up[0],                      # input  [n_edges]
-						&tree.edge_dn[0],                      # input  [n_edges]
-						&tree.edge_alpha_values[0],            # input  [n_edges]
-						&tree.edge_logalpha_values[0],         # input  [n_edges]
-				)
-
-				_nl_total_probability_from_conditional_logprobability(
-						tree.n_nodes,
-						tree.n_edges,
-						&total_probability[store_number_P,0],    # output [n_nodes]
-						&cond_logprobability[store_number_CP,0],  # input  [n_edges]
-						&tree.edge_up[0],                      # input  [n_edges]
-						&tree.edge_dn[0],                      # input  [n_edges]
-				)
+					store_number_U    = c_local if persist & PERSIST_UTILITY            else thread_number
+					store_number_CP   = c_local if persist & PERSIST_COND_LOG_PROB      else thread_number
+					store_number_P    = c_local if persist & PERSIST_PROBABILITY        else thread_number
+					store_number_dP   = c_local if persist & PERSIST_D_PROBABILITY      else thread_number
+					store_number_LLc  = c_local if persist & PERSIST_LOGLIKE_CASEWISE   else thread_number
+					store_number_dLLc = c_local if persist & PERSIST_D_LOGLIKE_CASEWISE else thread_number
+					store_number_dU   = c_local if persist & PERSIST_D_UTILITY          else thread_number
 
-				if probability_only:
-					continue
+					if return_dll:
+						dfs._compute_d_utility_onecase(c,raw_utility[store_number_U,:],dU[store_number_dU],n_alts)
+					else:
+						dfs._compute_utility_onecase(c,raw_utility[store_number_U,:],n_alts)
 
-				if dfs._array_wt is not None:
-					weight = dfs._array_wt[c]
-				else:
-					weight = 1
-
-				ll_temp = _mnl_log_likelihood_from_probability_stride(
-					choice_width,
-					total_probability[store_number_P,:],        # input [n_alts]
-					dfs._array_ch[c,:],                       # input [n_alts]
-				) * weight
-				LL_case[store_number_LLc] += ll_temp
-				ll += ll_temp
-
-				if return_dll:
-					_nl_d_utility_upstream_v2(
+					_nl_utility_upstream_v2(
 						tree.n_elementals,
 						tree.n_nodes,
-						raw_utility[store_number_U,:],          # input [n_nodes]
-						tree.model_mu_param_values,           # input [n_nodes]  elemental alternatives are ignored
-						tree.model_mu_param_slots,
-						tree.edge_alpha_values,               # input [n_nodes,n_nodes]
-						tree.edge_logalpha_values,            # input [n_nodes,n_nodes]
-						cond_logprobability[store_number_CP,:],  # input [n_edges]
-						tree.n_edges,
-						n_params,
-						dU[store_number_dU],                    # input/output  [n_nodes, n_params]
-						tree.edge_up,                         # input  [n_edges]
-						tree.edge_dn,                         # input  [n_edges]
+						raw_utility[store_number_U,:], # in-out [n_nodes]
+						tree.model_mu_param_values,  # input  [n_nodes]  elemental alternatives are ignored
+						tree.edge_alpha_values,      # input  [n_edges]
+						tree.edge_logalpha_values,   # input  [n_edges]
+						tree.first_edge_for_up,      # input  [n_nodes] index of first edge where this node is the up
+						tree.n_edges_for_up,         # input  [n_nodes] n edge where this node is the up
+						tree.edge_dn                 # input  [n_edges] child on each edge
 					)
 
-					dfs._copy_choice_onecase(c, array_ch_wide[thread_number])
-
-					_nl_d_probability_from_d_utility(
-						tree.n_edges,                         # input   int
-						n_params,                             # input   int
-						raw_utility[store_number_U,:],          # input  [n_nodes]
-						dU[store_number_dU],                    # input  [n_nodes, n_params]
-						tree.model_mu_param_values,           # input  [n_nodes]
-						scratch[thread_number],               # temp   [n_params]
-						cond_logprobability[store_number_CP,:],  # input  [n_edges]
-						total_probability[store_number_P,:],    # input  [n_nodes]
-						dP[store_number_dP],                    # output [n_nodes, n_params]
-						tree.edge_up,                         # input  [n_edges]
-						tree.edge_dn,                         # input  [n_edges]
-						tree.model_mu_param_slots,            # input  [n_nodes]
-						tree.edge_alpha_values,               # input  [n_edges]
-						tree.edge_logalpha_values,            # input  [n_edges]
-						array_ch_wide[thread_number],         # in-out [n_nodes]
+					_nl_conditional_logprobability_from_utility(
+							tree.n_edges,
+							&raw_utility[store_number_U,0],          # input  [n_nodes]
+							&tree.model_mu_param_values[0],        # input  [n_nodes]
+							&cond_logprobability[store_number_CP,0],  # output [n_edges]
+							&tree.edge_up[0],                      # input  [n_edges]
+							&tree.edge_dn[0],                      # input  [n_edges]
+							&tree.edge_alpha_values[0],            # input  [n_edges]
+							&tree.edge_logalpha_values[0],         # input  [n_edges]
 					)
 
-					if weight:
-						_nl_d_loglike_from_d_probability(
-							n_params,                           # input   int
-							choice_width,                             # input   int
-							total_probability[store_number_P,:],  # input  [n_nodes]
-							dP[store_number_dP],                  # input  [n_nodes, n_params]
-							dLL_case[store_number_dLLc,:],           # output [n_params]
-							dfs._array_ch[c,:],                 # input  [n_nodes]
-							weight,
-
-							return_bhhh,
-							dLL_total[thread_number],
-							bhhh_total[thread_number],
-							&dLL_temp[thread_number,0],
+					_nl_total_probability_from_conditional_logprobability(
+							tree.n_nodes,
+							tree.n_edges,
+							&total_probability[store_number_P,0],    # output [n_nodes]
+							&cond_logprobability[store_number_CP,0],  # input  [n_edges]
+							&tree.edge_up[0],                      # input  [n_edges]
+							&tree.edge_dn[0],                      # input  [n_edges]
+					)
+
+					if probability_only:
+						continue
+
+					if dfs._array_wt is not None:
+						weight = dfs._array_wt[c]
+					else:
+						weight = 1
+
+					ll_temp = _mnl_log_likelihood_from_probability_stride(
+						choice_width,
+						total_probability[store_number_P,:],        # input [n_alts]
+						dfs._array_ch[c,:],                       # input [n_alts]
+					) * weight
+					LL_case[store_number_LLc] += ll_temp
+					ll += ll_temp
+
+					if return_dll:
+						_nl_d_utility_upstream_v2(
+							tree.n_elementals,
+							tree.n_nodes,
+							raw_utility[store_number_U,:],          # input [n_nodes]
+							tree.model_mu_param_values,           # input [n_nodes]  elemental alternatives are ignored
+							tree.model_mu_param_slots,
+							tree.edge_alpha_values,               # input [n_nodes,n_nodes]
+							tree.edge_logalpha_values,            # input [n_nodes,n_nodes]
+							cond_logprobability[store_number_CP,:],  # input [n_edges]
+							tree.n_edges,
+							n_params,
+							dU[store_number_dU],                    # input/output  [n_nodes, n_params]
+							tree.edge_up,                         # input  [n_edges]
+							tree.edge_dn,                         # input  [n_edges]
+						)
+
+						dfs._copy_choice_onecase(c, array_ch_wide[thread_number])
+
+						_nl_d_probability_from_d_utility(
+							tree.n_edges,                         # input   int
+							n_params,                             # input   int
+							raw_utility[store_number_U,:],          # input  [n_nodes]
+							dU[store_number_dU],                    # input  [n_nodes, n_params]
+							tree.model_mu_param_values,           # input  [n_nodes]
+							scratch[thread_number],               # temp   [n_params]
+							cond_logprobability[store_number_CP,:],  # input  [n_edges]
+							total_probability[store_number_P,:],    # input  [n_nodes]
+							dP[store_number_dP],                    # output [n_nodes, n_params]
+							tree.edge_up,                         # input  [n_edges]
+							tree.edge_dn,                         # input  [n_edges]
+							tree.model_mu_param_slots,            # input  [n_nodes]
+							tree.edge_alpha_values,               # input  [n_edges]
+							tree.edge_logalpha_values,            # input  [n_edges]
+							array_ch_wide[thread_number],         # in-out [n_nodes]
 						)
 
+						if weight:
+							_nl_d_loglike_from_d_probability(
+								n_params,                           # input   int
+								choice_width,                             # input   int
+								total_probability[store_number_P,:],  # input  [n_nodes]
+								dP[store_number_dP],                  # input  [n_nodes, n_params]
+								dLL_case[store_number_dLLc,:],           # output [n_params]
+								dfs._array_ch[c,:],                 # input  [n_nodes]
+								weight,
+
+								return_bhhh,
+								dLL_total[thread_number],
+								&bhhh_total[thread_number,0,0],
+								&dLL_temp[thread_number,0],
+								&bhhh_block[thread_number,0,0],
+								&bhhh_rows[thread_number],
+							)
+
+		if profile is not None:
+			lap = profile.lap('kernel', lap)
+
 		if probability_only:
 			ll = numpy.nan
 
@@ -674,8 +709,9 @@ def nl_d_log_likelihood_from_dataframes_all_rows(
 		if return_dll:
 			dll = dLL_total.base.sum(0) * dfs._weight_normalization
 		if return_bhhh:
-			bhhh = bhhh_total.base.sum(0) * dfs._weight_normalization
-
+			bhhh = combine_bhhh(bhhh_total, bhhh_block, bhhh_rows) * dfs._weight_normalization
+		if profile is not None:
+			lap = profile.lap('reduce', lap)
 
 		from ..util import dictx
 		result = dictx(
@@ -713,6 +749,8 @@ def nl_d_log_likelihood_from_dataframes_all_rows(
 					columns=dfs._model_param_names,
 				)
 
+		if profile is not None:
+			profile.lap('wrap', lap)
 		return result
 
 	except:
@@ -0,0 +1,160 @@
+"""
+Timing and counters for likelihood evaluations.
+
+Profiling is opt-in.  Set `Model.profiling = True` and each evaluation of
+the log likelihood records the wall clock time spent in its phases, and
+counts the passes over the data and the cases evaluated, into the
+model's :class:`ComputeProfile`.  When profiling is on, the result of
+`maximize_loglike` includes a 'profile' summary for that estimation.
+
+The phases are:
+
+- 'prepare' : checking the data and setting any new parameter values,
+- 'unmangle' : rebuilding the model's derived structures, if changed,
+- 'read_parameters' : copying parameter values into the data arrays,
+- 'allocate' : creating the working arrays for the kernel,
+- 'kernel' : the parallel loop over cases,
+- 'reduce' : combining the per-thread results,
+- 'wrap' : building the result dictionary, Series and DataFrames.
+"""
+
+import time
+import copy
+
+from . import thread_buffers
+
+PHASES = ('prepare', 'unmangle', 'read_parameters', 'allocate', 'kernel', 'reduce', 'wrap')
+
+
+class ComputeProfile:
+	"""
+	Accumulated timing and counts for likelihood evaluations.
+
+	Attributes
+	----------
+	seconds : dict
+		Total wall clock seconds spent in each phase.
+	calls : int
+		The number of likelihood evaluations.
+	data_passes : int
+		The number of passes over the data.  A single call may make one
+		pass that evaluates several sets of parameters.
+	cases : int
+		The total number of cases evaluated over all passes.
+	bytes_allocated : int
+		The total size of the working arrays created by the kernels.
+		This counter is shared by the whole process, so work done at the
+		same time in other threads is counted too.
+	"""
+
+	clock = staticmethod(time.perf_counter)
+
+	def __init__(self):
+		self.reset()
+
+	def reset(self):
+		"""Set all timings and counters back to zero."""
+		self.seconds = {phase: 0.0 for phase in PHASES}
+		self.calls = 0
+		self.data_passes = 0
+		self.cases = 0
+		self.bytes_allocated = 0
+
+	def copy(self):
+		return copy.deepcopy(self)
+
+	def lap(self, phase, since):
+		"""
+		Add the time elapsed since `since` to a phase.
+
+		Parameters
+		----------
+		phase : str
+		since : float
+			A previous reading of :meth:`clock`.
+
+		Returns
+		-------
+		float
+			The current reading of :meth:`clock`, to use as `since` for
+			the next phase.
+		"""
+		now = self.clock()
+		self.seconds[phase] = self.seconds.get(phase, 0.0) + (now - since)
+		return now
+
+	def start_pass(self):
+		"""
+		Note the allocation counter before a kernel runs.
+
+		Returns
+		-------
+		int
+		"""
+		return thread_buffers.allocated_bytes()
+
+	def end_pass(self, n_cases, allocated_before, calls=1):
+		"""
+		Record a completed pass over the data.
+
+		Parameters
+		----------
+		n_cases : int
+			The number of cases evaluated in the pass.
+		allocated_before : int
+			The value returned by :meth:`start_pass`.
+		calls : int, default 1
+			The number of likelihood evaluations done by the pass.
+		"""
+		self.calls += calls
+		self.data_passes += 1
+		self.cases += n_cases
+		self.bytes_allocated += thread_buffers.allocated_bytes() - allocated_before
+
+	def summary(self, baseline=None):
+		"""
+		Summarize the profile.
+
+		Parameters
+		----------
+		baseline : ComputeProfile, optional
+			An earlier copy of this profile.  If given, only the work done
+			since that copy is summarized.
+
+		Returns
+		-------
+		dictx
+			With keys 'seconds' (a dict of seconds by phase), 'total_seconds',
+			'calls', 'data_passes', 'cases', 'cases_per_second' (cases
+			divided by the time in the 'kernel' phase), 'bytes_allocated',
+			and 'bytes_per_call'.
+		"""
+		from ..util import dictx
+		seconds = dict(self.seconds)
+		calls, data_passes, cases, bytes_allocated = self.calls, self.data_passes, self.cases, self.bytes_allocated
+		if baseline is not None:
+			for phase, s in baseline.seconds.items():
+				seconds[phase] = seconds.get(phase, 0.0) - s
+			calls -= baseline.calls
+			data_passes -= baseline.data_passes
+			cases -= baseline.cases
+			bytes_allocated -= baseline.bytes_allocated
+		kernel_seconds = seconds.get('kernel', 0.0)
+		return dictx(
+			seconds=seconds,
+			total_seconds=sum(seconds.values()),
+			calls=calls,
+			data_passes=data_passes,
+			cases=cases,
+			cases_per_second=cases / kernel_seconds if kernel_seconds > 0 else float('nan'),
+			bytes_allocated=bytes_allocated,
+			bytes_per_call=bytes_allocated / calls if calls else float('nan'),
+		)
+
+	def __repr__(self):
+		s = self.summary()
+		phases = ", ".join(f"{k}={v:.4g}s" for k, v in s.seconds.items())
+		return (
+			f"<larch.ComputeProfile calls={s.calls} data_passes={s.data_passes} "
+			f"cases={s.cases} bytes_allocated={s.bytes_allocated} {phases}>"
+		)
@@ -0,0 +1,115 @@
+"""
+A process-wide cache of reference log likelihoods.
+
+Values such as the log likelihood with no model at all depend only on
+the choice, availability, and weight data, so they are stored under the
+:meth:`DataFrames.fingerprint` of that data and shared by all models
+estimated on it.  The cache can optionally be persisted to disk, so
+that the values survive across sessions.
+"""
+
+import json
+import os
+
+import logging
+from ..log import logger_name
+logger = logging.getLogger(logger_name+'.model')
+
+cache = {}
+cache_dir = None
+
+
+def set_cache_dir(location=None):
+	"""
+	Set up a directory for persisting reference log likelihoods.
+
+	Parameters
+	----------
+	location: str or None or False
+		The path of the directory to use as a data store.  If None, a
+		default directory is created using appdirs.user_cache_dir.
+		If False is given, values are only cached in memory.
+	"""
+	global cache_dir
+	if location is None:
+		import appdirs
+		location = appdirs.user_cache_dir('larch', appauthor=False)
+		location = os.path.join(location, 'reference_loglike')
+	if location is False:
+		cache_dir = None
+		return
+	os.makedirs(location, exist_ok=True)
+	cache_dir = location
+
+
+def _filename(fingerprint):
+	return os.path.join(cache_dir, f"{fingerprint}.json")
+
+
+def get(kind, fingerprint):
+	"""
+	Get a cached reference log likelihood.
+
+	Parameters
+	----------
+	kind : str
+		The kind of reference value, e.g. 'nil' or 'constants_only'.
+	fingerprint : str
+		The fingerprint of the data.
+
+	Returns
+	-------
+	float or None
+		None if there is no cached value.
+	"""
+	values = cache.get(fingerprint)
+	if values is None and cache_dir is not None:
+		try:
+			with open(_filename(fingerprint), 'r') as f:
+				values = cache[fingerprint] = json.load(f)
+		except (OSError, ValueError):
+			values = None
+	if values is None:
+		return None
+	return values.get(kind)
+
+
+def put(kind, fingerprint, value):
+	"""
+	Store a reference log likelihood in the cache.
+
+	Parameters
+	----------
+	kind : str
+		The kind of reference value, e.g. 'nil' or 'constants_only'.
+	fingerprint : str
+		The fingerprint of the data.
+	value : float
+	"""
+	values = cache.setdefault(fingerprint, {})
+	values[kind] = float(value)
+	if cache_dir is not None:
+		try:
+			with open(_filename(fingerprint), 'w') as f:
+				json.dump(values, f)
+		except OSError:
+			logger.exception("unable to persist reference log likelihood")
+
+
+def clear(persisted=False):
+	"""
+	Clear the in-memory cache.
+
+	Parameters
+	----------
+	persisted : bool, default False
+		Also delete any values persisted in the cache directory.
+	"""
+	if persisted and cache_dir is not None:
+		for filename in os.listdir(cache_dir):
+			if filename.endswith('.json'):
+				try:
+					os.remove(os.path.join(cache_dir, filename))
+				except OSError:
+					pass
+	cache.clear()
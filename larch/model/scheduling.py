@@ -0,0 +1,105 @@
+"""
+Partitioning of cases into blocks of work for the parallel kernels.
+
+The likelihood kernels run over a list of contiguous blocks of cases,
+handing out blocks to threads dynamically.  How the cases are split into
+blocks sets the schedule:
+
+- 'static' gives one block of equal case count per thread, which is
+  the same as the OpenMP static schedule.
+- 'dynamic' gives blocks of `chunksize` cases.
+- 'guided' gives blocks that start large and shrink as the remaining
+  work gets smaller, down to `chunksize` cases.
+- 'balanced' gives several blocks per thread, with boundaries chosen so
+  that each block has about the same amount of work, as measured by
+  :meth:`DataFrames.case_work`.  This is the best choice when cases
+  vary a lot in their number of available alternatives.
+"""
+
+import numpy
+
+SCHEDULES = ('static', 'dynamic', 'guided', 'balanced')
+
+# Blocks per thread for the 'balanced' schedule, and for the default
+# chunk size of the 'dynamic' schedule.
+BLOCKS_PER_THREAD = 16
+
+
+def check_schedule(schedule):
+	"""
+	Check that a schedule name is valid.
+
+	Parameters
+	----------
+	schedule : str
+
+	Returns
+	-------
+	str
+	"""
+	schedule = str(schedule).lower()
+	if schedule not in SCHEDULES:
+		raise ValueError(f'unknown schedule {schedule!r}, use one of {SCHEDULES}')
+	return schedule
+
+
+def case_blocks(
+		dfs,
+		num_threads,
+		schedule='static',
+		chunksize=0,
+		start_case=0,
+		stop_case=-1,
+		step_case=1,
+):
+	"""
+	Split the selected cases into blocks of work.
+
+	Parameters
+	----------
+	dfs : DataFrames
+	num_threads : int
+	schedule : {'static', 'dynamic', 'guided', 'balanced'}
+	chunksize : int, default 0
+		The number of cases in each block for the 'dynamic' schedule, or
+		the smallest block for the 'guided' schedule.  If zero, a size
+		giving several blocks per thread is used.
+	start_case, stop_case, step_case : int
+		The selected cases, as for the likelihood kernels.
+
+	Returns
+	-------
+	ndarray of int64
+		Boundaries of the blocks, in positions among the selected cases,
+		so that block `b` runs from `blocks[b]` up to `blocks[b+1]`.
+	"""
+	schedule = check_schedule(schedule)
+	num_threads = max(int(num_threads), 1)
+	if stop_case < 0:
+		stop_case = dfs.n_cases
+	n_local = len(range(start_case, stop_case, step_case))
+	if chunksize <= 0:
+		chunksize = -(-n_local // (num_threads * BLOCKS_PER_THREAD))
+	chunksize = max(int(chunksize), 1)
+
+	if schedule == 'static' or num_threads == 1:
+		blocks = numpy.linspace(0, n_local, num_threads + 1)
+	elif schedule == 'dynamic':
+		blocks = numpy.append(numpy.arange(0, n_local, chunksize), n_local)
+	elif schedule == 'guided':
+		blocks = [0]
+		while blocks[-1] < n_local:
+			remaining = n_local - blocks[-1]
+			blocks.append(blocks[-1] + max(chunksize, -(-remaining // (2 * num_threads))))
+		blocks[-1] = n_local
+	else:
+		work = dfs.case_work()[start_case:stop_case:step_case]
+		cumulative = numpy.cumsum(work)
+		total = cumulative[-1] if n_local else 0
+		targets = numpy.linspace(0, total, num_threads * BLOCKS_PER_THREAD + 1)[1:-1]
+		blocks = numpy.concatenate([
+			[0],
+			numpy.searchsorted(cumulative, targets, side='left') + 1,
+			[n_local],
+		])
+	return numpy.unique(numpy.asarray(blocks).round().astype(numpy.int64).clip(0, n_local))
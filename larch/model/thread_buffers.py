@@ -0,0 +1,108 @@
+"""
+Working arrays for the parallel kernels.
+
+Each thread in a kernel has its own slab of the thread-local working
+arrays (the `num_threads` leading dimension).  If those slabs are simply
+rows of one contiguous array, the end of one thread's row and the start
+of the next share a cache line, and every write by one thread evicts the
+line from the other's cache (false sharing).  The arrays made here pad
+each slab out to whole cache lines, or whole pages for slabs of a page or
+more, and start every slab on such a boundary.
+
+The arrays are zeroed by `numpy.zeros`, which gets large blocks of memory
+from the operating system as untouched zero pages.  A page is placed on a
+NUMA node only when it is first written, and as each page-aligned slab is
+only ever written by its own thread, the memory for each thread ends up on
+that thread's node.  The per-thread results are combined afterwards with
+an ordinary sum over the leading dimension.
+
+The total size of the arrays made here is kept in a process-wide counter,
+see :func:`allocated_bytes`.
+"""
+
+import numpy
+
+CACHE_LINE_BYTES = 64
+
+PAGE_BYTES = 4096
+
+_allocated_bytes = 0
+
+
+def allocated_bytes():
+	"""
+	The total size of all the working arrays made so far.
+
+	Returns
+	-------
+	int
+	"""
+	return _allocated_bytes
+
+
+def _count_allocation(arr):
+	global _allocated_bytes
+	_allocated_bytes += arr.nbytes
+	return arr
+
+
+def thread_local_zeros(num_threads, shape, dtype=numpy.float64):
+	"""
+	A zeroed array with a padded, aligned slab for each thread.
+
+	Parameters
+	----------
+	num_threads : int
+	shape : Sequence[int]
+		The shape of each thread's slab.
+	dtype : dtype, default float64
+
+	Returns
+	-------
+	ndarray, shape [num_threads, *shape]
+		Each slab `[t]` is C-contiguous, but the stride between slabs is a
+		whole number of cache lines (or pages).
+	"""
+	dtype = numpy.dtype(dtype)
+	shape = tuple(int(i) for i in shape)
+	num_threads = max(int(num_threads), 1)
+	slab_items = int(numpy.prod(shape, dtype=numpy.int64))
+	slab_bytes = max(slab_items * dtype.itemsize, 1)
+	align = PAGE_BYTES if slab_bytes >= PAGE_BYTES else CACHE_LINE_BYTES
+	stride = -(-slab_bytes // align) * align
+	raw = _count_allocation(numpy.zeros(num_threads * stride + align, dtype=numpy.uint8))
+	offset = -raw.ctypes.data % align
+	slab_strides = tuple(int(numpy.prod(shape[i + 1:], dtype=numpy.int64)) * dtype.itemsize for i in range(len(shape)))
+	return numpy.lib.stride_tricks.as_strided(
+		raw[offset:offset + num_threads * stride].view(dtype),
+		shape=(num_threads, ) + shape,
+		strides=(stride, ) + slab_strides,
+	)
+
+
+def working_zeros(n_rows, num_threads, shape, dtype=numpy.float64):
+	"""
+	A zeroed array that is either kept for every case, or per thread.
+
+	The kernels keep some intermediate results for every case when they
+	are to be returned, and otherwise only a row for each thread to work
+	in.  This gives a plain array in the first case, and padded slabs from
+	:func:`thread_local_zeros` in the second.
+
+	Parameters
+	----------
+	n_rows : int
+		The number of rows, which is `num_threads` when the array is only
+		working space.
+	num_threads : int
+	shape : Sequence[int]
+		The shape of each row.
+	dtype : dtype, default float64
+
+	Returns
+	-------
+	ndarray, shape [n_rows, *shape]
+	"""
+	if n_rows == num_threads:
+		return thread_local_zeros(num_threads, shape, dtype)
+	return _count_allocation(numpy.zeros((n_rows, ) + tuple(shape), dtype=dtype))
@@ -25,11 +25,212 @@ class OMXNonUniqueLookup(OMX_Error):
 	pass
 
 
+class SkimCache:
+	"""
+	An in-memory cache of decompressed OMX matrices.
+
+	Matrices are keyed by (file, matrix, mtime), so a cache can be shared
+	by every OMX opened in a process, and a file that has been rewritten
+	on disk is never served stale.  When the total size of the cached
+	matrices would exceed `max_bytes`, the least recently used matrices
+	are evicted.
+
+	Parameters
+	----------
+	max_bytes : int, default 1 GiB
+		The byte budget for the cache.
+	"""
+
+	def __init__(self, max_bytes=2**30):
+		from collections import OrderedDict
+		import threading
+		self.max_bytes = max_bytes
+		self._store = OrderedDict()
+		self._lock = threading.Lock()
+		self.nbytes = 0
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+
+	def get(self, key, loader):
+		"""
+		Get a cached array, loading it if it is not already cached.
+
+		Parameters
+		----------
+		key : hashable
+			The key for the array.
+		loader : callable
+			A function that takes no arguments and returns the array,
+			called on a cache miss.
+
+		Returns
+		-------
+		ndarray
+			The array, which is read-only.
+		"""
+		with self._lock:
+			if key in self._store:
+				self._store.move_to_end(key)
+				self.hits += 1
+				return self._store[key]
+			self.misses += 1
+		arr = numpy.asarray(loader())
+		arr.setflags(write=False)
+		with self._lock:
+			if key not in self._store and arr.nbytes <= self.max_bytes:
+				self._store[key] = arr
+				self.nbytes += arr.nbytes
+				self._evict()
+		return arr
+
+	def _evict(self):
+		while self.nbytes > self.max_bytes and self._store:
+			_, arr = self._store.popitem(last=False)
+			self.nbytes -= arr.nbytes
+			self.evictions += 1
+
+	def resize(self, max_bytes):
+		"""Change the byte budget, evicting matrices if needed."""
+		with self._lock:
+			self.max_bytes = max_bytes
+			self._evict()
+
+	def clear(self):
+		"""Remove all matrices from the cache and reset the counters."""
+		with self._lock:
+			self._store.clear()
+			self.nbytes = 0
+			self.hits = 0
+			self.misses = 0
+			self.evictions = 0
+
+	def __len__(self):
+		return len(self._store)
+
+	def __contains__(self, key):
+		return key in self._store
+
+	def info(self):
+		"""Summary statistics for the cache, as a Dict."""
+		return Dict(
+			n_matrices=len(self._store),
+			nbytes=self.nbytes,
+			max_bytes=self.max_bytes,
+			hits=self.hits,
+			misses=self.misses,
+			evictions=self.evictions,
+		)
+
+	def __repr__(self):
+		return (
+			f"<larch.SkimCache> {len(self._store)} matrices, {self.nbytes} of {self.max_bytes} bytes, "
+			f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions"
+		)
+
+
+skim_cache = SkimCache()
+"""The default process-wide SkimCache, used by OMX files opened with `cache=True`."""
+
+
+def pluck_rc(matrices, row_indexes, col_indexes, block_bytes=2**26):
+	"""
+	Pluck values at (row, col) coordinates from one or more matrices.
+
+	Point-wise fancy indexing into a compressed HDF5 array decompresses
+	the containing chunk for every single point.  Instead, the coordinate
+	pairs are sorted by row, and the needed rows of each matrix are read
+	as contiguous blocks, so that each chunk is decompressed at most once.
+	All matrices are swept together block by block, and the plucked values
+	are scattered back into the original order of the coordinates.
+
+	Parameters
+	----------
+	matrices : Mapping[str, array-like]
+		The matrices to pluck from, typically `tables.CArray` nodes, keyed
+		by name. Anything supporting row slicing and 2-d numpy indexing
+		works.  All matrices must have the same number of columns.
+	row_indexes, col_indexes : array-like or int
+		The zero-based row and column coordinates.  Must have the same
+		shape, unless one of these is just an integer, in which case that
+		value is broadcast to the shape of the other.
+	block_bytes : int, default 64 MiB
+		The approximate maximum size of a block of rows read from any one
+		matrix at a time.
+
+	Returns
+	-------
+	Dict
+		The plucked values for each matrix, each with the same shape as
+		the coordinates.
+	"""
+	if isinstance(row_indexes, (int, numpy.integer)):
+		col_indexes = numpy.asarray(col_indexes)
+		row_indexes = numpy.full(col_indexes.shape, row_indexes, dtype=numpy.int64)
+	elif isinstance(col_indexes, (int, numpy.integer)):
+		row_indexes = numpy.asarray(row_indexes)
+		col_indexes = numpy.full(row_indexes.shape, col_indexes, dtype=numpy.int64)
+	rowarr = numpy.asarray(row_indexes).astype(numpy.int64, copy=False)
+	colarr = numpy.asarray(col_indexes).astype(numpy.int64, copy=False)
+	if rowarr.shape != colarr.shape:
+		raise ValueError(f"row_indexes shape {rowarr.shape} does not match col_indexes shape {colarr.shape}")
+	out_shape = rowarr.shape
+	rowarr = rowarr.reshape(-1)
+	colarr = colarr.reshape(-1)
+
+	result = Dict()
+	for name, mat in matrices.items():
+		result[name] = numpy.empty(rowarr.shape, dtype=mat.dtype)
+	if rowarr.size == 0 or len(matrices) == 0:
+		for name in result:
+			result[name] = result[name].reshape(out_shape)
+		return result
+
+	order = numpy.argsort(rowarr, kind='stable')
+	sorted_rows = rowarr[order]
+	sorted_cols = colarr[order]
+
+	# the number of rows per block is a multiple of the chunk height
+	row_bytes = 0
+	chunk_rows = 1
+	for mat in matrices.values():
+		row_bytes = max(row_bytes, int(numpy.prod(mat.shape[1:])) * mat.dtype.itemsize)
+		chunkshape = getattr(mat, 'chunkshape', None)
+		if chunkshape:
+			chunk_rows = max(chunk_rows, int(chunkshape[0]))
+	rows_per_block = max(1, block_bytes // max(row_bytes, 1))
+	rows_per_block = max(chunk_rows, (rows_per_block // chunk_rows) * chunk_rows)
+
+	block_ids = sorted_rows // rows_per_block
+	cuts = numpy.flatnonzero(numpy.diff(block_ids)) + 1
+	starts = numpy.concatenate([[0], cuts])
+	stops = numpy.concatenate([cuts, [len(sorted_rows)]])
+
+	for i, j in zip(starts, stops):
+		r0 = sorted_rows[i]
+		r1 = sorted_rows[j-1] + 1
+		rr = sorted_rows[i:j] - r0
+		cc = sorted_cols[i:j]
+		dest = order[i:j]
+		for name, mat in matrices.items():
+			result[name][dest] = mat[r0:r1][rr, cc]
+
+	for name in result:
+		result[name] = result[name].reshape(out_shape)
+	return result
+
+
 class OMX(_omx_base_class):
 	"""A subclass of the :class:`tables.File` class, adding an interface for openmatrix files.
 
 	As suggested in the openmatrix documentation, the default when creating an OMX file
 	is to use zlib compression level 1, although this can be overridden.
+
+	Matrix tables in files opened read-only can optionally be served from an in-memory
+	:class:`SkimCache` of decompressed arrays, by giving `cache=True` to use the
+	process-wide `larch.omx.skim_cache`, or by giving a particular `SkimCache`.
+	When caching is active, accessing a matrix table by name returns a read-only
+	numpy array instead of a `tables.CArray`.
 	"""
 
 	def __repr__(self):
@@ -49,7 +250,13 @@ class OMX(_omx_base_class):
 			                                         self.lookup._v_children[i].dtype, just)
 		return s
 
-	def __init__(self, *arg, complevel=1, complib='zlib', **kwarg):
+	def __init__(self, *arg, complevel=1, complib='zlib', cache=None, **kwarg):
+
+		if cache is True:
+			cache = skim_cache
+		elif cache is False:
+			cache = None
+		self._skim_cache = cache
 
 		if len(arg)>0 and isinstance(arg[0], str) and  arg[0][-3:]=='.gz':
 			from .util.temporaryfile import TemporaryGzipInflation
@@ -129,9 +336,31 @@ class OMX(_omx_base_class):
 			pass # the file was probably closed elsewhere, reopen it
 		filename = self.filename
 		self.close()
+		kwarg.setdefault('cache', self._skim_cache)
 		self.__init__(filename, mode, **kwarg)
 		return self
 
+	@property
+	def cache(self):
+		"""The SkimCache used for matrix tables in this file, or None."""
+		return self._skim_cache
+
+	@cache.setter
+	def cache(self, value):
+		if value is True:
+			value = skim_cache
+		elif value is False:
+			value = None
+		self._skim_cache = value
+
+	def _get_matrix(self, name):
+		"""A matrix table, from the cache if caching is active for this file."""
+		node = self.data._v_children[name]
+		if self._skim_cache is None or self.mode != 'r':
+			return node
+		key = (os.path.abspath(self.filename), name, os.path.getmtime(self.filename))
+		return self._skim_cache.get(key, node.read)
+
 
 
 	@property
@@ -710,7 +939,7 @@ class OMX(_omx_base_class):
 				if key in self.lookup._v_children:
 					raise KeyError('key {} found in both data and lookup'.format(key))
 				else:
-					return self.data._v_children[key]
+					return self._get_matrix(key)
 			if key in self.lookup._v_children:
 				return self.lookup._v_children[key]
 			raise KeyError("matrix named {} not found".format(key))
@@ -737,7 +966,7 @@ class OMX(_omx_base_class):
 	def __getattr__(self, key):
 		if key in self.data._v_children:
 			if key not in self.lookup._v_children:
-				return self.data._v_children[key]
+				return self._get_matrix(key)
 			else:
 				raise AttributeError('key {} found in both data and lookup'.format(key))
 		if key in self.lookup._v_children:
@@ -776,7 +1005,7 @@ class OMX(_omx_base_class):
 			columns = self.lookup._v_children[columns]
 		if matrix in self.data._v_children:
 			return pandas.DataFrame(
-				data=self.data._v_children[matrix],
+				data=self._get_matrix(matrix),
 				index=index,
 				columns=columns,
 			)
@@ -810,6 +1039,49 @@ class OMX(_omx_base_class):
 			result[name] = vals[r,c]
 		return result
 
+	def pluck(self, row_indexes, col_indexes, mat_names=None, block_bytes=2**26):
+		"""
+		Pluck values at (row, col) coordinates from matrices in this OMX.
+
+		The coordinates are sorted by row and each matrix is read in
+		contiguous row blocks, so that every compressed chunk is
+		decompressed at most once, no matter how many coordinates fall
+		in it.  This is much faster than point-wise indexing for large
+		numbers of coordinates.
+
+		Parameters
+		----------
+		row_indexes : array-like or int
+			The zero-based row index within the matrix for each value.
+		col_indexes : array-like or int
+			The zero-based column index within the matrix for each value.
+			Must have the same shape as `row_indexes`, unless one of
+			these is just an integer, in which case that value is
+			broadcast to the shape of the other.
+		mat_names : str or Sequence, optional
+			The matrix table or tables to draw values from.  If not given,
+			all matrix arrays from the `data` node in the OMX file will be used.
+		block_bytes : int, default 64 MiB
+			The approximate maximum size of a block of rows read from any one
+			matrix at a time.
+
+		Returns
+		-------
+		Dict
+			The plucked values for each matrix, each with the same shape as
+			the coordinates.
+		"""
+		if mat_names is None:
+			mat_names = list(self.data._v_children.keys())
+		elif isinstance(mat_names, str):
+			mat_names = [mat_names]
+		return pluck_rc(
+			{mat: self[mat] for mat in mat_names},
+			numpy.asarray(row_indexes) if not isinstance(row_indexes, int) else row_indexes,
+			numpy.asarray(col_indexes) if not isinstance(col_indexes, int) else col_indexes,
+			block_bytes=block_bytes,
+		)
+
 	def get_rc_dataframe(self, row_indexes, col_indexes, mat_names=None, index=None):
 		"""
 		Build a DataFrame containing values pulled from this OMX.
@@ -843,10 +1115,7 @@ class OMX(_omx_base_class):
 		elif isinstance(col_indexes, int):
 			col_indexes = numpy.full_like(row_indexes, col_indexes)
 
-		data = {
-			mat: self[mat][row_indexes, col_indexes]
-			for mat in mat_names
-		}
+		data = dict(self.pluck(row_indexes, col_indexes, mat_names))
 
 		if index is None:
 			try:
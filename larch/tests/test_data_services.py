@@ -0,0 +1,220 @@
+import os
+import numpy
+import pandas
+from pytest import approx, raises, importorskip
+
+from ..data_warehouse import example_file
+
+
+def test_npy_pod(tmp_path):
+	from ..data_services import NpyPod, NpyPodCO, H5PodCO, DataService
+	from ..data_services.npy import IncompatibleShape
+
+	df = pandas.read_csv(example_file("MTCwork.csv.gz"))
+	df = df.groupby('casenum').first()
+	h5 = H5PodCO.from_dataframe(df[['age', 'hhinc', 'numveh']], temp=True)
+
+	pod = NpyPod.from_h5pod(h5, tmp_path / 'co')
+	assert isinstance(pod, NpyPodCO)
+	assert pod.podtype == 'idco'
+	assert pod.names() == ['age', 'hhinc', 'numveh']
+	assert pod.shape == (5029,)
+	assert pod.dtype_of('age') == numpy.int64
+
+	# natural names with slices are views on the memory map
+	v = pod.get_data_item('age', selector=slice(2, 10))
+	assert isinstance(v, numpy.memmap)
+	assert numpy.array_equal(v, df.age.values[2:10])
+	with raises(ValueError):
+		v[0] = 99
+
+	pod.add_array('twice_age', df.age.values * 2, title="Twice the age")
+	with raises(FileExistsError):
+		pod.add_array('twice_age', df.age.values)
+	with raises(IncompatibleShape):
+		pod.add_array('short', numpy.zeros(5))
+
+	# reopen read-only from another handle
+	pod_r = NpyPodCO(tmp_path / 'co', mode='r')
+	assert 'twice_age' in pod_r
+	with raises(PermissionError):
+		pod_r.add_array('x', df.age.values)
+
+	ds = DataService(pod_r, altids=[1, 2, 3, 4, 5, 6])
+	arr = ds.array_idco('age', 'hhinc', 'twice_age-age', selector=slice(0, 100))
+	assert arr.shape == (100, 3)
+	assert arr[:, 0] == approx(df.age.values[:100])
+	assert arr[:, 1] == approx(df.hhinc.values[:100])
+	assert arr[:, 2] == approx(df.age.values[:100])
+	arr_ca = ds.array_idca('hhinc', selector=numpy.arange(10, 20))
+	assert arr_ca.shape == (10, 6, 1)
+	assert arr_ca[:, 3, 0] == approx(df.hhinc.values[10:20])
+
+
+def test_npy_pod_from_omx(tmp_path):
+	from .. import OMX
+	from .. import exampville
+	from ..data_services import NpyPod
+	skims = OMX(exampville.files.skims, mode='r')
+	pod = NpyPod.from_omx(skims, tmp_path / 'skims', names=['AUTO_TIME', 'AUTO_DIST'])
+	assert pod.shape == skims.shape
+	assert pod.names() == ['AUTO_DIST', 'AUTO_TIME']
+	assert pod.get_data_item('AUTO_DIST') == approx(skims.AUTO_DIST[:])
+	skims.close()
+
+
+def test_omx_pluck():
+	from .. import OMX
+	from .. import exampville
+	from ..omx import pluck_rc
+	skims = OMX(exampville.files.skims, mode='r')
+	numpy.random.seed(42)
+	rows = numpy.random.randint(0, 40, size=1000)
+	cols = numpy.random.randint(0, 40, size=1000)
+	dist = skims.AUTO_DIST[:]
+	time = skims.AUTO_TIME[:]
+
+	plucked = skims.pluck(rows, cols, ['AUTO_DIST', 'AUTO_TIME'])
+	assert plucked.AUTO_DIST == approx(dist[rows, cols])
+	assert plucked.AUTO_TIME == approx(time[rows, cols])
+
+	# tiny blocks exercise many separate reads
+	plucked = pluck_rc({'d': skims.AUTO_DIST}, rows.reshape(50, 20), 3, block_bytes=1)
+	assert plucked.d.shape == (50, 20)
+	assert plucked.d.reshape(-1) == approx(dist[rows, 3])
+
+	df = skims.get_rc_dataframe(pandas.Series(rows, name='o'), pandas.Series(cols, name='d'), ['AUTO_DIST'])
+	assert df.AUTO_DIST.values == approx(dist[rows, cols])
+
+	from ..data_services.h5 import H5PodRC
+	rc = H5PodRC(rows, cols, groupnode=skims.data)
+	assert rc.get_data_item('AUTO_TIME', selector=slice(10, 20)) == approx(time[rows, cols][10:20])
+	assert rc.get_data_item('AUTO_TIME+AUTO_DIST') == approx(time[rows, cols]+dist[rows, cols])
+	skims.close()
+
+
+def test_omx_skim_cache():
+	from .. import OMX
+	from .. import exampville
+	from ..omx import SkimCache
+	cache = SkimCache(max_bytes=40*40*8*2)
+	skims = OMX(exampville.files.skims, mode='r', cache=cache)
+	raw = OMX(exampville.files.skims, mode='r')
+
+	a = skims['AUTO_DIST']
+	assert isinstance(a, numpy.ndarray)
+	assert not a.flags.writeable
+	assert a == approx(raw.AUTO_DIST[:])
+	assert (cache.hits, cache.misses) == (0, 1)
+	assert skims.AUTO_DIST is a
+	assert (cache.hits, cache.misses) == (1, 1)
+
+	# a second handle on the same file shares the cache
+	skims2 = OMX(exampville.files.skims, mode='r', cache=cache)
+	df = skims2.get_rc_dataframe(numpy.arange(5), numpy.arange(5), ['AUTO_DIST', 'AUTO_TIME'])
+	assert df.AUTO_TIME.values == approx(raw.AUTO_TIME[:][numpy.arange(5), numpy.arange(5)])
+	assert (cache.hits, cache.misses) == (2, 2)
+	assert len(cache) == 2
+
+	# least recently used matrix is evicted
+	skims['WALK_TIME']
+	assert cache.evictions == 1
+	assert len(cache) == 2
+	assert cache.nbytes <= cache.max_bytes
+	skims['AUTO_DIST']
+	assert (cache.hits, cache.misses) == (2, 4)
+
+	# lookups and uncached files are unchanged
+	assert not isinstance(raw['AUTO_DIST'], numpy.ndarray)
+	assert not isinstance(skims['TAZ_ID'], numpy.ndarray)
+
+	cache.clear()
+	assert cache.info().n_matrices == 0
+	skims.close()
+	skims2.close()
+	raw.close()
+
+
+def test_sqlite_pod():
+	apsw = importorskip("apsw")
+	from ..data_services.sqlite import SQLitePodCO
+	conn = apsw.Connection(":memory:")
+	cur = conn.cursor()
+	cur.execute("CREATE TABLE hh (hhid INTEGER, income REAL, flag BOOLEAN)")
+	cur.executemany(
+		"INSERT INTO hh VALUES (?,?,?)",
+		[(i, i * 1000.5, i % 2) for i in range(100)],
+	)
+	cur.execute("DELETE FROM hh WHERE hhid = 3")
+
+	pod = SQLitePodCO(conn, 'hh')
+	assert pod.shape == (99,)
+	assert pod.podtype == 'idco'
+	assert pod.dtype_of('hhid') == numpy.int64
+	assert pod.dtype_of('flag') == numpy.int8
+
+	hhid = numpy.asarray([i for i in range(100) if i != 3])
+	assert numpy.array_equal(pod.get_data_item('hhid'), hhid)
+	assert pod.get_data_item('income', selector=slice(10, 20)) == approx(hhid[10:20] * 1000.5)
+	sel = numpy.asarray([50, 2, 2, 98])
+	assert pod.get_data_item('income', selector=sel) == approx(hhid[sel] * 1000.5)
+	assert pod.get_data_item('hhid * 2', selector=hhid % 7 == 0) == approx(hhid[hhid % 7 == 0] * 2)
+
+	out = numpy.zeros([99, 2], dtype=numpy.float32)
+	pod.load_into(['hhid', 'income'], None, out)
+	assert out[:, 1] == approx(hhid * 1000.5)
+
+	ordered = SQLitePodCO(conn, 'SELECT * FROM hh WHERE hhid > 10', ordering='hhid DESC')
+	assert numpy.array_equal(ordered.get_data_item('hhid', selector=numpy.asarray([0, 3, 1])), [99, 96, 98])
+
+	with raises(NameError):
+		pod.get_data_item('no_such_column')
+
+
+def test_sqlite_pod_without_rowids():
+	apsw = importorskip("apsw")
+	from ..data_services.sqlite import SQLitePodCO
+	conn = apsw.Connection(":memory:")
+	cur = conn.cursor()
+	cur.execute("CREATE TABLE hh (hhid INTEGER, income REAL)")
+	cur.executemany("INSERT INTO hh VALUES (?,?)", [(i, i * 1000.5) for i in range(100)])
+	cur.execute("CREATE VIEW rich AS SELECT * FROM hh WHERE hhid >= 20")
+	cur.execute("CREATE TABLE hh_norowid (hhid INTEGER PRIMARY KEY, income REAL) WITHOUT ROWID")
+	cur.execute("INSERT INTO hh_norowid SELECT * FROM hh")
+
+	hhid = numpy.arange(100)
+	sel = numpy.asarray([50, 2, 2, 60, 31])
+	for tabledef, expected in [('rich', hhid[20:]), ('hh_norowid', hhid)]:
+		pod = SQLitePodCO(conn, tabledef)
+		assert not pod._is_plain_table
+		assert pod.shape == (len(expected),)
+		assert numpy.array_equal(pod.get_data_item('hhid', selector=sel), expected[sel])
+		mask = expected % 7 == 0
+		assert pod.get_data_item('income', selector=mask) == approx(expected[mask] * 1000.5)
+	assert SQLitePodCO(conn, 'hh')._is_plain_table
+
+
+def test_sqlite_pod_large_selection(monkeypatch):
+	apsw = importorskip("apsw")
+	from ..data_services.sqlite import SQLitePodCO, sqlite_arrays
+	conn = apsw.Connection(":memory:")
+	cur = conn.cursor()
+	cur.execute("CREATE TABLE hh (hhid INTEGER, income REAL, label TEXT)")
+	cur.executemany(
+		"INSERT INTO hh VALUES (?,?,?)",
+		[(i, i * 1000.5, str(i % 5)) for i in range(300000)],
+	)
+	pod = SQLitePodCO(conn, 'hh')
+	assert pod.dtype_of('label') == numpy.float64
+
+	hhid = numpy.arange(300000)
+	sel = hhid % 3 != 0
+	assert numpy.array_equal(pod.get_data_item('hhid', selector=sel), hhid[sel])
+	assert pod.get_data_item('label', selector=sel) == approx(hhid[sel] % 5)
+
+	monkeypatch.setattr(sqlite_arrays, 'ROWID_CHUNK', 7)
+	sel = numpy.asarray([50, 2, 2, 98, 31, 17, 4, 60, 61, 62, 63, 64])
+	out = numpy.zeros([len(sel), 2])
+	pod.load_into(['hhid', 'income'], sel, out)
+	assert numpy.array_equal(out[:, 0], sel)
+	assert out[:, 1] == approx(sel * 1000.5)
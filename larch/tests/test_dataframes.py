@@ -406,4 +406,163 @@ def test_dfs_init_co():
 	assert all(d2.data_ch.sum() == [908, 4090, 1770])
 	assert d2.data_av is None
 	assert d2.data_wt is not None
-	assert d2.data_wt.shape == (6768, 1)
\ No newline at end of file
+	assert d2.data_wt.shape == (6768, 1)
+
+def test_dbf_to_hdf5(tmp_path):
+
+	from .. import DBF
+	from .. import data_warehouse
+
+	q = DBF(data_warehouse.example_file('US-STATES.dbf'))
+	df = q.load_dataframe()
+
+	cols = q.load_numeric_columns(10, 20)
+	assert list(cols.keys()) == ['ALAND', 'AWATER']
+	assert cols['ALAND'] == approx(df.ALAND.values[10:20])
+	assert cols['AWATER'].dtype == numpy.int64
+
+	# a chunk size that does not divide the file exercises the pipelined tail
+	pod = q.convert_to_hdf5(str(tmp_path / 'us-states.h5d'), show_progress=False, chunksize=7)
+	assert pod.shape == (56,)
+	assert pod.ALAND[:] == approx(df.ALAND.values)
+	assert pod.AWATER[:] == approx(df.AWATER.values)
+	pod.close()
+
+	with raises(IndexError):
+		q.load_numeric_columns(60)
+
+
+def test_dbf_close():
+
+	from .. import DBF
+	from .. import data_warehouse
+
+	with DBF(data_warehouse.example_file('US-STATES.dbf')) as q:
+		assert not q.closed
+		df = q.load_dataframe()
+	assert q.closed
+	assert len(df) == 56
+
+	with raises(ValueError):
+		q.load_dataframe()
+	with raises(ValueError):
+		q.load_numeric_columns(0, 10)
+	q.close()
+
+
+def test_skim_ca():
+	from .. import exampville, Model, P, X
+	from ..omx import OMX
+	skims = OMX(exampville.files.skims, mode='r')
+	taz = skims.lookup.TAZ_ID[:]
+	auto_time = skims.AUTO_TIME[:]
+	walk_time = skims.WALK_TIME[:]
+	skims.close()
+
+	rng = numpy.random.RandomState(123)
+	n_cases = 200
+	home = rng.choice(taz, size=n_cases)
+	dest = rng.choice(taz, size=n_cases)
+	co = pandas.DataFrame({'HOMETAZ': home}, index=pandas.RangeIndex(n_cases, name='caseid'))
+	ch = pandas.DataFrame(
+		(dest.reshape(-1,1) == taz.reshape(1,-1)).astype(numpy.float64),
+		index=co.index, columns=taz,
+	)
+	rows = pandas.Index(taz).get_indexer(home)
+	ca = pandas.DataFrame(
+		{
+			'AUTO_TIME': auto_time[rows].reshape(-1),
+			'WALK_TIME': walk_time[rows].reshape(-1),
+		},
+		index=pandas.MultiIndex.from_product([co.index, taz], names=['caseid', 'altid']),
+	)
+
+	m1 = Model(dataservice=None)
+	m1.utility_ca = P.AUTO_TIME * X.AUTO_TIME + P.WALK_TIME * X.WALK_TIME
+	m1.dataframes = DataFrames(co=co, ca=ca, ch=ch, av=True, alt_codes=taz)
+
+	dfs = DataFrames(co=co, ch=ch, av=True, alt_codes=taz)
+	dfs.add_skim_ca('AUTO_TIME', auto_time, 'HOMETAZ', lookup=taz)
+	dfs.add_skim_ca('WALK_TIME', walk_time, 'HOMETAZ', lookup=taz)
+	assert dfs.skims_ca == ('AUTO_TIME', 'WALK_TIME')
+	m2 = Model(dataservice=None)
+	m2.utility_ca = P.AUTO_TIME * X.AUTO_TIME + P.WALK_TIME * X.WALK_TIME
+	m2.dataframes = dfs
+
+	for m in (m1, m2):
+		m.set_values(AUTO_TIME=-0.05, WALK_TIME=-0.02)
+	assert m2.loglike() == approx(m1.loglike())
+	assert m2.d_loglike().values == approx(m1.d_loglike().values)
+	assert m2.probability() == approx(m1.probability())
+
+	with raises(ValueError):
+		dfs.add_skim_ca('BAD_TIME', auto_time, rng.choice([999, 1000], size=n_cases), lookup=taz)
+
+	for part1, part2 in zip(m1.dataframes.split(2), dfs.split(2)):
+		m1.dataframes = part1
+		m2.dataframes = part2
+		assert m2.loglike() == approx(m1.loglike())
+
+
+def test_compress_cases():
+
+	from .. import example
+	m = example(1)
+	m.load_data()
+	dfs = m.dataframes
+
+	# Three copies of each case; the middle copy chooses the first available alternative
+	reps = numpy.repeat(numpy.arange(dfs.n_cases), 3)
+	co = dfs.data_co.iloc[reps].reset_index(drop=True)
+	ca = dfs.data_ca.unstack().iloc[reps].reset_index(drop=True).stack()
+	av = dfs.data_av.iloc[reps].reset_index(drop=True)
+	ch = dfs.data_ch.iloc[reps].reset_index(drop=True).copy()
+	for i in range(1, len(ch), 3):
+		ch.iloc[i, :] = 0
+		ch.iloc[i, numpy.argmax(av.values[i])] = 1
+	wt = pandas.DataFrame(
+		{'wgt': numpy.random.RandomState(0).uniform(0.5, 2, len(co))},
+		index=co.index,
+	)
+	big = DataFrames(
+		co=co, ca=ca, av=av, ch=ch, wt=wt,
+		alt_codes=dfs.alternative_codes(), alt_names=dfs.alternative_names(),
+	)
+	small = big.compress_cases()
+	assert big.n_cases == 15087
+	assert small.n_cases == 4877
+	assert small.case_groups.shape == (15087,)
+	assert small.case_groups.iloc[:6].tolist() == [0, 0, 0, 3, 3, 3]
+	assert small.data_wt.values.sum() == approx(wt.values.sum())
+
+	m1 = example(1)
+	m1.dataframes = big
+	m2 = example(1)
+	m2.dataframes = small
+	x = {'ASC_BIKE': -1, 'totcost': -0.003, 'hhinc#2': -0.002}
+	assert m2.loglike(x) == approx(m1.loglike(x))
+	assert m2.d_loglike(x).values == approx(m1.d_loglike(x).values)
+
+
+def test_constants_fast_path():
+
+	import warnings
+	from .. import example, P
+	m = example(1)
+	m.load_data()
+	m2 = example(1)
+	with warnings.catch_warnings():
+		warnings.simplefilter("ignore")
+		m2.utility_co[2] = m2.utility_co[2] + P('ASC_SR2_extra') * 2
+	m2.lock_value('ASC_SR2_extra', 0.25)
+	m2.load_data()
+	m2.set_values(ASC_SR2=-2.5, totcost=-0.004)
+	m.set_values(ASC_SR2=-2.0, totcost=-0.004)
+	arrays = m2.dataframes._debug_arrays()
+	assert arrays.model_utility_co_const_ptr.tolist() == [0, 0, 2, 3, 4, 5, 6]
+	assert -1 not in arrays.model_utility_co_data
+	assert m2.loglike() == approx(m.loglike())
+	d2 = m2.d_loglike()
+	d1 = m.d_loglike()
+	assert d2['ASC_SR2_extra'] == 0
+	assert d2.drop('ASC_SR2_extra').values == approx(d1.values)
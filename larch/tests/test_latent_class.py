@@ -110,3 +110,161 @@ def test_latent_class():
 	# 	'W_OTHER': 1.0943806549385064,
 	# })
 	#
+
+
+def _swissmetro_latent_class(class_specific=False, groupid=None):
+
+	raw_df = pandas.read_csv(data_warehouse.example_file('swissmetro.csv.gz'))
+	raw_df['CAR_AV_SP'] = raw_df.eval("CAR_AV * (SP!=0)")
+	raw_df['TRAIN_AV_SP'] = raw_df.eval("TRAIN_AV * (SP!=0)")
+	keep = raw_df.eval("PURPOSE in (1,3) and CHOICE != 0")
+	dfs = larch.DataFrames(raw_df[keep], alt_codes=[1,2,3])
+
+	def class_model(with_time):
+		sfx = str(int(with_time)) if class_specific else ''
+		k = larch.Model(dataservice=dfs)
+		k.availability_co_vars = {
+			1: "TRAIN_AV_SP",
+			2: "SM_AV",
+			3: "CAR_AV_SP",
+		}
+		k.choice_co_code = 'CHOICE'
+		k.utility_co[1] = P(f"ASC_TRAIN{sfx}") + X("TRAIN_CO*(GA==0)") * P(f"B_COST{sfx}")
+		k.utility_co[2] = X("SM_CO*(GA==0)") * P(f"B_COST{sfx}")
+		k.utility_co[3] = P(f"ASC_CAR{sfx}") + X("CAR_CO") * P(f"B_COST{sfx}")
+		if with_time:
+			k.utility_co[1] += X("TRAIN_TT") * P(f"B_TIME{sfx}")
+			k.utility_co[2] += X("SM_TT") * P(f"B_TIME{sfx}")
+			k.utility_co[3] += X("CAR_TT") * P(f"B_TIME{sfx}")
+		return k
+
+	km = larch.Model()
+	km.utility_co[2] = P.W_OTHER + X("INCOME") * P.W_INCOME
+
+	from larch.model.latentclass import LatentClassModel
+	m = LatentClassModel(km, {1:class_model(False), 2:class_model(True)}, groupid=groupid)
+	m.load_data()
+	if class_specific:
+		m.set_values(ASC_TRAIN0=-.3, ASC_TRAIN1=-.5, B_COST0=-0.01, B_COST1=-0.02, B_TIME1=-0.02, W_OTHER=0.5)
+	else:
+		m.set_values(ASC_CAR=0.125, ASC_TRAIN=-0.398, B_COST=-.0126, B_TIME=-0.028, W_OTHER=1.095, W_INCOME=-0.1)
+	return m
+
+
+def test_latent_class_fused_kernel():
+
+	import numpy
+	from larch.model.persist_flags import PERSIST_PROBABILITY
+	m = _swissmetro_latent_class()
+	assert m._can_use_fused_kernel()
+	fused = m.loglike2_bhhh(persist=PERSIST_PROBABILITY)
+
+	pr = m.probability()
+	d_pr = m.d_probability()
+	ch = m.dataframes.array_ch()
+	casewise_dll = ((ch / numpy.where(pr > 0, pr, 1))[:, :, None] * d_pr).sum(1)
+
+	assert fused.probability == approx(pr)
+	assert fused.ll == approx(numpy.sum(ch * numpy.log(numpy.where(ch > 0, pr, 1))))
+	assert numpy.asarray(fused.dll) == approx(casewise_dll.sum(0))
+	assert fused.bhhh == approx(casewise_dll.T @ casewise_dll)
+	assert m.loglike() == approx(fused.ll)
+
+	check = m.check_d_loglike()
+	assert check.data.similarity.min() > 4
+
+	half = m.loglike2(leave_out=0, subsample=2).ll + m.loglike2(keep_only=0, subsample=2).ll
+	assert half == approx(fused.ll)
+
+
+def test_latent_class_probability_path(monkeypatch):
+
+	import numpy
+	from larch.model.persist_flags import PERSIST_BHHH
+	m = _swissmetro_latent_class()
+	fused = m.loglike2_bhhh()
+	monkeypatch.setattr(m, '_can_use_fused_kernel', lambda: False)
+	y = m.loglike2(persist=PERSIST_BHHH)
+
+	pr = m.probability()
+	d_pr = m.d_probability()
+	ch = m.dataframes.array_ch()
+	casewise_dll = ((ch / numpy.where(pr > 0, pr, 1))[:, :, None] * d_pr).sum(1)
+
+	assert y.ll == approx(fused.ll)
+	assert numpy.asarray(y.dll) == approx(casewise_dll.sum(0))
+	assert y.bhhh == approx(casewise_dll.T @ casewise_dll)
+	assert y.bhhh == approx(numpy.asarray(fused.bhhh))
+
+
+def test_d_loglike_from_d_probability():
+
+	import numpy
+	from larch.model.nl import d_loglike_from_d_probability
+	r = numpy.random.RandomState(1)
+	n_cases, n_alts, n_params = 101, 4, 45
+	pr = r.uniform(0.1, 1, [n_cases, n_alts])
+	d_pr = r.normal(size=[n_cases, n_alts, n_params])
+	ch = (r.uniform(size=[n_cases, n_alts]) < 0.4).astype(float)
+	wt = r.normal(size=n_cases)
+	dll, bhhh = d_loglike_from_d_probability(pr, d_pr, ch, wt, True)
+	g = d_pr / pr[:, :, None]
+	assert dll == approx(numpy.einsum('c,ca,cav->v', wt, ch, g))
+	assert bhhh == approx(numpy.einsum('c,ca,cav,caw->vw', wt, ch, g, g))
+	assert numpy.array_equal(bhhh, bhhh.T)
+
+
+def test_latent_class_em():
+
+	import warnings
+	m = _swissmetro_latent_class(class_specific=True)
+	ll0 = m.loglike()
+	r = m.maximize_loglike(method='em', quiet=True, options={'maxiter': 30})
+	assert r.method == 'em'
+	assert r.n_iters == 30
+	assert r.loglike == approx(m.loglike())
+	assert ll0 < -5150 < r.loglike < -5140.278
+	r = m.maximize_loglike(method='em', quiet=True, options={'maxiter': 5, 'finish_bhhh': 5})
+	assert len(r.steps) == 5
+	assert r.loglike == approx(m.loglike())
+	assert r.loglike > -5141
+
+	# Shared parameters are held fixed by EM
+	m = _swissmetro_latent_class()
+	shared = m.pf.value[['ASC_CAR', 'ASC_TRAIN', 'B_COST']].copy()
+	with warnings.catch_warnings(record=True) as w:
+		warnings.simplefilter("always")
+		r = m.maximize_loglike(method='em', quiet=True, options={'maxiter': 3})
+	assert any('shared' in str(i.message) for i in w)
+	assert m.pf.value[['ASC_CAR', 'ASC_TRAIN', 'B_COST']].values == approx(shared.values)
+	assert m.pf.value['B_TIME'] != approx(-0.028)
+	assert (m.pf.holdfast == 0).all()
+
+
+def test_latent_class_panel():
+
+	import numpy
+	m = _swissmetro_latent_class(class_specific=True, groupid='ID')
+	assert m.n_cases == 6768
+	assert m.n_groups == 752
+
+	y = m.loglike2_bhhh()
+	posterior, groupwise_ll = m._em_posterior()
+	assert groupwise_ll.shape == (752,)
+	assert y.ll == approx(groupwise_ll.sum())
+	assert m.loglike() == approx(y.ll)
+	assert m.check_d_loglike().data.similarity.min() > 4
+
+	# BHHH is one outer product per group
+	groupwise = numpy.stack([
+		numpy.asarray(m.loglike2(start_case=g, stop_case=g+1).dll)
+		for g in range(10)
+	])
+	assert m.loglike2_bhhh(stop_case=10).bhhh == approx(groupwise.T @ groupwise)
+
+	# All cases of a group share the posterior
+	codes = m._panel.codes
+	assert numpy.ptp(posterior[codes == 0], axis=0) == approx(0)
+
+	r = m.maximize_loglike(method='em', quiet=True, options={'maxiter': 50, 'finish_bhhh': 20})
+	assert r.loglike == approx(-4317.08229, rel=1e-7)
@@ -0,0 +1,118 @@
+from pytest import approx
+import numpy
+import pandas
+
+import larch
+from larch import data_warehouse
+from larch.roles import P, X
+
+
+def _swissmetro_mixed_logit(draw_type='halton', groupid=None, distribution='normal'):
+
+	from larch.model.mixed import MixedLogitModel
+	raw_df = pandas.read_csv(data_warehouse.example_file('swissmetro.csv.gz'))
+	raw_df['CAR_AV_SP'] = raw_df.eval("CAR_AV * (SP!=0)")
+	raw_df['TRAIN_AV_SP'] = raw_df.eval("TRAIN_AV * (SP!=0)")
+	keep = raw_df.eval("PURPOSE in (1,3) and CHOICE != 0")
+	dfs = larch.DataFrames(raw_df[keep], alt_codes=[1,2,3])
+
+	m = MixedLogitModel(
+		dataservice=dfs,
+		mixtures={'B_TIME': ('S_TIME', distribution)},
+		n_draws=50,
+		draw_type=draw_type,
+		groupid=groupid,
+	)
+	m.availability_co_vars = {
+		1: "TRAIN_AV_SP",
+		2: "SM_AV",
+		3: "CAR_AV_SP",
+	}
+	m.choice_co_code = 'CHOICE'
+	m.utility_co[1] = P("ASC_TRAIN") + X("TRAIN_CO*(GA==0)") * P("B_COST") + X("TRAIN_TT/100") * P("B_TIME")
+	m.utility_co[2] = X("SM_CO*(GA==0)") * P("B_COST") + X("SM_TT/100") * P("B_TIME")
+	m.utility_co[3] = P("ASC_CAR") + X("CAR_CO") * P("B_COST") + X("CAR_TT/100") * P("B_TIME")
+	m.load_data()
+	m.set_values(
+		ASC_CAR=0.1, ASC_TRAIN=-0.4, B_COST=-.01, S_TIME=0.8,
+		B_TIME=-1.2 if distribution == 'normal' else 0.2,
+	)
+	return m, raw_df[keep]
+
+
+def _finite_difference(m, name, h=1e-5):
+	x0 = m.pf.loc[name, 'value']
+	ll_hi = m.loglike({name: x0 + h})
+	ll_lo = m.loglike({name: x0 - h})
+	m.set_values({name: x0})
+	return (ll_hi - ll_lo) / (2 * h)
+
+
+def test_mixed_logit_simulated_loglike():
+
+	from scipy.stats import norm
+	from larch.model.draws import uniform_draws
+
+	for draw_type in ['halton', 'sobol']:
+		for distribution in ['normal', 'lognormal']:
+			m, df = _swissmetro_mixed_logit(draw_type, distribution=distribution)
+			y = m.loglike2_bhhh()
+
+			# the same simulation, with all the draws built up front
+			z = norm.ppf(uniform_draws(m.n_cases, m.n_draws, 1, draw_type)[:, :, 0])
+			v = m.pf['value']
+			b = v.B_TIME + v.S_TIME * z
+			if distribution == 'lognormal':
+				b = numpy.exp(b)
+			utility = numpy.stack([
+				v.ASC_TRAIN + df.eval("TRAIN_CO*(GA==0)").values[:, None] * v.B_COST + df.eval("TRAIN_TT/100").values[:, None] * b,
+				df.eval("SM_CO*(GA==0)").values[:, None] * v.B_COST + df.eval("SM_TT/100").values[:, None] * b,
+				v.ASC_CAR + df.eval("CAR_CO").values[:, None] * v.B_COST + df.eval("CAR_TT/100").values[:, None] * b,
+			], axis=2)
+			exp_utility = numpy.exp(utility) * m.dataframes.array_av()[:, None, :]
+			pr = exp_utility / exp_utility.sum(2, keepdims=True)
+			ch = m.dataframes.array_ch()
+			assert y.ll == approx(numpy.log((pr * ch[:, None, :]).sum(2).mean(1)).sum(), rel=1e-9)
+			assert m.probability() == approx(pr.mean(1), rel=1e-6)
+
+			for name in ['ASC_TRAIN', 'B_TIME', 'S_TIME']:
+				assert y.dll[name] == approx(_finite_difference(m, name), rel=1e-5)
+			assert numpy.all(numpy.diag(y.bhhh) > 0)
+
+
+def test_mixed_logit_probability_slice():
+
+	for groupid in [None, 'ID']:
+		m, _ = _swissmetro_mixed_logit(groupid=groupid)
+		full = m.probability()
+		assert full.shape == (m.n_cases, 3)
+		part = m.probability(start_case=5, stop_case=50, step_case=3)
+		assert part == approx(full[5:50:3])
+		out = numpy.zeros([15, 3])
+		result = m.probability(start_case=5, stop_case=50, step_case=3, out=out)
+		assert result is out
+		assert out == approx(full[5:50:3])
+
+
+def test_mixed_logit_panel():
+
+	m, _ = _swissmetro_mixed_logit(groupid='ID')
+	assert m.n_groups == 752
+	m.n_threads = 1
+	y1 = m.loglike2_bhhh()
+	assert y1.ll == approx(-4910.752961425508)
+	m.n_threads = 4
+	y4 = m.loglike2_bhhh()
+	assert y4.ll == approx(y1.ll, rel=1e-12)
+	assert y4.dll.values == approx(y1.dll.values, rel=1e-9)
+	assert y4.bhhh == approx(y1.bhhh, rel=1e-9)
+
+	# a holdfast mean still carries its random part
+	m.lock_value('B_TIME', -1.2)
+	y = m.loglike2()
+	assert y.dll['B_TIME'] == 0
+	assert y.dll['S_TIME'] == approx(_finite_difference(m, 'S_TIME'), rel=1e-5)
+
+	assert m.loglike('null') == approx(m.loglike_null())
+	r = m.maximize_loglike(method='slsqp', quiet=True)
+	assert r.loglike == approx(-4427.120613489237, rel=1e-6)
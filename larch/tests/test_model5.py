@@ -5,7 +5,7 @@ import numpy
 import pandas
 from ..model import *
 from ..roles import P, X, PX
-from ..model.persist_flags import PERSIST_UTILITY
+from ..model.persist_flags import PERSIST_UTILITY, PERSIST_PROBABILITY
 
 
 def test_dataframes_mnl5():
@@ -4965,3 +4965,378 @@ def test_linear_component_scale():
 		'nonmotorized_time': -101752.27351325999,
 		'totcost': 59215.91013275611,
 	})
+
+def test_loglike_along_direction():
+
+	from larch import example
+	from ..model.abstract_model import AbstractChoiceModel
+	m = example(1)
+	m.load_data()
+	m.set_values(ASC_BIKE=-2, ASC_SR2=-1.5, hhinc=-0.001)
+	direction = numpy.random.RandomState(0).normal(size=len(m.pf)) * 0.1
+	steps = [1, 0.5, 0.25, 0.125]
+	single_pass = m._loglike_along_direction(direction, steps)
+	one_by_one = AbstractChoiceModel._loglike_along_direction(m, direction, steps)
+	assert single_pass == approx(one_by_one)
+	assert single_pass == approx([-37050.50620576, -20140.04856836, -12434.10422501, -9183.1029464])
+
+	m.set_values('null')
+	ll, tolerance = m.simple_step_bhhh()
+	assert ll > -7309.600971749863
+	assert m.loglike() == approx(ll)
+
+	m.set_values('null')
+	r = m.maximize_loglike(method='bhhh', quiet=True)
+	assert r.loglike == approx(-3626.18625551293)
+
+def test_trust_region_bhhh():
+
+	from larch import example
+	m = example(1)
+	m.load_data()
+	m.set_values('null')
+	r = m.maximize_loglike(method='trust-bhhh', quiet=True)
+	assert r.loglike == approx(-3626.18625551293)
+	assert r.method == 'trust-bhhh'
+	assert r.n_evaluations <= 15
+	assert m.loglike() == approx(r.loglike)
+
+	m.set_values('null')
+	m.lock_value('ASC_BIKE', -2.0)
+	m.set_value('hhinc#2', maximum=-0.004)
+	r = m.maximize_loglike(method='trust-bhhh', quiet=True)
+	assert r.loglike == approx(-3627.566584697941)
+	assert m.pf.loc['ASC_BIKE', 'value'] == -2.0
+	assert m.pf.loc['hhinc#2', 'value'] == approx(-0.004)
+
+def test_trust_region_bhhh_constraints():
+
+	from larch import example
+	from larch.model.constraints import OrderingBound
+	m = example(1)
+	m.load_data()
+	m.set_values('null')
+	m.constraints = [OrderingBound("hhinc#3 <= hhinc#2"), ]
+	with warns(UserWarning, match='SLSQP'):
+		r = m.maximize_loglike(method='trust-bhhh', quiet=True)
+	assert r.method == 'slsqp'
+	assert m.pf.loc['hhinc#3', 'value'] <= m.pf.loc['hhinc#2', 'value'] + 1e-6
+
+def test_warm_start():
+
+	from larch import example
+	m = example(1)
+	m.load_data()
+	m.set_values('null')
+	n_steps, passes = m.warm_start_bhhh(schedule=((16, 2), (4, 2)))
+	assert n_steps == 4
+	assert passes == approx(1.2507456750845098)
+	assert m.loglike() > -7309.600971749863
+
+	m.set_values('null')
+	r = m.maximize_loglike(method='bhhh', quiet=True, warm_start=True)
+	assert r.loglike == approx(-3626.18625551293)
+	assert r.warm_start_steps > 0
+	assert 0 < r.warm_start_passes < 3
+	assert len(r.steps) < 10
+
+	m.set_values('null')
+	m.set_value('ASC_BIKE', minimum=-1.0)
+	n_steps, passes = m.warm_start_bhhh(schedule=((16, 2), (4, 2)))
+	assert n_steps > 0
+	assert m.pf.loc['ASC_BIKE', 'value'] >= -1.0
+
+def test_cross_validate_parallel():
+
+	from larch import example
+	m = example(1)
+	m.load_data()
+	m.set_values(ASC_BIKE=-1.0)
+	ll0 = m.loglike()
+	frame0 = m.pf.copy()
+	r1 = m.cross_validate_parallel(cv=5, n_jobs=1)
+	assert m.loglike() == ll0
+	assert m.pf.equals(frame0)
+	r2 = m.cross_validate_parallel(cv=5, n_jobs=2)
+	assert m.loglike() == ll0
+	assert m.pf.equals(frame0)
+	assert r1.loglike == approx(-3643.2149612517837)
+	assert r2.loglike == approx(r1.loglike)
+	assert r2.holdout_loglike.values == approx(r1.holdout_loglike.values)
+	assert r2.parameters.values == approx(r1.parameters.values, rel=1e-5)
+	assert r1.parameters.shape == (len(m.pf), 5)
+
+def test_maximize_loglike_callback():
+
+	from larch import example
+	m = example(1)
+	m.load_data()
+	for method in ['bhhh', 'trust-bhhh', 'slsqp']:
+		m.set_values('null')
+		seen = []
+
+		def stop_after_three(x):
+			seen.append(numpy.array(x))
+			return len(seen) == 3
+
+		r = m.maximize_loglike(method=method, quiet=True, callback=stop_after_three)
+		assert r.stopped
+		assert r.method == method
+		assert len(seen) == 3
+		assert m.pvals == approx(seen[-1])
+		assert r.loglike == approx(m.loglike())
+		assert r.loglike < -3627
+
+def test_estimate_many():
+
+	import larch
+	from larch import example
+	ds = example(1).dataservice
+
+	def make_models():
+		m_full = example(1)
+		m_no_cost = example(1)
+		m_no_cost.utility_ca = P('tottime') * X('tottime')
+		m_tiny = example(1)
+		m_tiny.utility_co = {}
+		m_tiny.utility_ca = P('tottime') * X('tottime')
+		return {'full': m_full, 'no_cost': m_no_cost, 'tiny': m_tiny}
+
+	models = make_models()
+	table = larch.estimate_many(models, ds, n_workers=2)
+	assert list(table.index) == ['full', 'no_cost', 'tiny']
+	assert table.loglike.values == approx([-3626.186256, -3915.164136, -5961.631455])
+	assert list(table.n_params) == [12, 11, 1]
+	assert table.aic.values == approx(2 * table.n_params.values - 2 * table.loglike.values)
+	assert all(table.status == 'converged')
+	assert models['full'].pf.loc['totcost', 'value'] == approx(-0.00492, rel=1e-2)
+
+	table = larch.estimate_many(make_models(), ds, n_workers=1, early_stop=5.0, check_every=2)
+	assert list(table.status) == ['converged', 'stopped early', 'stopped early']
+	assert table.loglike['full'] == approx(-3626.186256)
+
+	# checks that never stop do not change the estimation
+	unchecked = larch.estimate_many(make_models(), ds, n_workers=1)
+	checked = larch.estimate_many(make_models(), ds, n_workers=1, early_stop=1e9, check_every=1)
+	assert all(checked.status == 'converged')
+	assert checked.loglike.values == approx(unchecked.loglike.values)
+	assert list(checked.iterations) == list(unchecked.iterations)
+
+def test_likelihood_ratio_batch():
+
+	from larch import example
+	from ..model.abstract_model import AbstractChoiceModel
+	m = example(1)
+	m.load_data()
+	m.maximize_loglike(quiet=True)
+	shifts = (m.pf.nullvalue - m.pf.value).values
+	single_pass = m._loglike_coordinate_shifts(shifts)
+	one_by_one = AbstractChoiceModel._loglike_coordinate_shifts(m, shifts)
+	assert single_pass == approx(one_by_one)
+
+	lr = m.likelihood_ratio()
+	assert lr['totcost'] == approx(379.7828373542284, rel=1e-6)
+	assert lr['totcost'] == approx(m.likelihood_ratio('totcost'))
+	assert lr['ASC_SR2'] == approx(m.likelihood_ratio('ASC_SR2'))
+	assert m.pf.loc['tottime', 'likelihood_ratio'] == approx(lr['tottime'])
+	assert m.likelihood_ratio(['tottime', 'totcost']).values == approx(lr[['tottime', 'totcost']].values)
+
+	m.lock_value('ASC_BIKE', -2.3)
+	m.pf.loc['ASC_BIKE', 'nullvalue'] = 0
+	lr = m.likelihood_ratio()
+	assert numpy.isnan(lr['ASC_BIKE'])
+	lr = m.likelihood_ratio(include_holdfast=True)
+	assert lr['ASC_BIKE'] == approx(m.likelihood_ratio('ASC_BIKE'))
+	assert lr['ASC_BIKE'] != 0
+	assert lr['totcost'] == approx(m.likelihood_ratio('totcost'))
+
+def test_cached_reference_loglikes(tmp_path):
+
+	from larch import example, DataFrames
+	from ..model import reference_cache
+	reference_cache.clear()
+	m = example(1)
+	m.load_data()
+	assert m._null_utility_is_zero()
+	assert m.loglike_null() == approx(-7309.600971749863)
+	assert m.loglike_nil() == approx(-7309.600971749863)
+	fingerprint = m.dataframes.fingerprint()
+	assert reference_cache.get('nil', fingerprint) == approx(-7309.600971749863)
+
+	m2 = example(1)
+	m2.load_data()
+	assert m2.dataframes.fingerprint() == fingerprint
+	with raises(ValueError):
+		m2.loglike_null(use_cache=-1)
+	assert m2.loglike_null() == approx(-7309.600971749863)
+	assert m2.loglike_nil() == approx(-7309.600971749863)
+
+	# a holdfast parameter keeps its value in the null model
+	m3 = example(1)
+	m3.load_data()
+	m3.set_value('totcost', -0.01, holdfast=1)
+	assert not m3._null_utility_is_zero()
+	assert m3.loglike_null(use_cache=False) == approx(m3.loglike('null'))
+	assert m3.loglike_null() != approx(-7309.600971749863)
+	assert reference_cache.get('nil', fingerprint) == approx(-7309.600971749863)
+	m3.set_value('totcost', 0, holdfast=1)
+	assert m3._null_utility_is_zero()
+
+	# availability varies, so the constants only model is estimated
+	assert m.loglike_constants_only() == approx(-4132.915647884173)
+	assert reference_cache.get('constants_only', fingerprint) == approx(-4132.915647884173)
+
+	# universal availability, so the constants only model has a closed form
+	dfs = m.dataframes
+	dfs1 = DataFrames(co=dfs.data_co, ca=dfs.data_ca, av=1, ch=dfs.data_ch)
+	closed = dfs1._closed_form_loglike_constants_only()
+	mm = Model()
+	mm.dataservice = dfs1
+	for code in [2, 3, 4, 5, 6]:
+		mm.utility_co[code] = P(f'ASC_{code}')
+	mm.load_data(log_warnings=False)
+	assert closed == approx(mm.maximize_loglike(quiet=True).loglike)
+
+	reference_cache.set_cache_dir(str(tmp_path))
+	try:
+		reference_cache.put('nil', 'abc123', -1.5)
+		reference_cache.clear()
+		assert reference_cache.get('nil', 'abc123') == -1.5
+		reference_cache.clear(persisted=True)
+		assert reference_cache.get('nil', 'abc123') is None
+	finally:
+		reference_cache.set_cache_dir(False)
+
+
+def test_probability_out(tmp_path):
+
+	from larch import example
+	from ..general_precision import l4_float_dtype
+	m = example(1)
+	m.load_data()
+	m.set_values(ASC_BIKE=-2, ASC_SR2=-1.5, hhinc=-0.001)
+	full = m.loglike(persist=PERSIST_PROBABILITY).probability
+
+	pr = m.probability()
+	assert pr == approx(full)
+	assert m.loglike(probability_only=True) == approx(full)
+
+	out = numpy.lib.format.open_memmap(
+		str(tmp_path / 'pr.npy'), mode='w+', dtype=l4_float_dtype, shape=(len(range(5, m.n_cases, 3)), 6),
+	)
+	result = m.probability(out=out, start_case=5, step_case=3)
+	assert result is out
+	assert numpy.asarray(out) == approx(full[5::3])
+
+	wide = numpy.zeros([m.n_cases, 8], dtype=l4_float_dtype)
+	m.probability(out=wide[:, 1:7])
+	assert wide[:, 1:7] == approx(full)
+	assert numpy.all(wide[:, [0, 7]] == 0)
+
+	with raises(ValueError):
+		m.probability(out=numpy.zeros([10, 6], dtype=l4_float_dtype))
+
+
+def test_schedules():
+
+	from larch import example
+	from ..model.scheduling import case_blocks
+	for n in (1, 22):
+		m = example(n)
+		m.load_data()
+		m.set_values(ASC_BIKE=-2, ASC_SR2=-1.5, hhinc=-0.001)
+		m.n_threads = 1
+		y0 = m.loglike2_bhhh()
+		pr0 = m.probability()
+		m.n_threads = 4
+		for schedule in ('static', 'dynamic', 'guided', 'balanced'):
+			for chunksize in (0, 7):
+				m.schedule = schedule
+				m.chunksize = chunksize
+				y = m.loglike2_bhhh()
+				assert y.ll == approx(y0.ll, rel=1e-12)
+				assert y.dll.values == approx(y0.dll.values, rel=1e-10)
+				assert y.bhhh == approx(y0.bhhh, rel=1e-10)
+				assert m.probability() == approx(pr0, rel=1e-12)
+				blocks = case_blocks(m.dataframes, 4, schedule, chunksize, 3, -1, 2)
+				assert blocks[0] == 0
+				assert blocks[-1] == len(range(3, m.n_cases, 2))
+				assert numpy.all(numpy.diff(blocks) > 0)
+		assert m.loglike(start_case=3, step_case=2) == approx(
+			sum(m.loglike(start_case=c, stop_case=c+1) for c in range(3, m.n_cases, 2))
+		)
+
+	with raises(ValueError):
+		m.schedule = 'round-robin'
+	with raises(ValueError):
+		m.chunksize = -1
+	assert m.dataframes.case_work().sum() == m.dataframes.array_av().sum() + m.n_cases
+
+
+def test_thread_local_zeros():
+
+	from ..model.thread_buffers import thread_local_zeros, working_zeros, CACHE_LINE_BYTES, PAGE_BYTES
+	small = thread_local_zeros(5, [3])
+	assert small.shape == (5, 3)
+	assert small.strides[0] == CACHE_LINE_BYTES
+	assert small.ctypes.data % CACHE_LINE_BYTES == 0
+	large = thread_local_zeros(3, [30, 20])
+	assert large.strides[0] % PAGE_BYTES == 0
+	assert large.ctypes.data % PAGE_BYTES == 0
+	assert all(large[t].flags.c_contiguous for t in range(3))
+	large[1, 2, 3] = 1.5
+	large[2, 2, 3] = 2.0
+	assert large.sum(0)[2, 3] == 3.5
+	assert large.sum() == 3.5
+	assert working_zeros(100, 4, [6]).strides == (48, 8)
+	assert working_zeros(4, 4, []).strides == (CACHE_LINE_BYTES, )
+
+
+def test_bhhh_rank_k_updates():
+
+	from larch import example
+	from ..model.persist_flags import PERSIST_D_LOGLIKE_CASEWISE
+	from ..model.bhhh import BHHH_BLOCK_ROWS
+	for n in (1, 22):
+		m = example(n)
+		m.load_data()
+		m.set_values(ASC_BIKE=-2, ASC_SR2=-1.5, hhinc=-0.001)
+		assert m.n_cases > 4 * BHHH_BLOCK_ROWS
+		for n_threads in (1, 3):
+			m.n_threads = n_threads
+			y = m.loglike2_bhhh(persist=PERSIST_D_LOGLIKE_CASEWISE)
+			casewise = y.dll_casewise.values
+			assert y.bhhh == approx(casewise.T @ casewise, rel=1e-10)
+			assert numpy.array_equal(y.bhhh, y.bhhh.T)
+
+
+def test_profiling():
+
+	from larch import example
+	m = example(1)
+	m.load_data()
+	assert m.profile is None
+	r = m.maximize_loglike(method='bhhh', quiet=True)
+	assert 'profile' not in r
+
+	m.profiling = True
+	m.loglike2_bhhh()
+	p = m.profile
+	assert p.calls == 1
+	assert p.data_passes == 1
+	assert p.cases == m.n_cases
+	assert p.bytes_allocated > 0
+	assert all(p.seconds[phase] > 0 for phase in ('prepare', 'unmangle', 'read_parameters', 'allocate', 'kernel', 'reduce', 'wrap'))
+	m.probability()
+	assert p.data_passes == 2
+
+	r = m.maximize_loglike(method='slsqp', quiet=True)
+	assert r.profile.calls >= 1
+	assert r.profile.data_passes == p.data_passes - 2
+	assert r.profile.cases == r.profile.data_passes * m.n_cases
+	assert r.profile.cases_per_second > 0
+	assert r.profile.total_seconds == approx(sum(r.profile.seconds.values()))
+	assert r.profile.total_seconds <= r.elapsed_time.total_seconds()
+
+	m.profiling = False
+	assert m.profile is None
@@ -83,3 +83,59 @@ def test_simple_model_group():
 	mg2.append(m1)
 	mg2.append(m2)
 	assert mg2.loglike() == approx(-3620.697667552756)
+
+
+def test_model_group_concurrent():
+
+	import numpy
+	from larch.model.model_group import ModelGroup
+
+	df = pd.read_csv(example_file("MTCwork.csv.gz"))
+	df.set_index(['casenum','altnum'], inplace=True)
+	d = larch.DataFrames(df, ch='chose', crack=True)
+
+	def segment_model(dataservice, sfx):
+		m = larch.Model(dataservice=dataservice)
+		for a, name in [(2, 'SR2'), (3, 'SR3P'), (4, 'TRAN'), (5, 'BIKE'), (6, 'WALK')]:
+			m.utility_co[a] = P(f"ASC_{name}") + P(f"hhinc#{a}") * X("hhinc")
+		m.utility_ca = P(f"tottime_{sfx}")*X("tottime") + P(f"totcost_{sfx}")*X("totcost")
+		m.load_data()
+		return m
+
+	m0 = larch.Model(dataservice=d)
+	for a, name in [(2, 'SR2'), (3, 'SR3P'), (4, 'TRAN'), (5, 'BIKE'), (6, 'WALK')]:
+		m0.utility_co[a] = P(f"ASC_{name}") + P(f"hhinc#{a}") * X("hhinc")
+	m0.utility_ca = (
+		(P("tottime_m")*X("tottime") + P("totcost_m")*X("totcost"))*X("femdum == 0")
+		+
+		(P("tottime_f")*X("tottime") + P("totcost_f")*X("totcost"))*X("femdum == 1")
+	)
+	m0.load_data()
+	m0.set_values(ASC_SR2=-2, totcost_m=-0.004, tottime_f=-0.03, **{'hhinc#4': -0.005})
+
+	m1 = segment_model(d.selector_co("femdum == 0"), 'm')
+	m2 = segment_model(d.selector_co("femdum == 1"), 'f')
+	mg = ModelGroup([m1, m2], n_threads=4)
+	assert mg._thread_allocation().tolist() == [2, 1]
+	mg.unmangle()
+	mg.set_values(**m0.pf.value)
+
+	m1.n_threads = 3
+	m2.n_threads = 5
+	y0 = m0.loglike2_bhhh(return_series=True)
+	y = mg.loglike2_bhhh(return_series=True)
+	assert y.ll == approx(y0.ll)
+	pd.testing.assert_series_equal(y.dll.sort_index(), y0.dll.sort_index(), check_names=False)
+	idx = y0.bhhh.index.sort_values()
+	assert y.bhhh.loc[idx, idx].values == approx(y0.bhhh.loc[idx, idx].values)
+	# each submodel runs with its share of the threads, and gets its own setting back afterwards
+	assert [m.n_threads for m in mg] == [3, 5]
+	assert mg._map_models(lambda k: k.n_threads) == [2, 1]
+	assert [m.n_threads for m in mg] == [3, 5]
+
+	mg.n_threads = 1
+	assert mg.loglike() == approx(y0.ll)
+
+	mg.n_threads = 4
+	result = mg.maximize_loglike(method='bhhh', quiet=True)
+	assert result.loglike == approx(-3620.697668335103)
@@ -0,0 +1,56 @@
+import multiprocessing
+
+_fork_payload = None
+
+
+def _call_fork_payload(item):
+	return _fork_payload(item)
+
+
+def fork_available():
+	"""bool : Whether worker processes can be started by forking."""
+	return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def fork_map(func, items, n_jobs=None):
+	"""
+	Apply a function to each item using forked worker processes.
+
+	Worker processes are forked from the current process, so they
+	inherit everything already loaded in memory (e.g. the dataframes
+	attached to a model) without pickling it, and share those pages
+	copy-on-write.  The function itself can therefore be a closure
+	or bound method; only the items and the return values are pickled.
+
+	Parameters
+	----------
+	func : callable
+		Called as ``func(item)`` in a worker process.  Changes it makes
+		to objects in the worker do not propagate back to the parent.
+	items : iterable
+	n_jobs : int, optional
+		The number of worker processes.  Defaults to the smaller of the
+		number of items and the number of CPUs.  If this is 1, or if
+		forking is not available on this platform, the items are
+		processed serially in the current process instead, in which case
+		any changes `func` makes are *not* isolated from the caller.
+
+	Returns
+	-------
+	list
+		The results, in the same order as `items`.
+	"""
+	global _fork_payload
+	items = list(items)
+	if n_jobs is None:
+		n_jobs = min(len(items), multiprocessing.cpu_count())
+	n_jobs = max(1, min(int(n_jobs), len(items)))
+	# A nested call (e.g. from inside a worker) runs serially.
+	if n_jobs > 1 and fork_available() and _fork_payload is None:
+		_fork_payload = func
+		try:
+			with multiprocessing.get_context('fork').Pool(n_jobs) as pool:
+				return pool.map(_call_fork_payload, items, chunksize=1)
+		finally:
+			_fork_payload = None
+	return [func(item) for item in items]
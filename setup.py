@@ -136,6 +136,11 @@ setup(
             'doc/*.ipynb', 'doc/example/*.ipynb',
         ],
     },
+    setup_requires=[
+        'cython >=0.29',
+        'numpy >=1.13',
+        'scipy >=1.0', # model/bhhh.pyx cimports scipy.linalg.cython_blas
+    ],
     install_requires=[
         'numpy >=1.13',
         'scipy >=1.0',
@@ -0,0 +1,103 @@
+"""
+Time the log likelihood kernels over a range of thread counts.
+
+Usage::
+
+	python tools/benchmark_threads.py --example 1 --replicate 20 --threads 1,2,4,8,16,32
+
+For each schedule and thread count, this reports the best wall clock time
+of `loglike2_bhhh` over several repeats, the speedup relative to the
+first thread count, and the parallel efficiency (speedup per thread,
+relative to the first thread count).  The example data is replicated to give enough cases
+for the larger thread counts to have something to do.  With `--sort`, the cases
+are ordered by their number of available alternatives, which makes the
+work per case uneven along the case index and shows the difference between
+the 'static' and 'balanced' schedules.
+"""
+
+import argparse
+import time
+
+import numpy
+import pandas
+
+import larch
+from larch.model.scheduling import SCHEDULES
+
+
+def replicate(dfs, copies, sort=False):
+	"""Build a DataFrames with the cases of `dfs` repeated `copies` times."""
+	n = dfs.n_cases
+	order = numpy.tile(numpy.arange(n), copies)
+	if sort:
+		order = order[numpy.argsort(dfs.case_work()[order], kind='stable')]
+	caseids = pandas.Index(numpy.arange(len(order)), name='_caseid_')
+
+	def _rows(df):
+		if df is None:
+			return None
+		out = df.iloc[order].copy()
+		out.index = caseids
+		return out
+
+	ca = dfs.data_ca
+	if ca is not None:
+		n_alts = dfs.n_alts
+		positions = (order[:, None] * n_alts + numpy.arange(n_alts)[None, :]).reshape(-1)
+		ca = ca.iloc[positions].copy()
+		ca.index = pandas.MultiIndex.from_product(
+			[caseids, dfs.alternative_codes()], names=dfs.data_ca.index.names,
+		)
+	return larch.DataFrames(
+		co=_rows(dfs.data_co),
+		ca=ca,
+		av=_rows(dfs.data_av),
+		ch=_rows(dfs.data_ch),
+		wt=_rows(dfs.data_wt),
+		alt_codes=dfs.alternative_codes(),
+		alt_names=dfs.alternative_names(),
+	)
+
+
+def best_time(func, repeat):
+	best = numpy.inf
+	for _ in range(repeat):
+		t0 = time.perf_counter()
+		func()
+		best = min(best, time.perf_counter() - t0)
+	return best
+
+
+def main(args=None):
+	parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+	parser.add_argument('--example', type=int, default=1, help='number of the larch example model')
+	parser.add_argument('--replicate', type=int, default=20, help='copies of the example data')
+	parser.add_argument('--threads', default='1,2,4,8,16,32', help='comma separated thread counts')
+	parser.add_argument('--schedules', default=','.join(SCHEDULES), help='comma separated schedules')
+	parser.add_argument('--chunksize', type=int, default=0)
+	parser.add_argument('--repeat', type=int, default=5)
+	parser.add_argument('--sort', action='store_true', help='order cases by available alternatives')
+	args = parser.parse_args(args)
+
+	m = larch.example(args.example)
+	m.load_data()
+	m.dataframes = replicate(m.dataframes, args.replicate, sort=args.sort)
+	m.chunksize = args.chunksize
+	threads = [int(t) for t in args.threads.split(',')]
+
+	print(f"example {args.example}, {m.n_cases} cases, {len(m.pf)} parameters")
+	print(f"{'schedule':>10} {'threads':>8} {'seconds':>10} {'speedup':>8} {'efficiency':>10}")
+	for schedule in args.schedules.split(','):
+		m.schedule = schedule
+		base = None
+		for n in threads:
+			m.n_threads = n
+			m.loglike2_bhhh()
+			t = best_time(m.loglike2_bhhh, args.repeat)
+			if base is None:
+				base = t
+			print(f"{schedule:>10} {n:>8} {t:>10.4f} {base / t:>8.2f} {base / t * threads[0] / n:>10.2f}")
+
+
+if __name__ == '__main__':
+	main()